@@ -6,11 +6,27 @@ A system for extracting structured arrest records from county jail "book-in" PDF
 
 __version__ = "0.1.0"
 
-from arrestx.model import Record, Charge, ParserState
-from arrestx.config import Config, MongoDBConfig, load_config
-from arrestx.parser import parse_pdf, parse_lines
-from arrestx.writers import write_json, write_csv, write_ndjson, write_outputs
-from arrestx.db.mongo import write_mongodb
+import importlib
+from typing import Any, List
+
+# Public names and the submodules that define them. Submodules are imported
+# on first attribute access (PEP 562) so that importing one part of the
+# package does not pull in the PDF and MongoDB stacks.
+_LAZY_ATTRIBUTES = {
+    "Record": "arrestx.model",
+    "Charge": "arrestx.model",
+    "ParserState": "arrestx.model",
+    "Config": "arrestx.config",
+    "MongoDBConfig": "arrestx.config",
+    "load_config": "arrestx.config",
+    "parse_pdf": "arrestx.parser",
+    "parse_lines": "arrestx.parser",
+    "write_json": "arrestx.writers",
+    "write_csv": "arrestx.writers",
+    "write_ndjson": "arrestx.writers",
+    "write_outputs": "arrestx.writers",
+    "write_mongodb": "arrestx.db.mongo",
+}
 
 __all__ = [
     "Record",
@@ -26,4 +42,20 @@ __all__ = [
     "write_ndjson",
     "write_outputs",
     "write_mongodb",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes from their submodules on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,19 +5,117 @@ This module provides an API for searching names in arrest records.
 """
 
 import os
-import re
 import datetime
+import itertools
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union, Any
 
 from arrestx.config import Config
 from arrestx.parser import parse_pdf
 from arrestx.model import Record
-from arrestx.web import process_daily_report
+from arrestx.web import extract_report_date, process_daily_report
 
 logger = logging.getLogger(__name__)
 
+# Parsed report cache: absolute path -> ((mtime_ns, size), parse settings, search records, token index)
+_PARSED_CACHE: Dict[str, Tuple[Tuple[int, int], str, List["_SearchRecord"], Dict[str, Set[int]]]] = {}
+
+# Report date cache: absolute path -> ((mtime_ns, size), report date)
+_REPORT_DATE_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[datetime.date]]] = {}
+
+# Enterprise event templates. to_enterprise_format copies these with
+# _from_template, which also copies their nested dicts and lists, and fills
+# in the per-alert values. Nested values may only hold immutable values.
+_PROVIDER_INFO = {
+    "dataProviderId": "201",  # Texas Extract provider ID
+    "serviceName": "arrestSearch",
+    "searchType": "CRIMINAL"
+}
+
+_NAME_FIELD_TEMPLATE = {
+    "field": None,
+    "fromEventValue": None,
+    "fromIdentityValue": None,
+    "confidence": "1",
+    "methods": ["stringExactMatch"],
+    "salience": None,
+    "match": True,
+    "firstMethod": "stringExactMatch"
+}
+
+_ALIAS_MATCH_TEMPLATE = {
+    "fromIdentityValue": None,
+    "entity": "com.etx.dto.AliasDTO",
+    "fromEventId": None,
+    "fromIdentityId": None,
+    "dtoMatch": True,
+    "matchingMethods": {
+        "firstName": "stringExactMatch",
+        "lastName": "stringExactMatch"
+    },
+    "fields": None,
+    "sources": None
+}
+
+_DTO_TEMPLATE = {
+    "_id": None,
+    "personBio": None,
+    "referenceDtos": None,
+    "bookingDate": None,
+    "bookingNbr": None,
+    "bookingSid": None,
+    "sourceState": "TX",
+    "sourceCounty": "Tarrant",
+    "sourceAddress": "200 Taylor St",
+    "sourceCity": "Fort Worth",
+    "sourceZip": "76102",
+    "sourceDesc": "Tarrant County Sheriff's Office",
+    "offenderId": None,
+    "released": "N",  # Assume not released since it's a booking report
+    "date_created": None,
+    "last_update": None,
+    "source_type": "EXTERNAL",
+    "verification_status": "UNVERIFIED",
+    "sources": None,
+    "_class": "com.etx.scoring.domain.ArrestCharge"
+}
+
+_METADATA_TEMPLATE = {
+    "what": None,
+    "when": None,
+    "where": {
+        "description": "Tarrant County Sheriff's Office",
+        "city": "Fort Worth",
+        "state": "TX",
+        "county": "Tarrant",
+        "country": "USA"
+    },
+    "disposition": "Booking",
+    "severity": "UNKNOWN",
+    "stage": {"started": "Arrest/Booking"},
+    "category": "Criminal",
+    "className": "Criminal",
+    "sources": None
+}
+
+_EVENT_TEMPLATE = {
+    "_id": None,
+    "providerInfo": _PROVIDER_INFO,
+    "personBio": None,
+    "aliasMatch": None,
+    "unmapped": None,
+    "dtoClassName": "com.etx.dto.ArrestChargeDTO",
+    "dto": None,
+    "metadata": None,
+    "recordType": "ACTIVE",
+    "date_created": None,
+    "last_update": None,
+    "source_type": "EXTERNAL",
+    "sources": None,
+    "_class": "com.etx.scoring.domain.CeEventEntity"
+}
+
 
 def send_webhook_callback(result: 'SearchResult', webhook_url: str) -> bool:
     """
@@ -64,9 +162,88 @@ def send_webhook_callback(result: 'SearchResult', webhook_url: str) -> bool:
         logger.error(f"Failed to send webhook to {webhook_url}: {e}")
         return False
 
+def _random_ids(count: int) -> List[str]:
+    """
+    Generate random 15-character uppercase hex IDs from a single entropy draw.
+    
+    Args:
+        count: Number of IDs to generate
+        
+    Returns:
+        List of IDs
+    """
+    buf = os.urandom(8 * count).hex().upper()
+    return [buf[i:i + 15] for i in range(0, 16 * count, 16)]
+
+def _split_display_name(name: str) -> Tuple[str, str, str]:
+    """
+    Split a display name into first, middle and last name.
+    
+    Args:
+        name: Name in "LAST, FIRST MIDDLE" or "First Middle Last" format
+        
+    Returns:
+        Tuple of (first, middle, last); missing parts are empty strings
+    """
+    last, sep, first_middle = name.partition(", ")
+    if sep:
+        parts = first_middle.partition(", ")[0].split()
+        last = last.strip()
+    else:
+        # Handle "First Last" format
+        parts = name.split()
+        if len(parts) < 2:
+            return (parts[0] if parts else "", "", "")
+        last = parts.pop()
+    
+    if not parts:
+        return ("", "", last)
+    return (parts[0], " ".join(parts[1:]), last)
+
+def _from_template(template: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy an enterprise event template for a new event.
+    
+    Nested dicts and lists are copied as well, so callers can modify the
+    returned events without affecting later ones.
+    
+    Args:
+        template: Event template
+        
+    Returns:
+        New dictionary with the template values
+    """
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in template.items()
+    }
+
+def _name_field(field: str, event_value: str, identity_value: str, salience: int) -> Dict[str, Any]:
+    """
+    Build an aliasMatch name field entry for an enterprise event.
+    
+    Args:
+        field: Field name (firstName, lastName or middleName)
+        event_value: Upper-cased name part
+        identity_value: Name part as it appears in the alert
+        salience: Field salience
+        
+    Returns:
+        Name field entry
+    """
+    entry = _from_template(_NAME_FIELD_TEMPLATE)
+    entry["field"] = field
+    entry["fromEventValue"] = event_value
+    entry["fromIdentityValue"] = identity_value
+    entry["salience"] = salience
+    return entry
+
 class Alert:
     """Alert for a name match in arrest records."""
     
+    __slots__ = ("name", "booking_no", "description", "identifier", "book_in_date",
+                 "source", "source_file")
+    
     def __init__(self, name: str, booking_no: str, description: str, 
                  identifier: str, book_in_date: str, source_file: str):
         self.name = name
@@ -92,6 +269,9 @@ class Alert:
 class SearchResult:
     """Result of a name search in arrest records."""
     
+    __slots__ = ("name", "alerts", "records_checked", "last_update", "person_bio",
+                 "organization", "sponsor_id", "webhook_url")
+    
     def __init__(self, name: str, alerts: List[Alert], records_checked: int,
                  last_update: Optional[datetime.date] = None,
                  person_bio: Optional[str] = None,
@@ -140,148 +320,81 @@ class SearchResult:
     
     def to_enterprise_format(self) -> Dict[str, Any]:
         """Convert search result to enterprise event format."""
-        import uuid
         from datetime import datetime
         
-        # Generate unique IDs
-        event_id = f"EVT-{uuid.uuid4().hex[:15].upper()}"
+        # Draw the random IDs for all events at once (5 per alert)
+        ids = iter(_random_ids(5 * len(self.alerts)))
+        
+        # All events in a batch share the same creation timestamp
+        now_iso = datetime.utcnow().isoformat() + "Z"
         
         # Base event structure
         events = []
         
         for alert in self.alerts:
             # Parse name components
-            name_parts = alert.name.split(", ")
-            if len(name_parts) >= 2:
-                last_name = name_parts[0].strip()
-                first_middle = name_parts[1].strip().split()
-                first_name = first_middle[0] if first_middle else ""
-                middle_name = " ".join(first_middle[1:]) if len(first_middle) > 1 else ""
-            else:
-                # Handle "First Last" format
-                name_parts = alert.name.split()
-                first_name = name_parts[0] if name_parts else ""
-                last_name = name_parts[-1] if len(name_parts) > 1 else ""
-                middle_name = " ".join(name_parts[1:-1]) if len(name_parts) > 2 else ""
+            first_name, middle_name, last_name = _split_display_name(alert.name)
+            
+            # Upper-cased event values
+            first_up, last_up, middle_up = first_name.upper(), last_name.upper(), middle_name.upper()
+            
+            event_id = f"EVT-{next(ids)}"
+            
+            # Create enterprise event from the shared templates
+            fields = [
+                _name_field("firstName", first_up, first_name, 2),
+                _name_field("lastName", last_up, last_name, 1),
+            ]
+            if middle_name:
+                fields.append(_name_field("middleName", middle_up, middle_name, 3))
+            
+            alias_match = _from_template(_ALIAS_MATCH_TEMPLATE)
+            alias_match["fromIdentityValue"] = self.name
+            alias_match["fromEventId"] = f"ALS-{next(ids)}"
+            alias_match["fromIdentityId"] = f"ALS-{next(ids)}"
+            alias_match["fields"] = fields
+            alias_match["sources"] = []
             
-            # Create enterprise event
-            event = {
-                "_id": f"EVT-{uuid.uuid4().hex[:15].upper()}",
-                "providerInfo": {
-                    "dataProviderId": "201",  # Texas Extract provider ID
-                    "serviceName": "arrestSearch",
-                    "searchType": "CRIMINAL"
-                },
-                "personBio": {"$ref": "person_bio", "$id": self.person_bio} if self.person_bio else None,
-                "aliasMatch": {
-                    "fromIdentityValue": self.name,
-                    "entity": "com.etx.dto.AliasDTO",
-                    "fromEventId": f"ALS-{uuid.uuid4().hex[:15].upper()}",
-                    "fromIdentityId": f"ALS-{uuid.uuid4().hex[:15].upper()}",
-                    "dtoMatch": True,
-                    "matchingMethods": {
-                        "firstName": "stringExactMatch",
-                        "lastName": "stringExactMatch"
-                    },
-                    "fields": [
-                        {
-                            "field": "firstName",
-                            "fromEventValue": first_name.upper(),
-                            "fromIdentityValue": first_name,
-                            "confidence": "1",
-                            "methods": ["stringExactMatch"],
-                            "salience": 2,
-                            "match": True,
-                            "firstMethod": "stringExactMatch"
-                        },
-                        {
-                            "field": "lastName",
-                            "fromEventValue": last_name.upper(),
-                            "fromIdentityValue": last_name,
-                            "confidence": "1",
-                            "methods": ["stringExactMatch"],
-                            "salience": 1,
-                            "match": True,
-                            "firstMethod": "stringExactMatch"
-                        }
-                    ] + ([{
-                        "field": "middleName",
-                        "fromEventValue": middle_name.upper(),
-                        "fromIdentityValue": middle_name,
-                        "confidence": "1",
-                        "methods": ["stringExactMatch"],
-                        "salience": 3,
-                        "match": True,
-                        "firstMethod": "stringExactMatch"
-                    }] if middle_name else []),
-                    "sources": []
-                },
-                "unmapped": {
-                    "type": "BOOKING",
-                    "inmateNbr": alert.identifier,
-                    "bookingNo": alert.booking_no
-                },
-                "dtoClassName": "com.etx.dto.ArrestChargeDTO",
-                "dto": {
-                    "_id": f"ARS-{uuid.uuid4().hex[:15].upper()}",
-                    "personBio": {"$ref": "person_bio", "$id": self.person_bio} if self.person_bio else None,
-                    "referenceDtos": [
-                        {
-                            "dtoId": f"ALS-{uuid.uuid4().hex[:15].upper()}",
-                            "dtoName": "com.etx.dto.AliasDTO"
-                        }
-                    ],
-                    "bookingDate": f"{alert.book_in_date} 00:00:00" if alert.book_in_date else None,
-                    "bookingNbr": alert.booking_no,
-                    "bookingSid": alert.identifier,
-                    "sourceState": "TX",
-                    "sourceCounty": "Tarrant",
-                    "sourceAddress": "200 Taylor St",
-                    "sourceCity": "Fort Worth",
-                    "sourceZip": "76102",
-                    "sourceDesc": "Tarrant County Sheriff's Office",
-                    "offenderId": alert.identifier,
-                    "released": "N",  # Assume not released since it's a booking report
-                    "date_created": datetime.utcnow().isoformat() + "Z",
-                    "last_update": datetime.utcnow().isoformat() + "Z",
-                    "source_type": "EXTERNAL",
-                    "verification_status": "UNVERIFIED",
-                    "sources": ["Tarrant County Sheriff's Office"],
-                    "_class": "com.etx.scoring.domain.ArrestCharge"
-                },
-                "metadata": {
-                    "what": alert.description,
-                    "when": {
-                        "sortable": int(alert.book_in_date.replace("-", "")) if alert.book_in_date else None,
-                        "data": alert.book_in_date
-                    },
-                    "where": {
-                        "description": "Tarrant County Sheriff's Office",
-                        "city": "Fort Worth",
-                        "state": "TX",
-                        "county": "Tarrant",
-                        "country": "USA"
-                    },
-                    "disposition": "Booking",
-                    "severity": "UNKNOWN",
-                    "stage": {"started": "Arrest/Booking"},
-                    "category": "Criminal",
-                    "className": "Criminal",
-                    "sources": []
-                },
-                "recordType": "ACTIVE",
-                "date_created": datetime.utcnow().isoformat() + "Z",
-                "last_update": datetime.utcnow().isoformat() + "Z",
-                "source_type": "EXTERNAL",
-                "sources": [],
-                "_class": "com.etx.scoring.domain.CeEventEntity"
+            dto = _from_template(_DTO_TEMPLATE)
+            dto["_id"] = f"ARS-{next(ids)}"
+            dto["referenceDtos"] = [{"dtoId": f"ALS-{next(ids)}", "dtoName": "com.etx.dto.AliasDTO"}]
+            dto["bookingDate"] = f"{alert.book_in_date} 00:00:00" if alert.book_in_date else None
+            dto["bookingNbr"] = alert.booking_no
+            dto["bookingSid"] = alert.identifier
+            dto["offenderId"] = alert.identifier
+            dto["date_created"] = now_iso
+            dto["last_update"] = now_iso
+            dto["sources"] = ["Tarrant County Sheriff's Office"]
+            
+            metadata = _from_template(_METADATA_TEMPLATE)
+            metadata["what"] = alert.description
+            metadata["when"] = {
+                "sortable": int(alert.book_in_date.replace("-", "")) if alert.book_in_date else None,
+                "data": alert.book_in_date
+            }
+            metadata["sources"] = []
+            
+            event = _from_template(_EVENT_TEMPLATE)
+            event["_id"] = event_id
+            event["aliasMatch"] = alias_match
+            event["unmapped"] = {
+                "type": "BOOKING",
+                "inmateNbr": alert.identifier,
+                "bookingNo": alert.booking_no
             }
+            event["dto"] = dto
+            event["metadata"] = metadata
+            event["date_created"] = now_iso
+            event["last_update"] = now_iso
+            event["sources"] = []
             
-            # Remove None values from personBio if not provided
-            if not self.person_bio:
+            # Only include personBio references if provided
+            if self.person_bio:
+                event["personBio"] = {"$ref": "person_bio", "$id": self.person_bio}
+                dto["personBio"] = {"$ref": "person_bio", "$id": self.person_bio}
+            else:
                 event.pop("personBio", None)
-                if event["dto"]:
-                    event["dto"].pop("personBio", None)
+                dto.pop("personBio", None)
             
             events.append(event)
         
@@ -317,14 +430,36 @@ def normalize_name(name: str) -> str:
     """
     # Handle "Last, First Middle" format
     if "," in name:
-        parts = name.split(",", 1)
-        last = parts[0].strip()
-        first_middle = parts[1].strip()
-        name = f"{first_middle} {last}"
+        last, _, first_middle = name.partition(",")
+        name = first_middle.strip() + " " + last.strip()
+    
+    # Report names are normally single-spaced, so only collapse whitespace
+    # when there is a double space or a non-space whitespace character
+    if "  " in name or not name.isprintable():
+        name = " ".join(name.split())
+    else:
+        name = name.strip()
+    
+    return name.lower()
+
+def name_matches_tokens(record_parts: FrozenSet[str], search_first: str, search_last: str) -> bool:
+    """
+    Check if a pre-split record name matches pre-split search name tokens.
+    
+    Args:
+        record_parts: Set of normalized tokens from the record name
+        search_first: First token of the normalized search name
+        search_last: Last token of the normalized search name (same as
+            search_first for single-name searches)
+        
+    Returns:
+        True if names match, False otherwise
+    """
+    # An empty search only matches an empty record name
+    if not search_first:
+        return not record_parts
     
-    # Remove extra whitespace and convert to lowercase
-    name = re.sub(r'\s+', ' ', name).strip().lower()
-    return name
+    return search_first in record_parts and search_last in record_parts
 
 def name_matches(record_name: str, search_name: str) -> bool:
     """
@@ -337,33 +472,89 @@ def name_matches(record_name: str, search_name: str) -> bool:
     Returns:
         True if names match, False otherwise
     """
-    record_name_norm = normalize_name(record_name)
-    search_name_norm = normalize_name(search_name)
+    search_parts = normalize_name(search_name).split()
+    search_first = search_parts[0] if search_parts else ""
+    search_last = search_parts[-1] if search_parts else ""
     
-    # Check for exact match
-    if record_name_norm == search_name_norm:
-        return True
+    # Most records don't match: a last-name token that isn't even a substring
+    # of the raw record name can't be one of its tokens, so skip normalizing it
+    if search_last and search_last not in record_name.lower():
+        return False
+    
+    record_parts = frozenset(normalize_name(record_name).split())
+    
+    return name_matches_tokens(record_parts, search_first, search_last)
+
+class _SearchRecord:
+    """
+    Compact copy of the fields of a record that name searches use.
+    
+    Parsed reports stay cached between searches, and a slotted object with
+    charges as tuples takes a fraction of the memory of the record dict
+    with its address lines, warnings and nested charge dicts.
+    """
     
-    # Check if search name is a subset of record name
-    search_parts = search_name_norm.split()
-    record_parts = record_name_norm.split()
+    __slots__ = ("name", "name_parts", "identifier", "book_in_date", "source_file", "charges")
+    
+    def __init__(self, record: Record):
+        self.name = record["name"]
+        # Use name_normalized for matching, but keep original name in alert
+        self.name_parts: FrozenSet[str] = frozenset(
+            normalize_name(record.get("name_normalized", record["name"])).split()
+        )
+        self.identifier = record.get("identifier", "")
+        self.book_in_date = record.get("book_in_date", "")
+        self.source_file = record["source_file"]
+        # (booking_no, description) of each charge
+        self.charges: Tuple[Tuple[str, str], ...] = tuple(
+            (charge["booking_no"], charge["description"]) for charge in record["charges"]
+        )
+
+def _file_stamp(path: Union[str, Path]) -> Tuple[str, Tuple[int, int]]:
+    """
+    Get a cache key and change stamp for a file.
     
-    # If search has both first and last name, check if they're in the record
-    if len(search_parts) >= 2:
-        first_name = search_parts[0]
-        last_name = search_parts[-1]
+    Args:
+        path: Path to the file
         
-        if first_name in record_parts and last_name in record_parts:
-            return True
+    Returns:
+        Tuple of (absolute path, (mtime_ns, size))
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    return key, (st.st_mtime_ns, st.st_size)
+
+def _report_date(path: Union[str, Path]) -> Optional[datetime.date]:
+    """
+    Get the date of a report, reusing the previous result if the file is unchanged.
     
-    # Check if the search name is just a single name (first or last)
-    # that matches any part of the record name
-    if len(search_parts) == 1:
-        search_term = search_parts[0]
-        if search_term in record_parts:
-            return True
+    Args:
+        path: Path to the report PDF
+        
+    Returns:
+        Date of the report, or None if not found
+    """
+    key, stamp = _file_stamp(path)
+    cached = _REPORT_DATE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    report_date = None
+    
+    # Extract date from the report
+    date_str = extract_report_date(str(path))
+    if date_str:
+        try:
+            report_date = datetime.date.fromisoformat(date_str)
+        except ValueError:
+            pass
     
-    return False
+    # Fallback to file modification time
+    if report_date is None:
+        report_date = datetime.date.fromtimestamp(stamp[0] / 1e9)
+    
+    _REPORT_DATE_CACHE[key] = (stamp, report_date)
+    return report_date
 
 def get_current_report_date() -> Optional[datetime.date]:
     """
@@ -372,25 +563,39 @@ def get_current_report_date() -> Optional[datetime.date]:
     Returns:
         Date of the current report, or None if not found
     """
-    from arrestx.web import extract_report_date
-    
     report_path = Path("reports/01.PDF")
     if not report_path.exists():
         return None
     
-    # Extract date from the current report
-    date_str = extract_report_date(str(report_path))
-    if date_str:
-        try:
-            return datetime.date.fromisoformat(date_str)
-        except ValueError:
-            pass
+    try:
+        return _report_date(report_path)
+    except OSError:
+        return None
+
+def _archive_file_date(filename: str) -> Optional[datetime.date]:
+    """
+    Extract the report date from an archived report filename.
+    
+    Archived reports are named like "01_2025-10-15.PDF" (see web.backup_file).
+    
+    Args:
+        filename: Archived report filename
+        
+    Returns:
+        Report date, or None if the filename does not carry a valid date
+    """
+    if len(filename) < 15 or filename[-15] != "_" or not filename.upper().endswith(".PDF"):
+        return None
+    
+    # YYYY-MM-DD between the underscore and the extension
+    date_str = filename[-14:-4]
+    if not (date_str[:4].isdigit() and date_str[4] == "-" and date_str[5:7].isdigit()
+            and date_str[7] == "-" and date_str[8:].isdigit()):
+        return None
     
-    # Fallback to file modification time
     try:
-        file_mtime = report_path.stat().st_mtime
-        return datetime.date.fromtimestamp(file_mtime)
-    except Exception:
+        return datetime.date.fromisoformat(date_str)
+    except ValueError:
         return None
 
 def get_latest_report_date() -> Optional[datetime.date]:
@@ -408,18 +613,12 @@ def get_latest_report_date() -> Optional[datetime.date]:
     latest_archived_date = None
     
     if archive_dir.exists():
-        date_pattern = re.compile(r'.*_(\d{4}-\d{2}-\d{2})\.PDF$', re.IGNORECASE)
-        
-        for file in archive_dir.glob("*.PDF"):
-            match = date_pattern.match(str(file.name))
-            if match:
-                date_str = match.group(1)
-                try:
-                    file_date = datetime.date.fromisoformat(date_str)
-                    if latest_archived_date is None or file_date > latest_archived_date:
-                        latest_archived_date = file_date
-                except ValueError:
-                    continue
+        with os.scandir(archive_dir) as entries:
+            for entry in entries:
+                file_date = _archive_file_date(entry.name)
+                if file_date and entry.is_file() and (
+                        latest_archived_date is None or file_date > latest_archived_date):
+                    latest_archived_date = file_date
     
     # Return the most recent date
     if current_date and latest_archived_date:
@@ -478,9 +677,116 @@ def ensure_current_report(cfg: Config) -> bool:
         logger.error(f"Failed to update report: {result.get('message', 'Unknown error')}")
         return False
 
+def _build_token_index(records: List[_SearchRecord]) -> Dict[str, Set[int]]:
+    """
+    Build an inverted index from normalized name tokens to record positions.
+    
+    Records without any name tokens are indexed under the empty string so
+    that an empty search still finds them.
+    
+    Args:
+        records: Search records
+        
+    Returns:
+        Mapping of token to the set of indices of records containing it
+    """
+    index: Dict[str, Set[int]] = {}
+    for i, record in enumerate(records):
+        for token in record.name_parts or ("",):
+            index.setdefault(token, set()).add(i)
+    return index
+
+def _parse_settings(cfg: Config) -> str:
+    """
+    Get a fingerprint of the settings that change how PDF files are parsed.
+    
+    Args:
+        cfg: Configuration
+        
+    Returns:
+        String identifying the parsing and OCR settings
+    """
+    return repr((cfg.input.ocr_fallback, cfg.input.ocr_lang, cfg.parsing))
+
+def _parse_pdf_cached(path: Union[str, Path], cfg: Config) -> Tuple[List[_SearchRecord], Dict[str, Set[int]]]:
+    """
+    Parse a PDF file, reusing the previous result if the file and the parse
+    settings are unchanged.
+    
+    Args:
+        path: Path to the PDF file
+        cfg: Configuration
+        
+    Returns:
+        Tuple of (search records, token index)
+    """
+    key, stamp = _file_stamp(path)
+    settings = _parse_settings(cfg)
+    
+    cached = _PARSED_CACHE.get(key)
+    if cached is not None and cached[0] == stamp and cached[1] == settings:
+        logger.debug(f"Using cached records for {path}")
+        return cached[2], cached[3]
+    
+    records = [_SearchRecord(record) for record in parse_pdf(str(path), cfg)]
+    index = _build_token_index(records)
+    
+    _PARSED_CACHE[key] = (stamp, settings, records, index)
+    return records, index
+
+def _load_report(path: Union[str, Path], cfg: Config) -> Tuple[List[_SearchRecord], Dict[str, Set[int]], Optional[datetime.date]]:
+    """
+    Load the records and date of a report, each computed at most once per file version.
+    
+    Args:
+        path: Path to the report PDF
+        cfg: Configuration
+        
+    Returns:
+        Tuple of (search records, token index, report date)
+    """
+    records, index = _parse_pdf_cached(path, cfg)
+    return records, index, _report_date(path)
+
+def _iter_alerts(records: List[_SearchRecord], index: Dict[str, Set[int]], name: str) -> Iterator[Alert]:
+    """
+    Yield an alert for each charge of each record matching a name.
+    
+    Args:
+        records: Search records
+        index: Token index built from the records
+        name: Name to search for
+        
+    Yields:
+        Alerts in report order
+    """
+    # Normalize the search name once rather than once per record
+    search_parts = normalize_name(name).split()
+    search_first = search_parts[0] if search_parts else ""
+    search_last = search_parts[-1] if search_parts else ""
+    
+    # Only records containing both the first and last search tokens can match
+    candidate_ids = index.get(search_first, set()) & index.get(search_last, set())
+    
+    # Search for the name in the candidate records, in report order
+    for i in sorted(candidate_ids):
+        record = records[i]
+        if name_matches_tokens(record.name_parts, search_first, search_last):
+            # Create an alert for each charge
+            for booking_no, description in record.charges:
+                yield Alert(
+                    name=record.name,  # Keep original format for display
+                    booking_no=booking_no,
+                    description=description,
+                    identifier=record.identifier,
+                    book_in_date=record.book_in_date,
+                    source_file=record.source_file
+                )
+
 def search_name(name: str, cfg: Config, force_update: bool = False,
                 person_bio: Optional[str] = None, organization: Optional[str] = None,
-                sponsor_id: Optional[str] = None, webhook_url: Optional[str] = None) -> SearchResult:
+                sponsor_id: Optional[str] = None, webhook_url: Optional[str] = None,
+                max_results: Optional[int] = None) -> SearchResult:
     """
     Search for a name in arrest records.
     
@@ -492,6 +798,8 @@ def search_name(name: str, cfg: Config, force_update: bool = False,
         organization: Optional organization identifier for correlation
         sponsor_id: Optional sponsor identifier
         webhook_url: Optional webhook URL for callback
+        max_results: Optional limit on the number of alerts to collect
+            (e.g. 1 for an existence check)
         
     Returns:
         Search result
@@ -500,35 +808,17 @@ def search_name(name: str, cfg: Config, force_update: bool = False,
     if force_update or not is_report_current():
         ensure_current_report(cfg)
     
-    # Get the current report date
-    current_date = get_current_report_date()
-    
     # Get the path to the current report
     report_path = Path("reports/01.PDF")
     if not report_path.exists():
         logger.error(f"Report not found: {report_path}")
-        return SearchResult(name, [], 0, current_date, person_bio, organization, sponsor_id, webhook_url)
+        return SearchResult(name, [], 0, None, person_bio, organization, sponsor_id, webhook_url)
     
-    # Parse the report
-    records = parse_pdf(str(report_path), cfg)
+    # Parse the report and get its date (cached until the file changes)
+    records, index, current_date = _load_report(report_path, cfg)
     
-    # Search for the name in the records
-    alerts = []
-    for record in records:
-        # Use name_normalized for matching, but keep original name in alert
-        search_name = record.get("name_normalized", record["name"])
-        if name_matches(search_name, name):
-            # Create an alert for each charge
-            for charge in record["charges"]:
-                alert = Alert(
-                    name=record["name"],  # Keep original format for display
-                    booking_no=charge["booking_no"],
-                    description=charge["description"],
-                    identifier=record.get("identifier", ""),
-                    book_in_date=record.get("book_in_date", ""),
-                    source_file=record["source_file"]
-                )
-                alerts.append(alert)
+    # Collect alerts, stopping early if the caller only needs a few
+    alerts = list(itertools.islice(_iter_alerts(records, index, name), max_results))
     
     # Create the search result
     result = SearchResult(name, alerts, len(records), current_date, person_bio, organization, sponsor_id, webhook_url)
@@ -3,36 +3,150 @@ Command-line interface for Texas Extract.
 """
 
 import argparse
+import fnmatch
+import glob
 import json
 import logging
+import os
 import sys
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from arrestx.config import load_config
-from arrestx.parser import parse_pdf
-from arrestx.writers import write_outputs
-from arrestx.web import process_daily_report, extract_report_date, backup_file
-from arrestx.api import search_name
+from arrestx.config import Config, load_config, worker_config
+from arrestx.model import Record
 
 logger = logging.getLogger(__name__)
 
+# Logging level names accepted by setup_logging
+_LEVELS = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Whether setup_logging has already configured the root logger
+_CONFIGURED = False
+
 def setup_logging(level: str) -> None:
     """
     Set up logging.
     
+    Only the first call configures the root logger; later calls just
+    validate the level.
+    
     Args:
         level: Logging level
     """
-    numeric_level = getattr(logging, level.upper(), None)
-    if not isinstance(numeric_level, int):
+    global _CONFIGURED
+    
+    numeric_level = _LEVELS.get(level.upper())
+    if numeric_level is None:
         raise ValueError(f"Invalid log level: {level}")
     
+    if _CONFIGURED:
+        return
+    
     logging.basicConfig(
         level=numeric_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+    _CONFIGURED = True
+
+def print_json(obj: Any) -> None:
+    """
+    Write an object to stdout as indented JSON.
+    
+    Uses orjson when it is installed and streams with the standard library
+    json module otherwise.
+    
+    Args:
+        obj: Object to serialize
+    """
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+def find_input_files(patterns: List[str]) -> List[str]:
+    """
+    Expand input paths/globs into a list of existing files.
+    
+    Patterns with a literal directory and a wildcard file name (e.g.
+    ``./reports/*.pdf``) are matched with a single directory scan; anything
+    else is expanded with ``glob.iglob``.
+    
+    Args:
+        patterns: Input file paths or glob patterns
+        
+    Returns:
+        List of matching file paths
+    """
+    input_files = []
+    for pattern in patterns:
+        directory, name_pattern = os.path.split(pattern)
+        if glob.has_magic(name_pattern) and not glob.has_magic(directory) and "**" not in name_pattern:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    input_files.extend(
+                        os.path.join(directory, entry.name)
+                        for entry in entries
+                        if fnmatch.fnmatch(entry.name, name_pattern)
+                        and (name_pattern.startswith(".") or not entry.name.startswith("."))
+                        and entry.is_file()
+                    )
+            except OSError:
+                continue
+        else:
+            input_files.extend(
+                path for path in glob.iglob(pattern, recursive=True) if os.path.isfile(path)
+            )
+    return input_files
+
+def parse_files(input_files: List[str], config: Config) -> Iterator[Record]:
+    """
+    Parse input files and yield their records in file order.
+    
+    Multiple files are parsed in worker processes when
+    ``performance.parallel_files`` is enabled. Page-level parallelism is
+    turned off inside the workers so the pools do not nest.
+    
+    Args:
+        input_files: Paths of the files to parse
+        config: Application configuration
+        
+    Yields:
+        Parsed records
+    """
+    from arrestx.parser import parse_pdf
+    
+    workers = min(config.performance.max_workers, os.cpu_count() or 1, len(input_files))
+    if not config.performance.parallel_files or workers < 2:
+        for file in input_files:
+            logger.info(f"Processing {file}")
+            yield from parse_pdf(file, config)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    worker_cfg = worker_config(config)
+    logger.info(f"Processing {len(input_files)} files with {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for records in executor.map(parse_pdf, input_files, [worker_cfg] * len(input_files)):
+            yield from records
 
 def process_command(args: argparse.Namespace) -> int:
     """
@@ -52,6 +166,8 @@ def process_command(args: argparse.Namespace) -> int:
     
     # Process command
     if args.command == "fetch":
+        from arrestx.web import process_daily_report
+
         result = process_daily_report(args.url, config, args.skip_if_existing)
         if result["status"] == "success":
             logger.info(f"Successfully processed report: {result.get('record_count', 0)} records")
@@ -64,6 +180,8 @@ def process_command(args: argparse.Namespace) -> int:
             logger.error("Date is required for backup command")
             return 1
         
+        from arrestx.web import backup_file
+
         backup_path = backup_file(args.file, args.date)
         if backup_path:
             logger.info(f"Created backup: {backup_path}")
@@ -73,6 +191,8 @@ def process_command(args: argparse.Namespace) -> int:
             return 1
     elif args.command == "search":
         # Search for a name in arrest records
+        from arrestx.api import search_name
+
         result = search_name(
             args.name,
             config,
@@ -84,10 +204,10 @@ def process_command(args: argparse.Namespace) -> int:
         # Print the result
         if args.enterprise:
             # Output in enterprise event format
-            print(json.dumps(result.to_enterprise_format(), indent=2))
+            print_json(result.to_enterprise_format())
         elif args.json:
             # Output as JSON
-            print(json.dumps(result.to_dict(), indent=2))
+            print_json(result.to_dict())
         else:
             # Output as text
             if result.alerts:
@@ -107,36 +227,27 @@ def process_command(args: argparse.Namespace) -> int:
         return 0
     else:
         # Default command (process files)
+        from arrestx.writers import write_outputs
+
         # Get input files
-        input_files = []
-        for path_pattern in args.input or config.input.paths:
-            for path in Path().glob(path_pattern):
-                if path.is_file():
-                    input_files.append(str(path))
+        input_files = find_input_files(args.input or config.input.paths)
         
         if not input_files:
             logger.error("No input files found")
             return 1
         
-        # Process each file
-        all_records = []
-        for file in input_files:
-            logger.info(f"Processing {file}")
-            records = parse_pdf(file, config)
-            all_records.extend(records)
-        
         # Write outputs
-        write_outputs(all_records, config)
+        record_count = write_outputs(parse_files(input_files, config), config)
         
-        logger.info(f"Processed {len(input_files)} files, extracted {len(all_records)} records")
+        logger.info(f"Processed {len(input_files)} files, extracted {record_count} records")
         return 0
 
-def main() -> int:
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main entry point.
+    Build the command-line argument parser.
     
     Returns:
-        Exit code
+        Argument parser
     """
     parser = argparse.ArgumentParser(description="Texas Extract")
     parser.add_argument("--config", default="config.yaml", help="Path to configuration file")
@@ -172,7 +283,53 @@ def main() -> int:
     search_parser.add_argument("--person-bio", help="Optional person bio identifier for correlation")
     search_parser.add_argument("--organization", help="Optional organization identifier for correlation")
     
-    args = parser.parse_args()
+    return parser
+
+def parse_search_fast_path(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the common ``search NAME [--json]`` invocation without argparse.
+    
+    Args:
+        argv: Command-line arguments (without the program name)
+        
+    Returns:
+        Parsed arguments, or None if the invocation needs the full parser
+    """
+    if len(argv) < 2 or argv[0] != "search":
+        return None
+    
+    name, *options = argv[1:]
+    if name.startswith("-") or options not in ([], ["--json"]):
+        return None
+    
+    return argparse.Namespace(
+        config="config.yaml",
+        log_level=None,
+        command="search",
+        input=None,
+        json=bool(options),
+        csv=None,
+        ndjson=None,
+        ocr_fallback=False,
+        redact_address=False,
+        hash_id=False,
+        name=name,
+        force_update=False,
+        enterprise=False,
+        person_bio=None,
+        organization=None,
+    )
+
+def main() -> int:
+    """
+    Main entry point.
+    
+    Returns:
+        Exit code
+    """
+    args = parse_search_fast_path(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
     
     try:
         return process_command(args)
@@ -181,4 +338,4 @@ def main() -> int:
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -2,13 +2,17 @@
 Configuration module for Texas Extract.
 """
 
+import functools
 import os
+import re
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, TypeVar, Union, get_args
 
-import yaml
 from pydantic import BaseModel, Field
 
+# pydantic 2 renamed the model methods used here; pydantic 1 is still supported
+_PYDANTIC_V2 = hasattr(BaseModel, "model_construct")
+
 
 class InputConfig(BaseModel):
     """
@@ -20,6 +24,22 @@ class InputConfig(BaseModel):
     ocr_lang: str = "eng"  # OCR language
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_header_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Fuse header/footer patterns into a single case-insensitive regex.
+    
+    Args:
+        patterns: Header/footer regex patterns
+        
+    Returns:
+        Compiled regex matching any of the patterns
+    """
+    if not patterns:
+        return re.compile(r"(?!)")  # Never matches
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
 class ParsingConfig(BaseModel):
     """
     Configuration for parsing.
@@ -70,6 +90,11 @@ class ParsingConfig(BaseModel):
         r"^Page\s+\d+.*",
     ]
 
+    @property
+    def header_regex(self) -> "re.Pattern[str]":
+        """Compiled regex matching any of the header/footer patterns."""
+        return _compile_header_patterns(tuple(self.header_patterns))
+
 
 class OutputConfig(BaseModel):
     """
@@ -97,6 +122,8 @@ class PerformanceConfig(BaseModel):
     """
 
     parallel_pages: bool = True  # Process pages in parallel
+    parallel_files: bool = True  # Parse multiple input files in parallel
+    max_workers: int = 4  # Maximum worker processes for parallel page extraction
 
 
 class MongoDBConfig(BaseModel):
@@ -109,6 +136,7 @@ class MongoDBConfig(BaseModel):
     database: str = "arrest_records"  # Database name
     collection: str = "arrest_records"  # Collection name
     tenant: str = "DEFAULT"  # Multi-tenant identifier
+    key_hash: Literal["sha256", "blake2b"] = "sha256"  # Name hash used in IDs of records without an identifier
 
 
 class WebRetrievalConfig(BaseModel):
@@ -136,30 +164,140 @@ class Config(BaseModel):
     web_retrieval: Optional[WebRetrievalConfig] = None  # Web retrieval config (optional)
 
 
-def load_config(path: Optional[str] = None) -> Config:
+def worker_config(cfg: Config) -> Config:
+    """
+    Copy a configuration for worker processes that each parse whole files.
+    
+    Page-level parallelism is turned off in the copy so the process pools
+    do not nest.
+    
+    Args:
+        cfg: Configuration
+        
+    Returns:
+        Configuration copy for the workers
+    """
+    if _PYDANTIC_V2:
+        return cfg.model_copy(update={
+            "performance": cfg.performance.model_copy(update={"parallel_pages": False})
+        })
+    return cfg.copy(update={
+        "performance": cfg.performance.copy(update={"parallel_pages": False})
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config() -> Config:
+    """
+    Build the default configuration once per process.
+
+    Returns:
+        Configuration object with default values
+    """
+    return Config()
+
+
+def _model_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    """
+    Find the pydantic model class in a field annotation.
+    
+    Args:
+        annotation: Field annotation, e.g. ``InputConfig`` or ``Optional[MongoDBConfig]``
+        
+    Returns:
+        Model class, or None if the annotation is not a model
+    """
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _construct(model: Type[_M], data: Dict[str, Any]) -> _M:
+    """
+    Build a model and its nested models from trusted data without validation.
+    
+    Args:
+        model: Model class to build
+        data: Field values
+        
+    Returns:
+        Model instance
+    """
+    fields: Dict[str, Any] = getattr(model, "model_fields" if _PYDANTIC_V2 else "__fields__")
+    values = {}
+    for name, value in data.items():
+        field = fields.get(name)
+        if field is not None and isinstance(value, dict):
+            sub_model = _model_type(field.annotation if _PYDANTIC_V2 else field.outer_type_)
+            if sub_model is not None:
+                value = _construct(sub_model, value)
+        values[name] = value
+    return model.model_construct(**values) if _PYDANTIC_V2 else model.construct(**values)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_file(path: str, stamp: Tuple[int, int], validate: bool = True) -> Config:
+    """
+    Load and validate a configuration file.
+
+    Results are cached on the file path and its (mtime_ns, size) stamp, so an
+    unchanged file is only read and validated once per process.
+
+    Args:
+        path: Absolute path to the configuration file
+        stamp: (mtime_ns, size) of the file, used as part of the cache key
+        validate: Whether to validate the configuration values
+
+    Returns:
+        Configuration object
+    """
+    with open(path, "rb") as f:
+        if path.endswith(".yaml") or path.endswith(".yml"):
+            import yaml
+
+            # Prefer the libyaml C loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            config_dict = yaml.load(f.read(), Loader=loader)
+        elif path.endswith(".json"):
+            import json
+
+            config_dict = json.load(f)
+        else:
+            raise ValueError(f"Unsupported configuration file format: {path}")
+
+    # Create configuration object
+    if not validate:
+        return _construct(Config, config_dict)
+    return Config(**config_dict)
+
+
+def load_config(path: Optional[str] = None, validate: Optional[bool] = None) -> Config:
     """
     Load configuration from a file.
     
+    The returned configuration may be shared between callers and must be
+    treated as read-only.
+
     Args:
         path: Path to the configuration file
+        validate: Whether to validate the configuration values. Defaults to
+            True unless the TRUSTED_CONFIG environment variable is set to 1.
         
     Returns:
         Configuration object
     """
+    if validate is None:
+        validate = os.environ.get("TRUSTED_CONFIG") != "1"
+    
     if path:
-        # Load configuration from file
-        with open(path, "r") as f:
-            if path.endswith(".yaml") or path.endswith(".yml"):
-                config_dict = yaml.safe_load(f)
-            elif path.endswith(".json"):
-                import json
-
-                config_dict = json.load(f)
-            else:
-                raise ValueError(f"Unsupported configuration file format: {path}")
-
-        # Create configuration object
-        return Config(**config_dict)
+        # Load configuration from file, reusing the cached result if unchanged
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        return _load_config_file(path, (st.st_mtime_ns, st.st_size), validate)
     else:
         # Try to load from default locations
         default_locations = [
@@ -171,7 +309,7 @@ def load_config(path: Optional[str] = None) -> Config:
 
         for loc in default_locations:
             if os.path.exists(loc):
-                return load_config(loc)
+                return load_config(loc, validate)
 
         # Return default configuration
-        return Config()
\ No newline at end of file
+        return _default_config()
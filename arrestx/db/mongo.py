@@ -2,9 +2,11 @@
 MongoDB integration for Texas Extract.
 """
 
+import atexit
 import datetime
 import hashlib
-from typing import Dict, List, Optional
+import itertools
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from arrestx.config import Config, MongoDBConfig
 from arrestx.log import get_logger
@@ -19,11 +21,103 @@ except ImportError:
     logger.warning("pymongo not installed. MongoDB integration will not be available.")
     MONGODB_AVAILABLE = False
 
+# Maximum number of operations sent in a single bulk_write call
+_BULK_BATCH_SIZE = 1000
+
+# Top-level document fields copied verbatim into each upsert's $set
+_SET_FIELDS = ("_tenant", "name", "name_normalized", "address", "identifier", "book_in_date", "quality")
+
+# MongoClient instances keyed by URI; clients are thread-safe and long-lived
+_CLIENTS: Dict[str, "pymongo.MongoClient"] = {}
+
+
+def _get_client(uri: str) -> "pymongo.MongoClient":
+    """
+    Get a shared MongoDB client for a URI, creating it on first use.
+    
+    Args:
+        uri: MongoDB connection URI
+        
+    Returns:
+        MongoDB client
+    """
+    client = _CLIENTS.get(uri)
+    if client is None:
+        client = _CLIENTS[uri] = pymongo.MongoClient(uri, retryWrites=True)
+    return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close all shared MongoDB clients."""
+    while _CLIENTS:
+        _, client = _CLIENTS.popitem()
+        client.close()
+
+
+# Schema validator for the arrest_records collection
+_ARREST_RECORDS_VALIDATOR = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["_tenant", "name", "book_in_date", "charges", "source"],
+        "properties": {
+            "_tenant": { "bsonType": "string", "minLength": 1 },
+            "name": { "bsonType": "string", "minLength": 1 },
+            "name_normalized": { "bsonType": "string" },
+            "address": {
+                "bsonType": "array",
+                "items": { "bsonType": "string" }
+            },
+            "identifier": { "bsonType": ["string", "null"], "pattern": "^[0-9]{5,8}$" },
+            "book_in_date": { "bsonType": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$" },
+            "charges": {
+                "bsonType": "array",
+                "minItems": 0,
+                "items": {
+                    "bsonType": "object",
+                    "required": ["booking_no", "description"],
+                    "properties": {
+                        "booking_no": { "bsonType": "string", "pattern": "^[0-9]{2}-[0-9]{6,7}$" },
+                        "description": { "bsonType": "string", "minLength": 1 }
+                    }
+                }
+            },
+            "source": {
+                "bsonType": "object",
+                "required": ["file", "ingested_at"],
+                "properties": {
+                    "file": { "bsonType": "string" },
+                    "page_span": {
+                        "bsonType": "array",
+                        "items": { "bsonType": "int" },
+                        "minItems": 2, "maxItems": 2
+                    },
+                    "ingested_at": { "bsonType": "date" },
+                    "parser_version": { "bsonType": "string" },
+                    "hash": { "bsonType": ["string", "null"] }
+                }
+            },
+            "quality": {
+                "bsonType": "object",
+                "properties": {
+                    "warnings": { "bsonType": "array", "items": { "bsonType": "string" } },
+                    "ocr_used": { "bsonType": "bool" }
+                }
+            }
+        }
+    }
+}
+
 
 def write_mongodb(records: List[Record], cfg: MongoDBConfig) -> Dict:
     """
     Write records to MongoDB.
     
+    Upserts are sent in unordered batches. A batch with failed upserts does
+    not stop the later batches; every batch is attempted and a single
+    MongoDBError reporting the failures and the counts written is raised at
+    the end.
+    
     Args:
         records: List of records to write
         cfg: MongoDB configuration
@@ -38,83 +132,128 @@ def write_mongodb(records: List[Record], cfg: MongoDBConfig) -> Dict:
         logger.warning("MongoDB integration is disabled in configuration")
         return {"matched": 0, "modified": 0, "upserted": 0}
     
-    logger.info(f"Writing {len(records)} records to MongoDB")
+    logger.info("Writing %d records to MongoDB", len(records))
     
     try:
         # Connect to MongoDB
-        client = pymongo.MongoClient(cfg.uri, retryWrites=True)
+        client = _get_client(cfg.uri)
         db = client[cfg.database]
         collection = db[cfg.collection]
         
-        # Prepare bulk operations
-        operations = []
-        for record in records:
-            # Convert record to MongoDB document
-            doc = to_mongodb_doc(record, cfg.tenant)
-            
-            # Create upsert operation
-            filter_doc = {"_id": doc["_id"]}
-            update = {
-                "$set": {
-                    "_tenant": doc["_tenant"],
-                    "name": doc["name"],
-                    "name_normalized": doc["name_normalized"],
-                    "address": doc["address"],
-                    "identifier": doc["identifier"],
-                    "book_in_date": doc["book_in_date"],
-                    "source.file": doc["source"]["file"],
-                    "source.page_span": doc["source"]["page_span"],
-                    "source.parser_version": doc["source"]["parser_version"],
-                    "quality": doc["quality"]
-                },
-                "$setOnInsert": { "source.ingested_at": doc["source"]["ingested_at"] },
-                "$addToSet": { "charges": { "$each": doc["charges"] } }
-            }
-            operations.append(pymongo.UpdateOne(filter_doc, update, upsert=True))
-        
-        # Execute bulk operations
-        if operations:
-            result = collection.bulk_write(operations, ordered=False)
-            return {
-                "matched": result.matched_count,
-                "modified": result.modified_count,
-                "upserted": len(result.upserted_ids or {})
-            }
-        
-        return {"matched": 0, "modified": 0, "upserted": 0}
+        # Stream upserts to MongoDB in batches
+        counts = {"matched": 0, "modified": 0, "upserted": 0}
+        write_errors = []
+        ingested_at = datetime.datetime.now(datetime.timezone.utc)
+        operations = _ops(records, cfg.tenant, ingested_at, cfg.key_hash)
+        while True:
+            batch = list(itertools.islice(operations, _BULK_BATCH_SIZE))
+            if not batch:
+                break
+            try:
+                result = collection.bulk_write(batch, ordered=False)
+            except pymongo.errors.BulkWriteError as e:
+                # The other upserts of an unordered batch were still applied
+                details = e.details
+                counts["matched"] += details.get("nMatched", 0)
+                counts["modified"] += details.get("nModified", 0)
+                counts["upserted"] += details.get("nUpserted", 0)
+                write_errors.extend(details.get("writeErrors", []))
+                continue
+            counts["matched"] += result.matched_count
+            counts["modified"] += result.modified_count
+            counts["upserted"] += len(result.upserted_ids or {})
     except Exception as e:
-        logger.error(f"Error writing to MongoDB: {e}")
+        logger.error("Error writing to MongoDB: %s", e)
         raise MongoDBError(f"Error writing to MongoDB: {e}")
+    
+    if write_errors:
+        message = (
+            f"Error writing to MongoDB: {len(write_errors)} upserts failed "
+            f"(first: {write_errors[0].get('errmsg')}); wrote {counts}"
+        )
+        logger.error(message)
+        raise MongoDBError(message)
+    
+    return counts
 
 
-def to_mongodb_doc(record: Record, tenant: str) -> Dict:
+def _ops(
+    records: Iterable[Record],
+    tenant: str,
+    ingested_at: Optional[datetime.datetime] = None,
+    key_hash: str = "sha256",
+) -> Iterator["pymongo.UpdateOne"]:
+    """
+    Generate upsert operations for records.
+    
+    Args:
+        records: Records to upsert
+        tenant: Tenant identifier
+        ingested_at: Ingestion timestamp shared by all records (defaults to now)
+        key_hash: Hash used for the name key of records without an identifier
+        
+    Yields:
+        Upsert operation for each record
+    """
+    if ingested_at is None:
+        ingested_at = datetime.datetime.now(datetime.timezone.utc)
+    
+    for record in records:
+        # Convert record to MongoDB document
+        doc = to_mongodb_doc(record, tenant, ingested_at, key_hash)
+        
+        # Create upsert operation
+        source = doc["source"]
+        update_set = {field: doc[field] for field in _SET_FIELDS}
+        update_set["source.file"] = source["file"]
+        update_set["source.page_span"] = source["page_span"]
+        update_set["source.parser_version"] = source["parser_version"]
+        update = {
+            "$set": update_set,
+            "$setOnInsert": { "source.ingested_at": source["ingested_at"] },
+            "$addToSet": { "charges": { "$each": doc["charges"] } }
+        }
+        yield pymongo.UpdateOne({"_id": doc["_id"]}, update, upsert=True)
+
+
+def to_mongodb_doc(
+    record: Record,
+    tenant: str,
+    ingested_at: Optional[datetime.datetime] = None,
+    key_hash: str = "sha256",
+) -> Dict:
     """
     Convert a record to a MongoDB document.
     
     Args:
         record: Record to convert
         tenant: Tenant identifier
+        ingested_at: Ingestion timestamp (defaults to now)
+        key_hash: Hash used for the name key of records without an identifier
         
     Returns:
         MongoDB document
     """
+    name = record["name"]
+    source_file = record["source_file"]
+    
     # Generate deterministic ID
-    _id = keyify(tenant, record["source_file"], record)
+    _id = keyify(tenant, source_file, record, key_hash)
     
     # Convert record to MongoDB document
     return {
         "_id": _id,
         "_tenant": tenant,
-        "name": record["name"],
-        "name_normalized": record.get("name_normalized", record["name"]),
+        "name": name,
+        "name_normalized": record["name_normalized"] if "name_normalized" in record else name,
         "address": record.get("address", []),
         "identifier": record.get("identifier"),
         "book_in_date": record["book_in_date"],
         "charges": record.get("charges", []),
         "source": {
-            "file": record["source_file"],
+            "file": source_file,
             "page_span": record.get("source_page_span", [1, 1]),
-            "ingested_at": datetime.datetime.utcnow(),
+            "ingested_at": ingested_at or datetime.datetime.now(datetime.timezone.utc),
             "parser_version": "1.0.0",
             "hash": None  # Optional: compute hash of original text
         },
@@ -125,7 +264,7 @@ def to_mongodb_doc(record: Record, tenant: str) -> Dict:
     }
 
 
-def keyify(tenant: str, source_file: str, record: Dict) -> str:
+def keyify(tenant: str, source_file: str, record: Dict, key_hash: str = "sha256") -> str:
     """
     Generate a deterministic ID for a record.
     
@@ -133,6 +272,8 @@ def keyify(tenant: str, source_file: str, record: Dict) -> str:
         tenant: Tenant identifier
         source_file: Source file name
         record: Record
+        key_hash: Hash used for the name key when the identifier is missing;
+            "blake2b" is faster than "sha256" but yields different IDs
         
     Returns:
         Deterministic ID
@@ -144,7 +285,11 @@ def keyify(tenant: str, source_file: str, record: Dict) -> str:
         return f"{tenant}::{book_in_date}::{source_file}::{ident}"
     else:
         # Fall back to name hash if identifier is missing
-        name_key = hashlib.sha256(record["name_normalized"].encode()).hexdigest()[:16]
+        name = record["name_normalized"].encode()
+        if key_hash == "blake2b":
+            name_key = hashlib.blake2b(name, digest_size=8).hexdigest()
+        else:
+            name_key = hashlib.sha256(name).hexdigest()[:16]
         return f"{tenant}::{book_in_date}::{source_file}::{name_key}"
 
 
@@ -165,11 +310,11 @@ def write_dead_letter(record: Record, error: str, cfg: MongoDBConfig) -> None:
         logger.warning("MongoDB integration is disabled in configuration")
         return
     
-    logger.info(f"Writing record to dead-letter collection: {error}")
+    logger.info("Writing record to dead-letter collection: %s", error)
     
     try:
         # Connect to MongoDB
-        client = pymongo.MongoClient(cfg.uri)
+        client = _get_client(cfg.uri)
         db = client[cfg.database]
         collection = db["arrest_ingest_errors"]
         
@@ -177,18 +322,34 @@ def write_dead_letter(record: Record, error: str, cfg: MongoDBConfig) -> None:
         collection.insert_one({
             "record": record,
             "error": error,
-            "timestamp": datetime.datetime.utcnow()
+            "timestamp": datetime.datetime.now(datetime.timezone.utc)
         })
     except Exception as e:
-        logger.error(f"Error writing to dead-letter collection: {e}")
+        logger.error("Error writing to dead-letter collection: %s", e)
 
 
-def setup_mongodb(cfg: MongoDBConfig) -> None:
+def _create_missing_indexes(collection, indexes: List["pymongo.IndexModel"]) -> None:
+    """
+    Create the indexes that do not already exist on a collection.
+    
+    Args:
+        collection: MongoDB collection
+        indexes: Index definitions
+    """
+    existing = {index["name"] for index in collection.list_indexes()}
+    missing = [index for index in indexes if index.document["name"] not in existing]
+    if missing:
+        collection.create_indexes(missing)
+
+
+def setup_mongodb(cfg: MongoDBConfig, reconcile_schema: bool = False) -> None:
     """
     Set up MongoDB collections and indexes.
     
     Args:
         cfg: MongoDB configuration
+        reconcile_schema: Whether to update the schema validator of an
+            existing records collection with collMod
     """
     if not MONGODB_AVAILABLE:
         logger.warning("pymongo not installed. MongoDB setup not available.")
@@ -202,124 +363,84 @@ def setup_mongodb(cfg: MongoDBConfig) -> None:
     
     try:
         # Connect to MongoDB
-        client = pymongo.MongoClient(cfg.uri)
+        client = _get_client(cfg.uri)
         db = client[cfg.database]
+        existing = set(db.list_collection_names())
         
         # Create arrest_records collection with validation
-        if cfg.collection not in db.list_collection_names():
+        if cfg.collection not in existing:
             db.create_collection(
                 cfg.collection,
-                validator={
-                    "$jsonSchema": {
-                        "bsonType": "object",
-                        "required": ["_tenant", "name", "book_in_date", "charges", "source"],
-                        "properties": {
-                            "_tenant": { "bsonType": "string", "minLength": 1 },
-                            "name": { "bsonType": "string", "minLength": 1 },
-                            "name_normalized": { "bsonType": "string" },
-                            "address": {
-                                "bsonType": "array",
-                                "items": { "bsonType": "string" }
-                            },
-                            "identifier": { "bsonType": ["string", "null"], "pattern": "^[0-9]{5,8}$" },
-                            "book_in_date": { "bsonType": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$" },
-                            "charges": {
-                                "bsonType": "array",
-                                "minItems": 0,
-                                "items": {
-                                    "bsonType": "object",
-                                    "required": ["booking_no", "description"],
-                                    "properties": {
-                                        "booking_no": { "bsonType": "string", "pattern": "^[0-9]{2}-[0-9]{6,7}$" },
-                                        "description": { "bsonType": "string", "minLength": 1 }
-                                    }
-                                }
-                            },
-                            "source": {
-                                "bsonType": "object",
-                                "required": ["file", "ingested_at"],
-                                "properties": {
-                                    "file": { "bsonType": "string" },
-                                    "page_span": {
-                                        "bsonType": "array",
-                                        "items": { "bsonType": "int" },
-                                        "minItems": 2, "maxItems": 2
-                                    },
-                                    "ingested_at": { "bsonType": "date" },
-                                    "parser_version": { "bsonType": "string" },
-                                    "hash": { "bsonType": ["string", "null"] }
-                                }
-                            },
-                            "quality": {
-                                "bsonType": "object",
-                                "properties": {
-                                    "warnings": { "bsonType": "array", "items": { "bsonType": "string" } },
-                                    "ocr_used": { "bsonType": "bool" }
-                                }
-                            }
-                        }
-                    }
-                },
+                validator=_ARREST_RECORDS_VALIDATOR,
                 validationLevel="moderate"
             )
         
-        # Create indexes
-        collection = db[cfg.collection]
-        
-        # Idempotency & point lookups
-        collection.create_index(
-            [("_tenant", pymongo.ASCENDING), 
-             ("source.file", pymongo.ASCENDING), 
-             ("identifier", pymongo.ASCENDING), 
-             ("book_in_date", pymongo.ASCENDING)],
-            unique=True, 
-            partialFilterExpression={"identifier": {"$type": "string"}}
-        )
-        
-        # Fallback uniqueness when identifier is absent
-        collection.create_index(
-            [("_tenant", pymongo.ASCENDING), 
-             ("source.file", pymongo.ASCENDING), 
-             ("name_normalized", pymongo.ASCENDING), 
-             ("book_in_date", pymongo.ASCENDING)],
-            unique=True, 
-            partialFilterExpression={"identifier": {"$exists": False}}
-        )
-        
-        # Query by date and charge booking number inside array
-        collection.create_index([("book_in_date", pymongo.ASCENDING)])
-        collection.create_index([("_tenant", pymongo.ASCENDING), ("charges.booking_no", pymongo.ASCENDING)])
+        elif reconcile_schema:
+            # Bring the validator of an existing collection up to date
+            db.command(
+                "collMod",
+                cfg.collection,
+                validator=_ARREST_RECORDS_VALIDATOR,
+                validationLevel="moderate"
+            )
         
-        # Name search (exact or prefix)
-        collection.create_index([("name_normalized", pymongo.ASCENDING)])
+        # Create indexes
+        _create_missing_indexes(db[cfg.collection], [
+            # Idempotency & point lookups
+            pymongo.IndexModel(
+                [("_tenant", pymongo.ASCENDING), 
+                 ("source.file", pymongo.ASCENDING), 
+                 ("identifier", pymongo.ASCENDING), 
+                 ("book_in_date", pymongo.ASCENDING)],
+                unique=True, 
+                partialFilterExpression={"identifier": {"$type": "string"}}
+            ),
+            # Fallback uniqueness when identifier is absent
+            pymongo.IndexModel(
+                [("_tenant", pymongo.ASCENDING), 
+                 ("source.file", pymongo.ASCENDING), 
+                 ("name_normalized", pymongo.ASCENDING), 
+                 ("book_in_date", pymongo.ASCENDING)],
+                unique=True, 
+                partialFilterExpression={"identifier": {"$exists": False}}
+            ),
+            # Query by date and charge booking number inside array
+            pymongo.IndexModel([("book_in_date", pymongo.ASCENDING)]),
+            pymongo.IndexModel([("_tenant", pymongo.ASCENDING), ("charges.booking_no", pymongo.ASCENDING)]),
+            # Name search (exact or prefix)
+            pymongo.IndexModel([("name_normalized", pymongo.ASCENDING)]),
+        ])
         
         # Create arrest_reports collection
-        if "arrest_reports" not in db.list_collection_names():
+        if "arrest_reports" not in existing:
             db.create_collection("arrest_reports")
             
         # Create indexes for arrest_reports
-        reports_collection = db["arrest_reports"]
-        reports_collection.create_index([("url", pymongo.ASCENDING), ("report_date", pymongo.ASCENDING)], unique=True)
-        reports_collection.create_index([("report_date", pymongo.ASCENDING)])
-        reports_collection.create_index([("pulled_at", pymongo.ASCENDING)])
+        _create_missing_indexes(db["arrest_reports"], [
+            pymongo.IndexModel([("url", pymongo.ASCENDING), ("report_date", pymongo.ASCENDING)], unique=True),
+            pymongo.IndexModel([("report_date", pymongo.ASCENDING)]),
+            pymongo.IndexModel([("pulled_at", pymongo.ASCENDING)]),
+        ])
         
         # Create arrest_sources collection
-        if "arrest_sources" not in db.list_collection_names():
+        if "arrest_sources" not in existing:
             db.create_collection("arrest_sources")
             
         # Create indexes for arrest_sources
-        sources_collection = db["arrest_sources"]
-        sources_collection.create_index([("url", pymongo.ASCENDING)], unique=True)
+        _create_missing_indexes(db["arrest_sources"], [
+            pymongo.IndexModel([("url", pymongo.ASCENDING)], unique=True),
+        ])
         
         # Create arrest_ingest_errors collection
-        if "arrest_ingest_errors" not in db.list_collection_names():
+        if "arrest_ingest_errors" not in existing:
             db.create_collection("arrest_ingest_errors")
             
         # Create indexes for arrest_ingest_errors
-        errors_collection = db["arrest_ingest_errors"]
-        errors_collection.create_index([("timestamp", pymongo.ASCENDING)])
+        _create_missing_indexes(db["arrest_ingest_errors"], [
+            pymongo.IndexModel([("timestamp", pymongo.ASCENDING)]),
+        ])
         
         logger.info("MongoDB setup complete")
     except Exception as e:
-        logger.error(f"Error setting up MongoDB: {e}")
+        logger.error("Error setting up MongoDB: %s", e)
         raise MongoDBError(f"Error setting up MongoDB: {e}")
\ No newline at end of file
@@ -6,21 +6,33 @@ and then parsing the structured HTML tables, which is more reliable than
 parsing raw text.
 """
 
+import functools
+import itertools
 import re
 import subprocess
 import tempfile
+from io import StringIO
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
 
+# Prefer lxml's C parser and XPath traversal when it is installed
+try:
+    import lxml.etree
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 from arrestx.config import Config
 from arrestx.log import get_logger
 from arrestx.model import Record
+from arrestx.pdfio import map_page_ranges
 
 # Try to import enhanced parser
 try:
@@ -29,8 +41,44 @@ try:
 except ImportError:
     ENHANCED_PARSER_AVAILABLE = False
 
+# Enhanced parser entry point, resolved once at import time
+_ENHANCED_PARSER: Optional[Callable[[str, Config], List[Record]]] = (
+    parse_pdf_via_enhanced_html if ENHANCED_PARSER_AVAILABLE else None
+)
+
 logger = get_logger(__name__)
 
+# Header/footer lines of the text-based report layout
+_HEADER_FOOTER_RE = re.compile(
+    r'^Daily Booked In Report$'
+    r'|^Inmates Booked In During the Past 24 Hours'
+    r'|^Page:\s*\d+\s+of\s+\d+$'
+    r'|^[-\s]{5,}$'
+    r'|^Report Date:',
+    re.IGNORECASE,
+)
+
+# Column header line of the text-based report layout
+_HEADER_LINE_RE = re.compile(
+    r'Inmate\s+Name.*Identifier.*Book\s+In\s+Date.*Booking.*Description', re.IGNORECASE
+)
+
+# Fields of a text-based data line
+_NAME_RE = re.compile(r"^([A-Z][A-Z\-\.\' ]+,\s+[A-Z][A-Z\-\.\' ]+)")
+_ID_RE = re.compile(r'\b(\d{6,8})\b')
+_DATE_RE = re.compile(r'\b(\d{1,2}/\d{1,2}/\d{4})\b')
+_BOOKING_RE = re.compile(r'\b(\d{2}-\d{6,7})\b')
+
+# Column headers and row data fields of tables built from the text layout
+_TEXT_TABLE_HEADER = ('Inmate Name', 'Identifier CID', 'Book In Date', 'Booking No.', 'Description')
+_TEXT_TABLE_FIELDS = ('name', 'identifier', 'date', 'booking', 'description')
+
+# Size of the slices fed to the incremental HTML parser
+_HTML_FEED_CHUNK = 1 << 20
+
+# Escapes cell text for HTML element content (quotes only matter in attributes)
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
 
 def parse_pdf_via_html(path: str, cfg: Config) -> List[Record]:
     """
@@ -47,18 +95,18 @@ def parse_pdf_via_html(path: str, cfg: Config) -> List[Record]:
         ImportError: If required dependencies are not available
         RuntimeError: If PDF to HTML conversion fails
     """
-    if not BS4_AVAILABLE:
-        raise ImportError("BeautifulSoup4 is required for HTML parsing. Install with: pip install beautifulsoup4")
+    if not BS4_AVAILABLE and not LXML_AVAILABLE:
+        raise ImportError("BeautifulSoup4 or lxml is required for HTML parsing. Install with: pip install beautifulsoup4")
     
     logger.info(f"Parsing PDF via HTML conversion: {path}")
     
     # Check if enhanced parser should be used
-    use_enhanced_parser = getattr(cfg.parsing, 'use_enhanced_html_parser', True)
+    enhanced_parser = _ENHANCED_PARSER if cfg.parsing.use_enhanced_html_parser else None
     
-    if use_enhanced_parser and ENHANCED_PARSER_AVAILABLE:
+    if enhanced_parser is not None:
         try:
             logger.info("Attempting enhanced HTML parsing with multiple extraction methods")
-            records = parse_pdf_via_enhanced_html(path, cfg)
+            records = enhanced_parser(path, cfg)
             
             if records and len(records) > 0:
                 logger.info(f"Enhanced HTML parsing successful: extracted {len(records)} records")
@@ -71,19 +119,58 @@ def parse_pdf_via_html(path: str, cfg: Config) -> List[Record]:
     # Fallback to standard HTML parsing
     logger.info("Using standard HTML parsing")
     
-    # Convert PDF to HTML
-    html_content = convert_pdf_to_html(path, cfg)
-    
-    if not html_content:
-        raise RuntimeError("Failed to convert PDF to HTML")
+    # pdfplumber tables are parsed directly, skipping the HTML round trip
+    tables = extract_tables_with_pdfplumber(path, cfg)
     
-    # Parse HTML content
-    records = parse_html_content(html_content, path, cfg)
+    if tables is not None:
+        records = []
+        for table_rows in tables:
+            records.extend(_parse_html_table(table_rows, path, cfg))
+    else:
+        # Convert PDF to HTML
+        html_content = convert_pdf_to_html(path, cfg)
+        
+        if not html_content:
+            raise RuntimeError("Failed to convert PDF to HTML")
+        
+        # Parse HTML content
+        records = parse_html_content(html_content, path, cfg)
     
     logger.info(f"Extracted {len(records)} records from HTML")
     return records
 
 
+def extract_tables_with_pdfplumber(pdf_path: str, cfg: Config) -> Optional[List[List[List[str]]]]:
+    """
+    Extract table rows with pdfplumber, without converting them to HTML.
+    
+    Yields the same tables as parsing the output of the pdfplumber HTML
+    conversion.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        cfg: Configuration
+        
+    Returns:
+        List of tables, each a list of rows, each a list of cell texts, or
+        None if extraction fails
+    """
+    try:
+        import pdfplumber
+        
+        if cfg.performance.parallel_pages:
+            with pdfplumber.open(pdf_path) as pdf:
+                page_count = len(pdf.pages)
+            chunks = map_page_ranges(_pdfplumber_pages_tables, pdf_path, page_count, cfg)
+            return list(itertools.chain.from_iterable(chunks))
+        
+        return _pdfplumber_pages_tables(pdf_path, 0, None)
+        
+    except Exception as e:
+        logger.error(f"pdfplumber table extraction failed: {e}")
+        return None
+
+
 def convert_pdf_to_html(pdf_path: str, cfg: Config) -> Optional[str]:
     """
     Convert PDF to HTML using various methods.
@@ -131,47 +218,143 @@ def _convert_with_pdfplumber(pdf_path: str, cfg: Config) -> Optional[str]:
     try:
         import pdfplumber
         
-        html_parts = ['<html><body>']
+        if cfg.performance.parallel_pages:
+            with pdfplumber.open(pdf_path) as pdf:
+                page_count = len(pdf.pages)
+            body = ''.join(map_page_ranges(_pdfplumber_pages_html, pdf_path, page_count, cfg))
+        else:
+            body = _pdfplumber_pages_html(pdf_path, 0, None)
         
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                logger.debug(f"Processing page {page_num}")
-                
-                # Try to extract tables first
-                tables = page.extract_tables()
-                
-                if tables:
-                    for table_num, table in enumerate(tables):
-                        html_parts.append(f'<table id="page_{page_num}_table_{table_num}">')
-                        
-                        for row_num, row in enumerate(table):
-                            if row and any(cell for cell in row if cell):  # Skip empty rows
-                                html_parts.append('<tr>')
-                                for cell in row:
-                                    cell_content = (cell or "").strip()
-                                    # Use th for header rows, td for data rows
-                                    tag = 'th' if row_num == 0 else 'td'
-                                    html_parts.append(f'<{tag}>{cell_content}</{tag}>')
-                                html_parts.append('</tr>')
-                        
-                        html_parts.append('</table>')
-                else:
-                    # Fallback: extract text and try to structure it
-                    text = page.extract_text()
-                    if text:
-                        # Try to detect tabular structure in text
-                        html_table = _text_to_html_table(text, page_num)
-                        if html_table:
-                            html_parts.append(html_table)
-        
-        html_parts.append('</body></html>')
-        return '\n'.join(html_parts)
+        return f'<html><body>\n{body}</body></html>'
         
     except Exception as e:
         logger.error(f"pdfplumber conversion failed: {e}")
         return None
 
 
+def _pdfplumber_pages_html(pdf_path: str, start: int, stop: Optional[int]) -> str:
+    """
+    Render a contiguous range of pages to HTML tables with pdfplumber.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page to render
+        stop: Index one past the last page to render, or None for all pages
+        
+    Returns:
+        HTML fragment for the pages
+    """
+    buf = StringIO()
+    write = buf.write
+    
+    for page_num, tables, text in _iter_pdfplumber_pages(pdf_path, start, stop):
+        if tables:
+            _write_html_tables(write, tables, page_num)
+        elif text:
+            # Try to detect tabular structure in text
+            html_table = _text_to_html_table(text, page_num)
+            if html_table:
+                write(html_table)
+                write('\n')
+    
+    return buf.getvalue()
+
+
+def _pdfplumber_pages_tables(pdf_path: str, start: int, stop: Optional[int]) -> List[List[List[str]]]:
+    """
+    Extract the table rows of a contiguous range of pages with pdfplumber.
+    
+    Produces the same cells as parsing the HTML from _pdfplumber_pages_html.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract, or None for all pages
+        
+    Returns:
+        List of tables, each a list of rows, each a list of cell texts
+    """
+    result = []
+    
+    for _, tables, text in _iter_pdfplumber_pages(pdf_path, start, stop):
+        if tables:
+            for table in tables:
+                result.append([
+                    [(cell or "").strip() for cell in row]
+                    for row in table
+                    if row and any(cell for cell in row if cell)  # Skip empty rows
+                ])
+        elif text:
+            # Try to detect tabular structure in text
+            rows = _text_to_table_rows(text)
+            if rows:
+                result.append(rows)
+    
+    return result
+
+
+def _iter_pdfplumber_pages(
+    pdf_path: str, start: int, stop: Optional[int]
+) -> Iterator[Tuple[int, List[List[List[Optional[str]]]], Optional[str]]]:
+    """
+    Extract the tables, or failing that the text, of a range of pages.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract, or None for all pages
+        
+    Yields:
+        Tuples of page number, extracted tables and the page text (only
+        extracted when the page has no tables)
+    """
+    import pdfplumber
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages[start:stop], start + 1):
+            logger.debug(f"Processing page {page_num}")
+            
+            # Try to extract tables first, falling back to the text
+            tables = page.extract_tables()
+            text = None if tables else page.extract_text()
+            
+            yield page_num, tables, text
+            
+            # Drop the page's cached layout objects so memory stays bounded
+            # by a single page rather than growing with the document
+            page.flush_cache()
+
+
+def _write_html_tables(
+    write: Callable[[str], object],
+    tables: List[List[List[Optional[str]]]],
+    page_num: int,
+) -> None:
+    """
+    Write extracted table cells as HTML tables.
+    
+    Args:
+        write: Write method of the output buffer
+        tables: Tables of rows of cell strings (None for empty cells)
+        page_num: Page number the tables were extracted from
+    """
+    for table_num, table in enumerate(tables):
+        write(f'<table id="page_{page_num}_table_{table_num}">\n')
+        
+        for row_num, row in enumerate(table):
+            if row and any(cell for cell in row if cell):  # Skip empty rows
+                # Use th for header rows, td for data rows
+                open_tag, close_tag = ('<th>', '</th>\n') if row_num == 0 else ('<td>', '</td>\n')
+                write('<tr>\n')
+                for cell in row:
+                    write(open_tag)
+                    write((cell or "").strip().translate(_HTML_ESCAPE))
+                    write(close_tag)
+                write('</tr>\n')
+        
+        write('</table>\n')
+
+
 def _convert_with_pdftohtml(pdf_path: str, cfg: Config) -> Optional[str]:
     """
     Convert PDF to HTML using pdftohtml command-line tool.
@@ -197,7 +380,10 @@ def _convert_with_pdftohtml(pdf_path: str, cfg: Config) -> Optional[str]:
                 str(output_path)
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            # pdftohtml writes its output to disk, so only stderr is kept
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60
+            )
             
             if result.returncode == 0:
                 # Read the generated HTML file
@@ -205,7 +391,8 @@ def _convert_with_pdftohtml(pdf_path: str, cfg: Config) -> Optional[str]:
                 if html_file.exists():
                     return html_file.read_text(encoding='utf-8')
             else:
-                logger.warning(f"pdftohtml failed: {result.stderr}")
+                stderr = result.stderr.decode('utf-8', errors='replace')
+                logger.warning(f"pdftohtml failed: {stderr}")
                 
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
         logger.warning(f"pdftohtml not available or failed: {e}")
@@ -229,25 +416,14 @@ def _convert_with_pymupdf(pdf_path: str, cfg: Config) -> Optional[str]:
     try:
         import fitz  # PyMuPDF
         
-        html_parts = ['<html><body>']
+        if cfg.performance.parallel_pages:
+            with fitz.open(pdf_path) as doc:
+                page_count = len(doc)
+            body = ''.join(map_page_ranges(_pymupdf_pages_html, pdf_path, page_count, cfg))
+        else:
+            body = _pymupdf_pages_html(pdf_path, 0, None)
         
-        doc = fitz.open(pdf_path)
-        
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            
-            # Get HTML representation of the page
-            html = page.get_text("html")
-            
-            # Wrap in a div with page identifier
-            html_parts.append(f'<div id="page_{page_num + 1}">')
-            html_parts.append(html)
-            html_parts.append('</div>')
-        
-        doc.close()
-        
-        html_parts.append('</body></html>')
-        return '\n'.join(html_parts)
+        return f'<html><body>\n{body}</body></html>'
         
     except ImportError:
         logger.warning("PyMuPDF not available")
@@ -257,6 +433,46 @@ def _convert_with_pymupdf(pdf_path: str, cfg: Config) -> Optional[str]:
     return None
 
 
+def _pymupdf_pages_html(pdf_path: str, start: int, stop: Optional[int]) -> str:
+    """
+    Render a contiguous range of pages to HTML with PyMuPDF.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page to render
+        stop: Index one past the last page to render, or None for all pages
+        
+    Returns:
+        HTML fragment for the pages
+    """
+    import fitz  # PyMuPDF
+    
+    buf = StringIO()
+    write = buf.write
+    
+    with fitz.open(pdf_path) as doc:
+        for page_num in range(start, len(doc) if stop is None else stop):
+            page = doc.load_page(page_num)
+            
+            # Prefer MuPDF's table detection (PyMuPDF >= 1.23), which yields
+            # segmented cell strings instead of per-span HTML markup
+            tables = None
+            if hasattr(page, 'find_tables'):
+                tables = [table.extract() for table in page.find_tables()]
+            
+            # Wrap each page in a div with page identifier
+            write(f'<div id="page_{page_num + 1}">\n')
+            if tables:
+                _write_html_tables(write, tables, page_num + 1)
+            else:
+                # Fallback: HTML representation of the page
+                write(page.get_text("html"))
+                write('\n')
+            write('</div>\n')
+    
+    return buf.getvalue()
+
+
 def _text_to_html_table(text: str, page_num: int) -> Optional[str]:
     """
     Convert structured text to HTML table format.
@@ -268,36 +484,76 @@ def _text_to_html_table(text: str, page_num: int) -> Optional[str]:
     Returns:
         HTML table string, or None if no table structure detected
     """
+    rows = _text_to_rows(text)
+    
+    if rows is None:
+        return None
+    
+    # Build HTML table
+    html_parts = [f'<table id="page_{page_num}_text_table">']
+    
+    # Add header row
+    html_parts.append('<tr>')
+    html_parts.extend(f'<th>{header}</th>' for header in _TEXT_TABLE_HEADER)
+    html_parts.append('</tr>')
+    
+    # Add data rows
+    html_parts.extend(_row_to_html(row) for row in rows)
+    
+    html_parts.append('</table>')
+    
+    return '\n'.join(html_parts)
+
+
+def _text_to_table_rows(text: str) -> Optional[List[List[str]]]:
+    """
+    Convert structured text to table rows, header row first.
+    
+    Produces the same cells as parsing the table built by _text_to_html_table.
+    
+    Args:
+        text: Text content from PDF page
+        
+    Returns:
+        Rows of cell texts, or None if no table structure detected
+    """
+    rows = _text_to_rows(text)
+    
+    if rows is None:
+        return None
+    
+    return [list(_TEXT_TABLE_HEADER)] + [
+        [row.get(field, '').strip() for field in _TEXT_TABLE_FIELDS] for row in rows
+    ]
+
+
+def _text_to_rows(text: str) -> Optional[List[Dict[str, str]]]:
+    """
+    Group the data lines of structured text into row data.
+    
+    Args:
+        text: Text content from PDF page
+        
+    Returns:
+        Row data for each record, or None if no table header was found
+    """
     lines = [line.strip() for line in text.split('\n') if line.strip()]
     
     if not lines:
         return None
     
     # Look for table header pattern
-    header_pattern = re.compile(r'Inmate\s+Name.*Identifier.*Book\s+In\s+Date.*Booking.*Description', re.IGNORECASE)
-    
     table_start = None
     for i, line in enumerate(lines):
-        if header_pattern.search(line):
+        if _HEADER_LINE_RE.search(line):
             table_start = i
             break
     
     if table_start is None:
         return None
     
-    # Build HTML table
-    html_parts = [f'<table id="page_{page_num}_text_table">']
-    
-    # Add header row
-    html_parts.append('<tr>')
-    html_parts.append('<th>Inmate Name</th>')
-    html_parts.append('<th>Identifier CID</th>')
-    html_parts.append('<th>Book In Date</th>')
-    html_parts.append('<th>Booking No.</th>')
-    html_parts.append('<th>Description</th>')
-    html_parts.append('</tr>')
-    
     # Process data rows
+    rows = []
     current_row = {}
     
     for line in lines[table_start + 1:]:
@@ -311,7 +567,7 @@ def _text_to_html_table(text: str, page_num: int) -> Optional[str]:
             if row_data.get('name'):
                 # Start of new record
                 if current_row:
-                    html_parts.append(_row_to_html(current_row))
+                    rows.append(current_row)
                 current_row = row_data
             else:
                 # Continuation of current record
@@ -319,52 +575,39 @@ def _text_to_html_table(text: str, page_num: int) -> Optional[str]:
     
     # Add the last row
     if current_row:
-        html_parts.append(_row_to_html(current_row))
-    
-    html_parts.append('</table>')
+        rows.append(current_row)
     
-    return '\n'.join(html_parts)
+    return rows
 
 
 def _is_header_or_footer(line: str) -> bool:
     """Check if a line is a header or footer."""
-    patterns = [
-        r'^Daily Booked In Report$',
-        r'^Inmates Booked In During the Past 24 Hours',
-        r'^Page:\s*\d+\s+of\s+\d+$',
-        r'^[-\s]{5,}$',
-        r'^Report Date:',
-    ]
-    
-    for pattern in patterns:
-        if re.search(pattern, line, re.IGNORECASE):
-            return True
-    
-    return False
+    return _HEADER_FOOTER_RE.search(line) is not None
 
 
 def _parse_text_line_to_row(line: str) -> Dict[str, str]:
     """Parse a text line into row data."""
     row = {}
     
-    # Name pattern
-    name_match = re.match(r'^([A-Z][A-Z\-\.\' ]+,\s+[A-Z][A-Z\-\.\' ]+)', line)
+    # Name pattern (only possible when the line contains a comma, which also
+    # spares uppercase description lines the backtracking search for one)
+    name_match = _NAME_RE.match(line) if ',' in line else None
     if name_match:
         row['name'] = name_match.group(1).strip()
         line = line[name_match.end():].strip()
     
     # Identifier pattern
-    id_match = re.search(r'\b(\d{6,8})\b', line)
+    id_match = _ID_RE.search(line)
     if id_match:
         row['identifier'] = id_match.group(1)
     
-    # Date pattern
-    date_match = re.search(r'\b(\d{1,2}/\d{1,2}/\d{4})\b', line)
+    # Date pattern (only possible when the line contains a slash)
+    date_match = _DATE_RE.search(line) if '/' in line else None
     if date_match:
         row['date'] = date_match.group(1)
     
-    # Booking number pattern
-    booking_match = re.search(r'\b(\d{2}-\d{6,7})\b', line)
+    # Booking number pattern (only possible when the line contains a dash)
+    booking_match = _BOOKING_RE.search(line) if '-' in line else None
     if booking_match:
         row['booking'] = booking_match.group(1)
         # Everything after booking number is description
@@ -392,7 +635,7 @@ def _row_to_html(row: Dict[str, str]) -> str:
         f'<td>{row.get("identifier", "")}</td>'
         f'<td>{row.get("date", "")}</td>'
         f'<td>{row.get("booking", "")}</td>'
-        f'<td>{row.get("description", "")}</td>'
+        f'<td>{row.get("description", "").translate(_HTML_ESCAPE)}</td>'
         '</tr>'
     )
 
@@ -409,26 +652,105 @@ def parse_html_content(html_content: str, source_file: str, cfg: Config) -> List
     Returns:
         List of parsed records
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
     records = []
     
     # Find all tables
-    tables = soup.find_all('table')
-    
-    for table in tables:
-        table_records = _parse_html_table(table, source_file, cfg)
+    for table_rows in _extract_table_rows(html_content):
+        table_records = _parse_html_table(table_rows, source_file, cfg)
         records.extend(table_records)
     
     logger.info(f"Parsed {len(records)} records from HTML tables")
     return records
 
 
-def _parse_html_table(table, source_file: str, cfg: Config) -> List[Record]:
+def _extract_table_rows(html_content: str) -> List[List[List[str]]]:
+    """
+    Extract the stripped cell texts of every table in an HTML document.
+    
+    Uses lxml with XPath when available and BeautifulSoup otherwise. Cell
+    text matches BeautifulSoup's ``get_text(strip=True)`` in both cases.
+    
+    Args:
+        html_content: HTML content as string
+        
+    Returns:
+        List of tables, each a list of rows, each a list of cell texts
+    """
+    if LXML_AVAILABLE:
+        if not html_content.strip():
+            return []
+        return [
+            [
+                [''.join(text.strip() for text in cell.itertext()) for cell in row.xpath('./td|./th')]
+                for row in table.xpath('.//tr')
+            ]
+            for outer_table in _iter_lxml_elements(html_content)
+            for table in outer_table.xpath('descendant-or-self::table')
+        ]
+    
+    # Only build the table subtrees, skipping page text outside of them
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=SoupStrainer('table'))
+    return [
+        [
+            [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+            for row in table.find_all('tr')
+        ]
+        for table in soup.find_all('table')
+    ]
+
+
+def _iter_lxml_elements(html_content: str, tags: Tuple[str, ...] = ('table',)) -> Iterator:
+    """
+    Incrementally parse an HTML document, yielding each outermost element
+    with one of the given tags.
+    
+    Each element is dropped once the caller resumes, together with everything
+    parsed before it, so peak memory is bounded by the content between two
+    elements rather than the whole document tree.
+    
+    Args:
+        html_content: HTML content as string
+        tags: Tag names of the elements to yield
+        
+    Yields:
+        Outermost matching elements, in document order
+    """
+    parser = lxml.etree.HTMLPullParser(events=('start', 'end'), tag=tags)
+    
+    depth = 0
+    offsets = range(0, len(html_content), _HTML_FEED_CHUNK)
+    for offset in itertools.chain(offsets, [None]):
+        if offset is None:
+            parser.close()
+        else:
+            parser.feed(html_content[offset:offset + _HTML_FEED_CHUNK])
+        
+        for event, element in parser.read_events():
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth:
+                continue
+            
+            yield element
+            
+            # Release the element along with everything parsed before it
+            elem, parent = element, element.getparent()
+            while parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+                elem, parent = parent, parent.getparent()
+            if element.getparent() is not None:
+                element.getparent().remove(element)
+
+
+def _parse_html_table(rows: List[List[str]], source_file: str, cfg: Config) -> List[Record]:
     """
     Parse a single HTML table to extract records.
     
     Args:
-        table: BeautifulSoup table element
+        rows: Cell texts of each table row
         source_file: Source PDF filename
         cfg: Configuration
         
@@ -436,7 +758,6 @@ def _parse_html_table(table, source_file: str, cfg: Config) -> List[Record]:
         List of parsed records
     """
     records = []
-    rows = table.find_all('tr')
     
     if not rows:
         return records
@@ -451,14 +772,12 @@ def _parse_html_table(table, source_file: str, cfg: Config) -> List[Record]:
     # Process data rows
     current_record = None
     
-    for row in rows[1:]:  # Skip header row
-        cells = row.find_all(['td', 'th'])
-        
+    for cells in rows[1:]:  # Skip header row
         if len(cells) < len(header_indices):
             # This might be a continuation row
             if current_record and cells:
                 # Add to description of last charge
-                additional_text = ' '.join(cell.get_text(strip=True) for cell in cells)
+                additional_text = ' '.join(cells)
                 if additional_text and current_record['charges']:
                     current_record['charges'][-1]['description'] += ' ' + additional_text
             continue
@@ -483,21 +802,20 @@ def _parse_html_table(table, source_file: str, cfg: Config) -> List[Record]:
     return records
 
 
-def _find_column_indices(header_row) -> Dict[str, int]:
+def _find_column_indices(header_cells: List[str]) -> Dict[str, int]:
     """
     Find the column indices for each field type.
     
     Args:
-        header_row: BeautifulSoup row element
+        header_cells: Cell texts of the header row
         
     Returns:
         Dictionary mapping field names to column indices
     """
-    cells = header_row.find_all(['th', 'td'])
     indices = {}
     
-    for i, cell in enumerate(cells):
-        text = cell.get_text(strip=True).lower()
+    for i, cell in enumerate(header_cells):
+        text = cell.lower()
         
         if 'name' in text:
             indices['name'] = i
@@ -513,12 +831,12 @@ def _find_column_indices(header_row) -> Dict[str, int]:
     return indices
 
 
-def _extract_row_data(cells, header_indices: Dict[str, int]) -> Dict[str, str]:
+def _extract_row_data(cells: List[str], header_indices: Dict[str, int]) -> Dict[str, str]:
     """
     Extract data from table row cells.
     
     Args:
-        cells: List of BeautifulSoup cell elements
+        cells: Cell texts of the row
         header_indices: Column indices mapping
         
     Returns:
@@ -528,7 +846,7 @@ def _extract_row_data(cells, header_indices: Dict[str, int]) -> Dict[str, str]:
     
     for field, index in header_indices.items():
         if index < len(cells):
-            text = cells[index].get_text(strip=True)
+            text = cells[index]
             if text:
                 data[field] = text
     
@@ -546,24 +864,24 @@ def _create_record_from_row(row_data: Dict[str, str], source_file: str) -> Recor
     Returns:
         New record
     """
-    record = {
-        'name': row_data.get('name', ''),
-        'name_normalized': _normalize_name(row_data.get('name', '')),
+    get = row_data.get
+    name = get('name', '')
+    booking = get('booking', '')
+    description = get('description', '')
+    
+    return {
+        'name': name,
+        'name_normalized': _normalize_name(name),
         'street': [],
-        'identifier': row_data.get('identifier'),
-        'book_in_date': _normalize_date(row_data.get('date')),
-        'charges': [],
+        'identifier': get('identifier'),
+        'book_in_date': _normalize_date(get('date')),
+        # Add charge if present
+        'charges': [{'booking_no': booking, 'description': description}] if booking or description else [],
         'source_file': source_file,
         'source_page_span': [1, 1],  # Will be updated if needed
         'parse_warnings': [],
         'ocr_used': False
     }
-    
-    # Add charge if present
-    if row_data.get('booking') or row_data.get('description'):
-        _add_charge_to_record(record, row_data)
-    
-    return record
 
 
 def _add_charge_to_record(record: Record, row_data: Dict[str, str]) -> None:
@@ -582,10 +900,14 @@ def _add_charge_to_record(record: Record, row_data: Dict[str, str]) -> None:
     record['charges'].append(charge)
 
 
+@functools.lru_cache(maxsize=8192)
 def _normalize_name(name: str) -> str:
     """
     Normalize a name from "LAST, FIRST MIDDLE" to "First Middle Last".
     
+    Results are memoized, since a person's name repeats on every row of a
+    multi-charge booking.
+    
     Args:
         name: Name in "LAST, FIRST MIDDLE" format
         
@@ -595,13 +917,8 @@ def _normalize_name(name: str) -> str:
     if not name or ',' not in name:
         return name
     
-    try:
-        last, first_middle = name.split(',', 1)
-        last = last.strip().title()
-        first_middle = first_middle.strip().title()
-        return f"{first_middle} {last}"
-    except Exception:
-        return name
+    last, _, first_middle = name.partition(',')
+    return f"{first_middle.strip().title()} {last.strip().title()}"
 
 
 def _normalize_date(date_str: Optional[str]) -> Optional[str]:
@@ -617,6 +934,20 @@ def _normalize_date(date_str: Optional[str]) -> Optional[str]:
     if not date_str:
         return None
     
+    # Fast path for the usual zero-padded MM/DD/YYYY form
+    if len(date_str) == 10 and date_str[2] == "/" and date_str[5] == "/":
+        month = date_str[:2]
+        day = date_str[3:5]
+        year = date_str[6:]
+        if month.isascii() and month.isdigit() and day.isascii() and day.isdigit() and "/" not in year:
+            if "01" <= month <= "12" and "01" <= day <= "31":
+                return f"{year}-{month}-{day}"
+            return date_str
+    
+    # Anything but three slash-separated parts is not a date
+    if date_str.count("/") != 2:
+        return date_str
+    
     try:
         month, day, year = date_str.split("/")
         month_int = int(month)
@@ -5,11 +5,14 @@ This module provides improved PDF to HTML conversion and parsing approaches
 that can handle various HTML structures including positioned text elements.
 """
 
+import bisect
+import concurrent.futures
+import functools
+import itertools
+import os
 import re
 import subprocess
-import tempfile
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import logging
 
 try:
@@ -18,6 +21,13 @@ try:
 except ImportError:
     BS4_AVAILABLE = False
 
+# Stream pdftohtml output with lxml's C parser when it is installed
+try:
+    import lxml.etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 try:
     import tabula
     TABULA_AVAILABLE = True
@@ -30,12 +40,70 @@ try:
 except ImportError:
     CAMELOT_AVAILABLE = False
 
-from arrestx.config import Config
+from arrestx.config import Config, worker_config
 from arrestx.log import get_logger
 from arrestx.model import Record
+from arrestx.pdfio import map_page_ranges
 
 logger = get_logger(__name__)
 
+# Fields of a text row
+_NAME_RE = re.compile(r'^([A-Z][A-Z\-\.\' ]+,\s+[A-Z][A-Z\-\.\' ]+)')
+
+# Start of any line of a text page that could open a record
+_NAME_LINE_RE = re.compile(r'^\s*[A-Z][A-Z\-\.\' ]+,\s+[A-Z]', re.MULTILINE)
+
+# Booking numbers with their description, dates and identifiers, found in a
+# single scan. The digits of a booking number also count as an identifier.
+_RECORD_DATA_RE = re.compile(
+    r'\b(?P<booking>\d{2}-(?P<booking_id>\d{6,7}))\b(?=\s*(?P<description>.*))'
+    r'|\b(?P<date>\d{1,2}/\d{1,2}/\d{4})\b'
+    r'|\b(?P<identifier>\d{6,8})\b'
+)
+
+# Zero-padded month and day for each valid one or two digit form
+_MONTHS = {f"{i:0{width}d}": f"{i:02d}" for i in range(1, 13) for width in (1, 2)}
+_DAYS = {f"{i:0{width}d}": f"{i:02d}" for i in range(1, 32) for width in (1, 2)}
+
+# Header/footer lines of the report
+_HEADER_FOOTER_RE = re.compile(
+    r'^Daily Booked In Report$'
+    r'|^Inmates Booked In During the Past 24 Hours'
+    r'|^Page:\s*\d+\s+of\s+\d+$'
+    r'|^[-\s]{5,}$'
+    r'|^Report Date:'
+    r'|^Inmate Name\s+Identifier',
+    re.IGNORECASE,
+)
+
+# Charge description keywords (matched anywhere in the upper-cased line)
+_CHARGE_KEYWORD_RE = re.compile(r'ASSAULT|THEFT|BURGLARY|DRIVING|POSS|CS|PG|DWI|WARRANT')
+
+# Positive indicators for address lines
+_ADDRESS_RE = re.compile(
+    r'\b\d+\s+[A-Za-z]'  # Street number + street name
+    r'|\b[A-Z]{2}\s+\d{5}'  # State + ZIP
+    r'|\b(?:ST|AVE|BLVD|DR|LN|RD|CT|WAY|CIR|TRL|PKWY|HWY|FWY)\b'  # Street suffixes
+    r'|\b(?:STREET|AVENUE|BOULEVARD|DRIVE|LANE|ROAD|COURT|WAY|CIRCLE|TRAIL|PARKWAY|HIGHWAY|FREEWAY)\b'
+    r'|\b(?:APT|UNIT|#|SUITE)\s*[A-Z0-9]'  # Apartment indicators
+    r'|\b(?:NORTH|SOUTH|EAST|WEST|N|S|E|W)\s+[A-Z]',  # Directional indicators
+    re.IGNORECASE,
+)
+
+# Position of pdftohtml text elements
+_TOP_RE = re.compile(r'top:\s*(\d+)')
+_LEFT_RE = re.compile(r'left:\s*(\d+)')
+
+# Tags of the elements holding text in pdftohtml output
+_TEXT_ELEMENT_TAGS = ('text', 'p', 'div')
+
+# pdfplumber table settings, tried in order until one finds a table
+_TABLE_STRATEGIES = (
+    {"vertical_strategy": "lines", "horizontal_strategy": "lines"},
+    {"vertical_strategy": "text", "horizontal_strategy": "text"},
+    {"vertical_strategy": "explicit", "horizontal_strategy": "explicit"},
+)
+
 
 class EnhancedHTMLParser:
     """Enhanced HTML parser with multiple extraction strategies."""
@@ -87,7 +155,9 @@ class EnhancedHTMLParser:
         
         logger.debug("Extracting tables with tabula-py")
         
-        # Try different tabula extraction strategies
+        # Try different tabula extraction strategies. With jpype installed,
+        # tabula-py runs them all in one JVM kept for the life of the process
+        # instead of launching java for every call.
         strategies = [
             {"lattice": True},  # For tables with clear borders
             {"stream": True},   # For tables without borders
@@ -148,20 +218,21 @@ class EnhancedHTMLParser:
         
         logger.debug("Extracting positioned text with PyMuPDF")
         
-        doc = fitz.open(path)
+        with fitz.open(path) as doc:
+            page_count = len(doc)
+        
+        # Get the text spans of each page with their position
+        positions_per_page = itertools.chain.from_iterable(
+            map_page_ranges(_pymupdf_page_positions, path, page_count, self.cfg)
+        )
+        
         all_records = []
         
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            
-            # Get text blocks with position information
-            blocks = page.get_text("dict")
-            
-            # Convert positioned blocks to structured data
-            records = self._parse_positioned_blocks(blocks, path, page_num + 1)
+        for page_num, (texts, xs, ys) in enumerate(positions_per_page, 1):
+            # Convert positioned text to structured data
+            records = self._parse_positioned_texts(texts, xs, ys, path, page_num)
             all_records.extend(records)
         
-        doc.close()
         return all_records
     
     def _extract_with_pdfplumber_enhanced(self, path: str) -> List[Record]:
@@ -175,69 +246,90 @@ class EnhancedHTMLParser:
         
         all_records = []
         
+        if self.cfg.performance.parallel_pages:
+            with pdfplumber.open(path) as pdf:
+                page_count = len(pdf.pages)
+            
+            for chunk in map_page_ranges(_pdfplumber_page_records, path, page_count, self.cfg, self.cfg):
+                for records in chunk:
+                    all_records.extend(records)
+            
+            return all_records
+        
         with pdfplumber.open(path) as pdf:
+            # The strategy that found a table is tried first on the next page
+            strategy = None
             for page_num, page in enumerate(pdf.pages, 1):
-                # Try multiple table extraction strategies
-                strategies = [
-                    {"vertical_strategy": "lines", "horizontal_strategy": "lines"},
-                    {"vertical_strategy": "text", "horizontal_strategy": "text"},
-                    {"vertical_strategy": "explicit", "horizontal_strategy": "explicit"},
-                ]
-                
-                for strategy in strategies:
-                    try:
-                        tables = page.extract_tables(table_settings=strategy)
-                        
-                        if tables:
-                            for table in tables:
-                                if table and len(table) > 1:  # Has header + data
-                                    records = self._convert_table_to_records(table, path, page_num)
-                                    all_records.extend(records)
-                                    break  # Found valid tables, stop trying strategies
-                    except Exception as e:
-                        logger.debug(f"pdfplumber strategy {strategy} failed: {e}")
-                        continue
-                
-                # If no tables found, try text-based extraction
-                if not all_records:
-                    text = page.extract_text()
-                    if text:
-                        records = self._parse_text_to_records(text, path, page_num)
-                        all_records.extend(records)
+                records, strategy = self._extract_page_records(page, path, page_num, strategy)
+                all_records.extend(records)
         
         return all_records
     
+    def _extract_page_records(self, page, path: str, page_num: int,
+                              strategy: Optional[int] = None) -> Tuple[List[Record], Optional[int]]:
+        """
+        Extract the table records, or failing that the text records, of a pdfplumber page.
+        
+        Args:
+            page: pdfplumber page
+            path: Path to the PDF file
+            page_num: Page number
+            strategy: Index of the table strategy to try first, if any
+            
+        Returns:
+            Tuple of the page records and the index of the table strategy to try first next
+        """
+        order = range(len(_TABLE_STRATEGIES))
+        if strategy is not None:
+            order = [strategy] + [i for i in order if i != strategy]
+        
+        # Try table extraction strategies until one yields records
+        for i in order:
+            try:
+                for table in page.extract_tables(table_settings=_TABLE_STRATEGIES[i]) or []:
+                    if table and len(table) > 1:  # Has header + data
+                        records = self._convert_table_to_records(table, path, page_num)
+                        if records:
+                            return records, i
+                        break
+            except Exception as e:
+                # Skip formatting the message on every page unless it is shown
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"pdfplumber strategy {_TABLE_STRATEGIES[i]} failed: {e}")
+                continue
+        
+        # If no tables found, try text-based extraction
+        text = page.extract_text()
+        if not text:
+            return [], strategy
+        return self._parse_text_to_records(text, path, page_num), strategy
+    
     def _extract_with_pdftohtml(self, path: str) -> List[Record]:
         """Extract using pdftohtml command-line tool."""
         logger.debug("Extracting with pdftohtml")
         
+        # Run pdftohtml command with table-friendly options, reading the
+        # XML from stdout rather than from a file in a temporary directory
+        cmd = [
+            "pdftohtml",
+            "-c",  # Generate complex output
+            "-s",  # Generate single HTML file
+            "-noframes",  # Don't use frames
+            "-xml",  # Generate XML output for better structure
+            "-i",  # Ignore images, which would otherwise be written to disk
+            "-stdout",  # Write the output to stdout
+            str(path),
+        ]
+        
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                output_path = Path(temp_dir) / "output"
-                
-                # Run pdftohtml command with table-friendly options
-                cmd = [
-                    "pdftohtml",
-                    "-c",  # Generate complex output
-                    "-s",  # Generate single HTML file
-                    "-noframes",  # Don't use frames
-                    "-xml",  # Generate XML output for better structure
-                    str(path),
-                    str(output_path)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=60
+            )
+            
+            if result.returncode == 0 and result.stdout:
+                content = result.stdout.decode('utf-8')
+                return self._parse_pdftohtml_content(content, path)
                 
-                if result.returncode == 0:
-                    # Read the generated HTML/XML file
-                    html_file = output_path.with_suffix('.xml')
-                    if not html_file.exists():
-                        html_file = output_path.with_suffix('.html')
-                    
-                    if html_file.exists():
-                        content = html_file.read_text(encoding='utf-8')
-                        return self._parse_pdftohtml_content(content, path)
-                        
         except (subprocess.TimeoutExpired, FileNotFoundError) as e:
             logger.debug(f"pdftohtml not available or failed: {e}")
         
@@ -268,17 +360,25 @@ class EnhancedHTMLParser:
                 else:
                     continue
             
-            # Convert rows to records
-            for _, row in df.iterrows():
-                try:
-                    record = self._create_record_from_row(
-                        row, path, name_col, id_col, date_col, booking_col, desc_col
-                    )
-                    if record:
-                        records.append(record)
-                except Exception as e:
-                    logger.debug(f"Failed to convert row to record: {e}")
+            # Read each column once instead of building a Series per row
+            column_values = []
+            for col in (name_col, id_col, date_col, booking_col, desc_col):
+                if col is None:
+                    column_values.append([""] * len(df))
                     continue
+                
+                # Missing cells read as empty, whatever the column dtype
+                column = df.iloc[:, col]
+                column_values.append([
+                    "" if missing else _cell_text(value)
+                    for value, missing in zip(column.tolist(), column.isna().tolist())
+                ])
+            
+            # Convert rows to records
+            for values in zip(*column_values):
+                record = self._create_record_from_row(values, path)
+                if record:
+                    records.append(record)
         
         return records
     
@@ -291,22 +391,10 @@ class EnhancedHTMLParser:
                     return i
         return None
     
-    def _create_record_from_row(self, row, path: str, name_col: int, id_col: int, 
-                               date_col: int, booking_col: int, desc_col: int) -> Optional[Record]:
-        """Create a Record from a table row."""
+    def _create_record_from_row(self, values: Tuple[str, str, str, str, str], path: str) -> Optional[Record]:
+        """Create a Record from the name, identifier, date, booking and description cell texts of a row."""
         try:
-            name = str(row.iloc[name_col]) if name_col is not None else ""
-            identifier = str(row.iloc[id_col]) if id_col is not None else ""
-            date = str(row.iloc[date_col]) if date_col is not None else ""
-            booking = str(row.iloc[booking_col]) if booking_col is not None else ""
-            description = str(row.iloc[desc_col]) if desc_col is not None else ""
-            
-            # Clean up the data
-            name = name.strip() if name != "nan" else ""
-            identifier = identifier.strip() if identifier != "nan" else ""
-            date = date.strip() if date != "nan" else ""
-            booking = booking.strip() if booking != "nan" else ""
-            description = description.strip() if description != "nan" else ""
+            name, identifier, date, booking, description = values
             
             # Skip empty rows
             if not name and not identifier:
@@ -349,78 +437,35 @@ class EnhancedHTMLParser:
             return record
             
         except Exception as e:
-            logger.debug(f"Error creating record from row: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Error creating record from row: {e}")
             return None
     
-    def _parse_positioned_blocks(self, blocks: Dict, path: str, page_num: int) -> List[Record]:
-        """Parse positioned text blocks from PyMuPDF."""
-        # Extract text elements with their positions
-        text_elements = []
-        
-        for block in blocks.get("blocks", []):
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line.get("spans", []):
-                        text = span.get("text", "").strip()
-                        if text:
-                            bbox = span.get("bbox", [0, 0, 0, 0])
-                            text_elements.append({
-                                "text": text,
-                                "x": bbox[0],
-                                "y": bbox[1],
-                                "width": bbox[2] - bbox[0],
-                                "height": bbox[3] - bbox[1]
-                            })
-        
+    def _parse_positioned_texts(self, texts: Sequence[str], xs: Sequence[float], ys: Sequence[float],
+                                path: str, page_num: int) -> List[Record]:
+        """Group positioned text elements into rows and parse the rows into records."""
         # Sort by Y position (top to bottom), then X position (left to right)
-        text_elements.sort(key=lambda x: (x["y"], x["x"]))
+        order = sorted(range(len(texts)), key=list(zip(ys, xs)).__getitem__)
         
         # Group elements into logical rows based on Y position
-        rows = self._group_elements_into_rows(text_elements)
+        rows = _group_rows([ys[i] for i in order], [xs[i] for i in order])
         
         # Parse rows into records
-        return self._parse_rows_to_records(rows, path, page_num)
+        row_texts = [" ".join([texts[order[i]] for i in row]) for row in rows]
+        return self._parse_row_texts_to_records(row_texts, path, page_num)
     
-    def _group_elements_into_rows(self, elements: List[Dict]) -> List[List[Dict]]:
-        """Group text elements into rows based on Y position."""
-        if not elements:
-            return []
-        
-        rows = []
-        current_row = [elements[0]]
-        current_y = elements[0]["y"]
-        
-        for element in elements[1:]:
-            # If Y position is close to current row, add to current row
-            if abs(element["y"] - current_y) < 5:  # Reduced tolerance for better grouping
-                current_row.append(element)
-            else:
-                # Start new row
-                if current_row:
-                    rows.append(sorted(current_row, key=lambda x: x["x"]))
-                current_row = [element]
-                current_y = element["y"]
-        
-        # Add the last row
-        if current_row:
-            rows.append(sorted(current_row, key=lambda x: x["x"]))
-        
-        return rows
-    
-    def _parse_rows_to_records(self, rows: List[List[Dict]], path: str, page_num: int) -> List[Record]:
-        """Parse grouped rows into records."""
+    def _parse_row_texts_to_records(self, row_texts: List[str], path: str, page_num: int) -> List[Record]:
+        """Parse the joined text of grouped rows into records."""
         records = []
         current_record = None
         
-        for row in rows:
-            row_text = " ".join([elem["text"] for elem in row])
-            
+        for row_text in row_texts:
             # Skip header/footer rows
             if self._is_header_or_footer(row_text):
                 continue
             
             # Try to identify if this is a new record (contains a name)
-            name_match = re.match(r'^([A-Z][A-Z\-\.\' ]+,\s+[A-Z][A-Z\-\.\' ]+)', row_text)
+            name_match = _NAME_RE.match(row_text)
             
             if name_match:
                 # Finalize previous record
@@ -448,63 +493,58 @@ class EnhancedHTMLParser:
     
     def _extract_record_data(self, record: Record, text: str) -> None:
         """Extract identifier, date, booking, and charges from text."""
-        # Extract identifier
-        if not record.get("identifier"):
-            id_match = re.search(r'\b(\d{6,8})\b', text)
-            if id_match:
-                record["identifier"] = id_match.group(1)
-        
-        # Extract date
-        if not record.get("book_in_date"):
-            date_match = re.search(r'\b(\d{1,2}/\d{1,2}/\d{4})\b', text)
-            if date_match:
-                record["book_in_date"] = self._normalize_date(date_match.group(1))
-        
-        # Extract booking number and description
-        booking_match = re.search(r'\b(\d{2}-\d{6,7})\b\s*(.*)', text)
-        if booking_match:
-            booking_no = booking_match.group(1)
-            description = booking_match.group(2).strip()
+        need_identifier = not record.get("identifier")
+        need_date = not record.get("book_in_date")
+        charge = None
+        found = False
+        
+        # The first identifier, date and booking number are used
+        for match in _RECORD_DATA_RE.finditer(text):
+            found = True
+            booking_no, date, identifier = match.group("booking", "date", "identifier")
             
-            record["charges"].append({
-                "booking_no": booking_no,
-                "description": description
-            })
+            if booking_no:
+                identifier = match.group("booking_id")
+                if charge is None:
+                    charge = {
+                        "booking_no": booking_no,
+                        "description": match.group("description").strip()
+                    }
+            
+            if identifier and need_identifier:
+                record["identifier"] = identifier
+                need_identifier = False
+            elif date and need_date:
+                record["book_in_date"] = self._normalize_date(date)
+                need_date = False
+            
+            if charge is not None and not need_identifier and not need_date:
+                break
+        
+        if charge is not None:
+            record["charges"].append(charge)
         
-        # Enhanced address detection
-        elif self._is_address_line(text):
+        # Enhanced address detection, for text without any of the above
+        elif not found and self._is_address_line(text):
             record["street"].append(text)
     
     def _is_address_line(self, text: str) -> bool:
-        """Enhanced address line detection."""
+        """
+        Enhanced address line detection.
+        
+        Text containing booking numbers, identifiers or dates is never an
+        address, but is expected to have been ruled out by the caller.
+        """
         text = text.strip()
         if not text:
             return False
         
-        # Skip if it contains booking numbers or identifiers
-        if re.search(r'\b\d{2}-\d{6,7}\b', text) or re.search(r'\b\d{6,8}\b', text):
-            return False
-        
-        # Skip if it contains dates
-        if re.search(r'\b\d{1,2}/\d{1,2}/\d{4}\b', text):
-            return False
-        
         # Skip if it looks like a charge description
-        charge_keywords = ['ASSAULT', 'THEFT', 'BURGLARY', 'DRIVING', 'POSS', 'CS', 'PG', 'DWI', 'WARRANT']
-        if any(keyword in text.upper() for keyword in charge_keywords):
+        if _CHARGE_KEYWORD_RE.search(text.upper()):
             return False
         
         # Positive indicators for address lines
-        address_indicators = [
-            r'\b\d+\s+[A-Za-z]',  # Street number + street name
-            r'\b[A-Z]{2}\s+\d{5}',  # State + ZIP
-            r'\b(ST|AVE|BLVD|DR|LN|RD|CT|WAY|CIR|TRL|PKWY|HWY|FWY)\b',  # Street suffixes
-            r'\b(STREET|AVENUE|BOULEVARD|DRIVE|LANE|ROAD|COURT|WAY|CIRCLE|TRAIL|PARKWAY|HIGHWAY|FREEWAY)\b',
-            r'\b(APT|UNIT|#|SUITE)\s*[A-Z0-9]',  # Apartment indicators
-            r'\b(NORTH|SOUTH|EAST|WEST|N|S|E|W)\s+[A-Z]',  # Directional indicators
-        ]
-        
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in address_indicators)
+        return _ADDRESS_RE.search(text) is not None
     
     def _create_new_record(self, path: str, page_num: int) -> Record:
         """Create a new record with default values."""
@@ -523,24 +563,21 @@ class EnhancedHTMLParser:
     
     def _normalize_name(self, name: str) -> str:
         """Normalize a name from 'LAST, FIRST MIDDLE' to 'First Middle Last'."""
-        if not name or ',' not in name:
-            return name
-        
-        try:
-            last, first_middle = name.split(',', 1)
-            last = last.strip().title()
-            first_middle = first_middle.strip().title()
-            return f"{first_middle} {last}"
-        except Exception:
-            return name
+        return _normalize_name(name)
     
     def _normalize_date(self, date_str: str) -> Optional[str]:
         """Normalize a date from MM/DD/YYYY to YYYY-MM-DD."""
         if not date_str:
             return None
         
+        # Look up the usual one or two digit month and day, which also
+        # validates their range
+        parts = date_str.split("/")
+        if len(parts) == 3 and parts[0] in _MONTHS and parts[1] in _DAYS:
+            return f"{parts[2]}-{_MONTHS[parts[0]]}-{_DAYS[parts[1]]}"
+        
         try:
-            month, day, year = date_str.split("/")
+            month, day, year = parts
             month_int = int(month)
             day_int = int(day)
             if month_int < 1 or month_int > 12 or day_int < 1 or day_int > 31:
@@ -551,20 +588,7 @@ class EnhancedHTMLParser:
     
     def _is_header_or_footer(self, text: str) -> bool:
         """Check if text is a header or footer."""
-        patterns = [
-            r'^Daily Booked In Report$',
-            r'^Inmates Booked In During the Past 24 Hours',
-            r'^Page:\s*\d+\s+of\s+\d+$',
-            r'^[-\s]{5,}$',
-            r'^Report Date:',
-            r'^Inmate Name\s+Identifier',
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+        return _HEADER_FOOTER_RE.search(text) is not None
     
     def _convert_table_to_records(self, table: List[List[str]], path: str, page_num: int) -> List[Record]:
         """Convert a table (list of rows) to records."""
@@ -588,128 +612,259 @@ class EnhancedHTMLParser:
                 continue
             
             try:
+                # Read the cells of the known columns, missing ones as empty
+                name, identifier, date, booking, description = [
+                    _cell_text(row[col]) if col is not None and col < len(row) else ""
+                    for col in (name_col, id_col, date_col, booking_col, desc_col)
+                ]
+                
                 # Create record from row
                 record = self._create_new_record(path, page_num)
                 
-                if name_col is not None and name_col < len(row):
-                    name = str(row[name_col]).strip()
-                    if name and name != "nan":
-                        record["name"] = name
-                        record["name_normalized"] = self._normalize_name(name)
+                if name:
+                    record["name"] = name
+                    record["name_normalized"] = self._normalize_name(name)
                 
-                if id_col is not None and id_col < len(row):
-                    identifier = str(row[id_col]).strip()
-                    if identifier and identifier != "nan":
-                        record["identifier"] = identifier
+                if identifier:
+                    record["identifier"] = identifier
                 
-                if date_col is not None and date_col < len(row):
-                    date = str(row[date_col]).strip()
-                    if date and date != "nan":
-                        record["book_in_date"] = self._normalize_date(date)
+                if date:
+                    record["book_in_date"] = self._normalize_date(date)
                 
-                if (booking_col is not None and booking_col < len(row)) or \
-                   (desc_col is not None and desc_col < len(row)):
-                    booking = ""
-                    description = ""
-                    
-                    if booking_col is not None and booking_col < len(row):
-                        booking = str(row[booking_col]).strip()
-                        if booking == "nan":
-                            booking = ""
-                    
-                    if desc_col is not None and desc_col < len(row):
-                        description = str(row[desc_col]).strip()
-                        if description == "nan":
-                            description = ""
-                    
-                    if booking or description:
-                        record["charges"].append({
-                            "booking_no": booking,
-                            "description": description
-                        })
+                if booking or description:
+                    record["charges"].append({
+                        "booking_no": booking,
+                        "description": description
+                    })
                 
                 # Only add record if it has meaningful data
                 if record["name"] or record["identifier"]:
                     records.append(record)
                     
             except Exception as e:
-                logger.debug(f"Error processing table row: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Error processing table row: {e}")
                 continue
         
         return records
     
     def _parse_text_to_records(self, text: str, path: str, page_num: int) -> List[Record]:
         """Parse plain text to records as fallback."""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        records = []
-        current_record = None
-        
-        for line in lines:
-            if self._is_header_or_footer(line):
-                continue
-            
-            # Look for name pattern
-            name_match = re.match(r'^([A-Z][A-Z\-\.\' ]+,\s+[A-Z][A-Z\-\.\' ]+)', line)
-            
-            if name_match:
-                # Finalize previous record
-                if current_record:
-                    records.append(current_record)
-                
-                # Start new record
-                current_record = self._create_new_record(path, page_num)
-                current_record["name"] = name_match.group(1)
-                current_record["name_normalized"] = self._normalize_name(name_match.group(1))
-                
-                # Extract other data from the same line
-                remaining = line[name_match.end():].strip()
-                self._extract_record_data(current_record, remaining)
-            
-            elif current_record:
-                self._extract_record_data(current_record, line)
-        
-        # Add the last record
-        if current_record:
-            records.append(current_record)
+        # Lines before the first name line cannot add to a record, and pages
+        # of headers and boilerplate without any have no records at all
+        match = _NAME_LINE_RE.search(text)
+        if not match:
+            return []
         
-        return records
+        lines = [line.strip() for line in text[match.start():].split('\n') if line.strip()]
+        return self._parse_row_texts_to_records(lines, path, page_num)
     
     def _parse_pdftohtml_content(self, content: str, path: str) -> List[Record]:
         """Parse pdftohtml XML/HTML content."""
-        if not BS4_AVAILABLE:
-            return []
-        
-        soup = BeautifulSoup(content, 'html.parser')
-        records = []
-        
         # Look for text elements with position information
-        text_elements = soup.find_all(['text', 'p', 'div'])
+        if LXML_AVAILABLE:
+            text_elements = _iter_lxml_text_elements(content)
+        elif BS4_AVAILABLE:
+            soup = BeautifulSoup(content, 'html.parser')
+            text_elements = (
+                (elem.get_text(), elem.get('style', ''))
+                for elem in soup.find_all(list(_TEXT_ELEMENT_TAGS))
+            )
+        else:
+            return []
         
-        # Group by position and parse
-        positioned_texts = []
-        for elem in text_elements:
-            text = elem.get_text().strip()
+        # Collect text and position as parallel lists
+        texts = []
+        xs = []
+        ys = []
+        for text, style in text_elements:
+            text = text.strip()
             if text:
                 # Try to get position from style or attributes
-                style = elem.get('style', '')
-                top_match = re.search(r'top:\s*(\d+)', style)
-                left_match = re.search(r'left:\s*(\d+)', style)
+                top_match = _TOP_RE.search(style)
+                left_match = _LEFT_RE.search(style)
                 
                 top = int(top_match.group(1)) if top_match else 0
                 left = int(left_match.group(1)) if left_match else 0
                 
-                positioned_texts.append({
-                    "text": text,
-                    "x": left,
-                    "y": top
-                })
+                texts.append(text)
+                xs.append(left)
+                ys.append(top)
+        
+        # Sort, group into rows and parse rows to records
+        return self._parse_positioned_texts(texts, xs, ys, path, 1)
+
+
+def _cell_text(cell: Any) -> str:
+    """
+    Get the stripped text of a table cell.
+    
+    Args:
+        cell: Cell value, None for an empty pdfplumber cell
+        
+    Returns:
+        Cell text, empty for None and for pandas' "nan"
+    """
+    if cell is None:
+        return ""
+    text = str(cell).strip()
+    return "" if text == "nan" else text
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_name(name: str) -> str:
+    """
+    Normalize a name from "LAST, FIRST MIDDLE" to "First Middle Last".
+    
+    Results are memoized, since the same names repeat across the rows and
+    reports parsed by a process.
+    
+    Args:
+        name: Name in "LAST, FIRST MIDDLE" format
         
-        # Sort and group into rows
-        positioned_texts.sort(key=lambda x: (x["y"], x["x"]))
-        rows = self._group_elements_into_rows(positioned_texts)
+    Returns:
+        Normalized name
+    """
+    if not name or ',' not in name:
+        return name
+    
+    last, _, first_middle = name.partition(',')
+    return f"{first_middle.strip().title()} {last.strip().title()}"
+
+
+def _iter_lxml_text_elements(content: str) -> Iterator[Tuple[str, str]]:
+    """
+    Stream the text elements of pdftohtml output with lxml.
+    
+    Args:
+        content: pdftohtml XML/HTML content
         
-        # Parse rows to records
-        return self._parse_rows_to_records(rows, path, 1)
+    Yields:
+        Text and style of each text element, in document order
+    """
+    from arrestx.html_parser import _iter_lxml_elements
+    
+    for outer in _iter_lxml_elements(content, _TEXT_ELEMENT_TAGS):
+        # Nested text elements are yielded along with the outermost one
+        for elem in outer.iter(*_TEXT_ELEMENT_TAGS):
+            yield "".join(elem.itertext()), elem.get('style', '')
+
+
+def _group_rows(ys: Sequence[float], xs: Sequence[float]) -> List[List[int]]:
+    """
+    Group positioned text elements into rows based on Y position.
+    
+    Args:
+        ys: Y positions of the elements, in ascending order
+        xs: X positions of the elements
+        
+    Returns:
+        Indices of the elements in each row, ordered by X position
+    """
+    rows = []
+    count = len(ys)
+    start = 0
+    
+    while start < count:
+        current_y = ys[start]
+        
+        # Elements within the tolerance of the row's first element join the
+        # row (reduced tolerance for better grouping); bisect finds the end,
+        # then the exact comparison settles float rounding
+        end = bisect.bisect_left(ys, current_y + 5, start + 1)
+        while end < count and ys[end] - current_y < 5:
+            end += 1
+        while end > start + 1 and not ys[end - 1] - current_y < 5:
+            end -= 1
+        
+        rows.append(sorted(range(start, end), key=xs.__getitem__))
+        start = end
+    
+    return rows
+
+
+def _pymupdf_page_positions(path: str, start: int,
+                            stop: int) -> List[Tuple[List[str], List[float], List[float]]]:
+    """
+    Get the positioned text spans of a range of pages with PyMuPDF.
+    
+    Only span texts and their top-left corner are kept, as parallel lists,
+    since the results may have to be sent back from a worker process.
+    Images are left out of the extraction altogether.
+    
+    Args:
+        path: Path to the PDF file
+        start: Index of the first page
+        stop: Index one past the last page
+        
+    Returns:
+        Tuples of span texts, X positions and Y positions for each page
+    """
+    import fitz  # PyMuPDF
+    
+    flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+    pages = []
+    
+    with fitz.open(path) as doc:
+        for page in doc.pages(start, stop):
+            pages.append(_span_positions(page.get_text("dict", flags=flags)))
+    
+    return pages
+
+
+def _span_positions(blocks: Dict) -> Tuple[List[str], List[float], List[float]]:
+    """
+    Flatten the text spans of a PyMuPDF text dictionary.
+    
+    Args:
+        blocks: Page text dictionary from get_text("dict")
+        
+    Returns:
+        Tuple of the non-blank span texts and their X and Y positions
+    """
+    texts = []
+    xs = []
+    ys = []
+    
+    for block in blocks.get("blocks", []):
+        if "lines" in block:
+            for line in block["lines"]:
+                for span in line.get("spans", []):
+                    text = span.get("text", "").strip()
+                    if text:
+                        bbox = span.get("bbox", [0, 0, 0, 0])
+                        texts.append(text)
+                        xs.append(bbox[0])
+                        ys.append(bbox[1])
+    
+    return texts, xs, ys
+
+
+def _pdfplumber_page_records(path: str, start: int, stop: int, cfg: Config) -> List[List[Record]]:
+    """
+    Extract the records of a range of pages with pdfplumber.
+    
+    Args:
+        path: Path to the PDF file
+        start: Index of the first page
+        stop: Index one past the last page
+        cfg: Configuration
+        
+    Returns:
+        The records of each page
+    """
+    import pdfplumber
+    
+    parser = EnhancedHTMLParser(cfg)
+    pages = []
+    
+    with pdfplumber.open(path) as pdf:
+        strategy = None
+        for i in range(start, stop):
+            records, strategy = parser._extract_page_records(pdf.pages[i], path, i + 1, strategy)
+            pages.append(records)
+    
+    return pages
 
 
 def parse_pdf_via_enhanced_html(path: str, cfg: Config) -> List[Record]:
@@ -724,4 +879,54 @@ def parse_pdf_via_enhanced_html(path: str, cfg: Config) -> List[Record]:
         List of extracted records
     """
     parser = EnhancedHTMLParser(cfg)
-    return parser.parse_pdf(path)
\ No newline at end of file
+    return parser.parse_pdf(path)
+
+# Parser of a batch worker process, created once by _init_batch_worker
+_WORKER_PARSER: Optional[EnhancedHTMLParser] = None
+
+
+def _init_batch_worker(cfg: Config) -> None:
+    """Create the parser reused for every PDF of a batch worker process."""
+    global _WORKER_PARSER
+    _WORKER_PARSER = EnhancedHTMLParser(cfg)
+
+
+def _parse_pdf_in_worker(path: str) -> List[Record]:
+    """Parse a PDF file with the parser of the current batch worker process."""
+    if _WORKER_PARSER is None:
+        raise RuntimeError("Batch worker parser is not initialized; run _init_batch_worker first")
+    return _WORKER_PARSER.parse_pdf(path)
+
+
+def parse_pdfs_via_enhanced_html(paths: List[str], cfg: Config,
+                                 workers: Optional[int] = None) -> Dict[str, List[Record]]:
+    """
+    Parse several PDF files using enhanced HTML extraction methods.
+    
+    Files are parsed in worker processes when ``performance.parallel_files``
+    is enabled, each worker reusing one parser for all of its files.
+    Page-level parallelism is turned off inside the workers so the pools do
+    not nest. Each distinct path is parsed once, so duplicate paths map to
+    a single entry of the result.
+    
+    Args:
+        paths: Paths to the PDF files
+        cfg: Configuration
+        workers: Maximum number of worker processes, by default
+            ``performance.max_workers``
+        
+    Returns:
+        Extracted records of each PDF file, by path
+    """
+    paths = list(dict.fromkeys(paths))
+    workers = min(workers or cfg.performance.max_workers, os.cpu_count() or 1, len(paths))
+    if not cfg.performance.parallel_files or workers < 2:
+        parser = EnhancedHTMLParser(cfg)
+        return {path: parser.parse_pdf(path) for path in paths}
+    
+    worker_cfg = worker_config(cfg)
+    logger.info(f"Parsing {len(paths)} files with {workers} workers")
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_batch_worker, initargs=(worker_cfg,)
+    ) as executor:
+        return dict(zip(paths, executor.map(_parse_pdf_in_worker, paths)))
@@ -2,77 +2,292 @@
 OCR utilities for Texas Extract.
 """
 
+import concurrent.futures
+import functools
+import importlib.util
 import logging
+import os
 import tempfile
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import pdf2image
+    from pdf2image import convert_from_bytes, convert_from_path
+except ImportError:
+    pdf2image = None
+    convert_from_bytes = convert_from_path = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = ImageOps = None
+
+# tesserocr is only imported when its first engine is created, because the
+# OpenMP runtime of libtesseract reads OMP_THREAD_LIMIT as it is loaded
+TESSEROCR_AVAILABLE = importlib.util.find_spec("tesserocr") is not None
+PyTessBaseAPI: Any = None
 
 from arrestx.log import get_logger
 
 logger = get_logger(__name__)
 
+# Most page images read by one Tesseract run, since very long image lists
+# can stall it
+_OCR_BATCH_SIZE = 40
+
+# Gray level from which binarized pixels are white, after stretching the
+# contrast of the page
+_BINARIZE_THRESHOLD = 180
+_BINARIZE_TABLE = [0] * _BINARIZE_THRESHOLD + [255] * (256 - _BINARIZE_THRESHOLD)
+
+# tesserocr engines of this process by language, each keeping its model loaded
+_TESS_APIS: Dict[str, Any] = {}
+
 
 def check_ocr_dependencies() -> bool:
     """
     Check if OCR dependencies are installed.
     
+    The dependencies are imported once with the module, so this only
+    checks that the imports succeeded.
+    
     Returns:
         True if dependencies are installed, False otherwise
     """
-    try:
-        import pdf2image
-        import pytesseract
+    if pdf2image is not None and (TESSEROCR_AVAILABLE or pytesseract is not None):
         return True
-    except ImportError:
-        logger.error("OCR dependencies not installed. Install with: pip install pdf2image pytesseract")
-        return False
+    
+    logger.error("OCR dependencies not installed. Install with: pip install pdf2image pytesseract")
+    return False
 
 
-def apply_ocr_to_image(image, lang: str = "eng") -> str:
+def _get_tess_api(lang: str):
+    """
+    Get the tesserocr engine for a language, creating it on first use.
+    
+    Args:
+        lang: OCR language
+        
+    Returns:
+        PyTessBaseAPI instance for the language
+    """
+    global PyTessBaseAPI
+    api = _TESS_APIS.get(lang)
+    if api is None:
+        if PyTessBaseAPI is None:
+            from tesserocr import PyTessBaseAPI
+        api = _TESS_APIS[lang] = PyTessBaseAPI(lang=lang)
+    return api
+
+
+def binarize_image(image):
+    """
+    Convert an image to black and white for OCR.
+    
+    The image is turned to grayscale, its contrast stretched and every
+    pixel set to black or white, so Tesseract can skip its own
+    thresholding. This suits clean printed pages; poor scans may lose
+    detail.
+    
+    Args:
+        image: Image object or path to an image file
+        
+    Returns:
+        1-bit image
+    """
+    if isinstance(image, str):
+        image = Image.open(image)
+    image = ImageOps.autocontrast(ImageOps.grayscale(image))
+    return image.point(_BINARIZE_TABLE, "1")
+
+
+def apply_ocr_to_image(image, lang: str = "eng", binarize: bool = False) -> str:
     """
     Apply OCR to an image.
     
+    With tesserocr installed, the image is recognized in process by an
+    engine that is reused for every image, instead of starting Tesseract
+    through pytesseract.
+    
     Args:
-        image: Image object
+        image: Image object or path to an image file
         lang: OCR language
+        binarize: Whether to binarize the image before OCR
         
     Returns:
         Extracted text as a string
     """
     try:
-        import pytesseract
+        if binarize:
+            image = binarize_image(image)
+        
+        if TESSEROCR_AVAILABLE:
+            api = _get_tess_api(lang)
+            if isinstance(image, str):
+                api.SetImageFile(image)
+            else:
+                api.SetImage(image)
+            return api.GetUTF8Text()
+        
         return pytesseract.image_to_string(image, lang=lang)
     except Exception as e:
         logger.error(f"Error applying OCR: {e}")
         return ""
 
 
-def convert_pdf_to_images(pdf_path: str, dpi: int = 300) -> list:
+def apply_ocr_to_images(paths: List[str], lang: str = "eng", binarize: bool = False) -> List[str]:
+    """
+    Apply OCR to several image files in a single Tesseract run.
+    
+    Tesseract reads the images from a list file and loads its model once,
+    instead of being started again for every page. Each page of its output
+    ends with a form feed, which separates the texts of the images. With
+    tesserocr the model is already loaded once per process, so the images
+    are recognized one by one.
+    
+    Args:
+        paths: Paths to the image files
+        lang: OCR language
+        binarize: Whether to binarize the images before OCR, rewriting
+            the image files
+        
+    Returns:
+        Extracted text of each image, as apply_ocr_to_image returns it
+    """
+    if TESSEROCR_AVAILABLE or len(paths) < 2:
+        return [apply_ocr_to_image(path, lang, binarize) for path in paths]
+    
+    try:
+        if binarize:
+            for path in paths:
+                binarize_image(path).save(path)
+        
+        fd, list_path = tempfile.mkstemp(suffix=".txt", dir=os.path.dirname(paths[0]) or None)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as list_file:
+                list_file.write("\n".join(paths) + "\n")
+            text = pytesseract.image_to_string(list_path, lang=lang)
+        finally:
+            os.remove(list_path)
+        
+        pages = text.split("\f")
+        if len(pages) == len(paths) + 1 and not pages[-1].strip():
+            return [page + "\f" for page in pages[:-1]]
+        logger.warning("OCR output does not separate the pages, applying OCR page by page")
+    except Exception as e:
+        logger.error(f"Error applying OCR: {e}")
+        return [""] * len(paths)
+    
+    return [apply_ocr_to_image(path, lang) for path in paths]
+
+
+def convert_pdf_to_images(pdf_path: str, dpi: int = 200, output_folder: Optional[str] = None,
+                          grayscale: bool = True, first_page: Optional[int] = None,
+                          last_page: Optional[int] = None,
+                          thread_count: Optional[int] = None) -> list:
     """
     Convert a PDF file to a list of images.
     
+    Pages are rendered by several pdftoppm processes at once, by default
+    leaving one CPU for the rest of the pipeline. 200 DPI grayscale is enough for
+    printed reports and holds less than half the pixel data of 300 DPI
+    color; use a higher DPI for poor scans.
+    
     Args:
         pdf_path: Path to the PDF file
         dpi: DPI for the images
+        output_folder: Folder to write PNG files to, returning their paths
+            instead of holding every page image in memory
+        grayscale: Whether to render grayscale instead of color images
+        first_page: First page to convert, by default the first page of the PDF
+        last_page: Last page to convert, by default the last page of the PDF
+        thread_count: Number of pdftoppm processes
         
     Returns:
-        List of images
+        List of images, or of image file paths with an output folder
     """
     try:
-        from pdf2image import convert_from_path
-        return convert_from_path(pdf_path, dpi=dpi)
+        if thread_count is None:
+            thread_count = max(1, (os.cpu_count() or 1) - 1)
+        if output_folder is None:
+            return convert_from_path(
+                pdf_path, dpi=dpi, thread_count=thread_count, grayscale=grayscale,
+                first_page=first_page, last_page=last_page,
+            )
+        return convert_from_path(
+            pdf_path, dpi=dpi, thread_count=thread_count, grayscale=grayscale,
+            first_page=first_page, last_page=last_page,
+            output_folder=output_folder, fmt="png", paths_only=True,
+        )
     except Exception as e:
         logger.error(f"Error converting PDF to images: {e}")
         return []
 
 
-def ocr_pdf_file(pdf_path: str, lang: str = "eng", dpi: int = 300) -> str:
+def _init_ocr_worker() -> None:
+    """
+    Keep Tesseract to one thread per worker process unless configured otherwise.
+    
+    The limit applies to pytesseract's Tesseract runs and to tesserocr
+    engines, which the worker loads after this runs. A worker forked from a
+    process that had already loaded tesserocr keeps that process's limit.
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def _ocr_pdf_pages(pdf_path: str, first_page: int, last_page: int, lang: str, dpi: int,
+                   grayscale: bool, binarize: bool, thread_count: Optional[int] = None) -> List[str]:
+    """
+    Render a range of PDF pages to image files and apply OCR to them.
+    
+    The image files only exist while their range is recognized.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        first_page: First page of the range
+        last_page: Last page of the range
+        lang: OCR language
+        dpi: DPI for the images
+        grayscale: Whether to render grayscale instead of color images
+        binarize: Whether to binarize the images before OCR
+        thread_count: Number of pdftoppm processes
+        
+    Returns:
+        Extracted text of each page
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = convert_pdf_to_images(
+            pdf_path, dpi, output_folder=temp_dir, grayscale=grayscale,
+            first_page=first_page, last_page=last_page, thread_count=thread_count,
+        )
+        return apply_ocr_to_images(paths, lang, binarize)
+
+
+def ocr_pdf_file(pdf_path: str, lang: str = "eng", dpi: int = 200,
+                 max_workers: Optional[int] = None, grayscale: bool = True,
+                 binarize: bool = False) -> str:
     """
     Apply OCR to a PDF file.
     
+    Pages are rendered and recognized in batches, each read by a single
+    Tesseract run, so only the images of the current batches are on disk
+    at a time. The batches run in parallel worker processes when there is
+    more than one page and CPU. Each worker renders its pages with one
+    pdftoppm process and runs Tesseract single-threaded, so the workers do
+    not compete for cores.
+    
     Args:
         pdf_path: Path to the PDF file
         lang: OCR language
         dpi: DPI for the images
+        max_workers: Maximum number of worker processes, by default the CPU count
+        grayscale: Whether to render grayscale instead of color images
+        binarize: Whether to binarize the images before OCR
         
     Returns:
         Extracted text as a string
@@ -81,23 +296,38 @@ def ocr_pdf_file(pdf_path: str, lang: str = "eng", dpi: int = 300) -> str:
         return ""
     
     try:
-        # Convert PDF to images
-        images = convert_pdf_to_images(pdf_path, dpi)
+        page_count = pdf2image.pdfinfo_from_path(pdf_path)["Pages"]
         
-        # Apply OCR to each image
-        text = ""
-        for i, image in enumerate(images):
-            logger.debug(f"Applying OCR to page {i+1}")
-            page_text = apply_ocr_to_image(image, lang)
-            text += page_text + "\n\n"
-            
-        return text
+        # Split the pages into ranges, at least one per worker
+        workers = min(max_workers or os.cpu_count() or 1, page_count)
+        batch_size = min(_OCR_BATCH_SIZE, -(-page_count // max(workers, 1))) or 1
+        first_pages = range(1, page_count + 1, batch_size)
+        last_pages = [min(first + batch_size - 1, page_count) for first in first_pages]
+        page_texts = []
+        if workers < 2:
+            for first, last in zip(first_pages, last_pages):
+                logger.debug(f"Applying OCR to pages {first}-{last}")
+                page_texts.extend(_ocr_pdf_pages(pdf_path, first, last, lang, dpi, grayscale, binarize))
+        else:
+            logger.debug(f"Applying OCR to {page_count} pages with {workers} workers")
+            ocr_pages = functools.partial(
+                _ocr_pdf_pages, pdf_path, lang=lang, dpi=dpi, grayscale=grayscale,
+                binarize=binarize, thread_count=1,
+            )
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_ocr_worker
+            ) as executor:
+                for texts in executor.map(ocr_pages, first_pages, last_pages):
+                    page_texts.extend(texts)
+        
+        return "".join(page_text + "\n\n" for page_text in page_texts)
     except Exception as e:
         logger.error(f"Error applying OCR to PDF: {e}")
         return ""
 
 
-def ocr_pdf_page(page, lang: str = "eng", dpi: int = 300) -> str:
+def ocr_pdf_page(page, lang: str = "eng", dpi: int = 200, grayscale: bool = True,
+                 binarize: bool = False) -> str:
     """
     Apply OCR to a PDF page.
     
@@ -105,6 +335,8 @@ def ocr_pdf_page(page, lang: str = "eng", dpi: int = 300) -> str:
         page: PDF page object
         lang: OCR language
         dpi: DPI for the image
+        grayscale: Whether to render a grayscale instead of a color image
+        binarize: Whether to binarize the image before OCR
         
     Returns:
         Extracted text as a string
@@ -113,18 +345,11 @@ def ocr_pdf_page(page, lang: str = "eng", dpi: int = 300) -> str:
         return ""
     
     try:
-        # Import OCR dependencies
-        from pdf2image import convert_from_bytes
-        
         # Convert page to image
-        images = convert_from_bytes(page.raw_page.data, dpi=dpi)
+        images = convert_from_bytes(page.raw_page.data, dpi=dpi, grayscale=grayscale)
         
         # Apply OCR to the image
-        text = ""
-        for image in images:
-            text += apply_ocr_to_image(image, lang) + "\n"
-            
-        return text
+        return "".join(apply_ocr_to_image(image, lang, binarize) + "\n" for image in images)
     except Exception as e:
         logger.error(f"Error applying OCR to page: {e}")
         return ""
\ No newline at end of file
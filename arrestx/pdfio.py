@@ -4,8 +4,9 @@ PDF I/O utilities for Texas Extract.
 
 import concurrent.futures
 import logging
+import os
 import re
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, TypeVar
 
 import pdfplumber
 
@@ -15,6 +16,8 @@ from arrestx.model import ParseError
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
 
 def extract_lines_from_pdf(path: str, cfg: Config) -> List[List[str]]:
     """
@@ -79,6 +82,45 @@ def extract_lines_from_pdf_sequential(path: str, cfg: Config) -> List[List[str]]
     return lines_per_page
 
 
+def map_page_ranges(
+    func: Callable[..., _T],
+    path: str,
+    page_count: int,
+    cfg: Config,
+    *args: Any,
+) -> List[_T]:
+    """
+    Apply a page range function to all pages of a PDF, in parallel when configured.
+    
+    Pages are split into contiguous ranges, one per worker process, and each
+    worker opens the PDF itself since page objects cannot be pickled. When
+    page parallelism is disabled or only one worker would run, the function
+    is called once in-process for all pages instead of starting a pool.
+    
+    Args:
+        func: Function called as ``func(path, start, stop, *args)`` for the
+            pages [start, stop)
+        path: Path to the PDF file
+        page_count: Number of pages in the PDF
+        cfg: Configuration
+        *args: Extra arguments passed to func
+        
+    Returns:
+        Results of func for each range of pages, in page order
+    """
+    workers = max(1, min(cfg.performance.max_workers, os.cpu_count() or 1, page_count))
+    if not cfg.performance.parallel_pages or workers == 1:
+        return [func(path, 0, page_count, *args)]
+    
+    chunk_size = -(-page_count // workers)  # ceiling division
+    starts = list(range(0, page_count, chunk_size))
+    stops = [min(start + chunk_size, page_count) for start in starts]
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        extra = [[arg] * len(starts) for arg in args]
+        return list(executor.map(func, [path] * len(starts), starts, stops, *extra))
+
+
 def extract_lines_from_pdf_parallel(path: str, cfg: Config) -> List[List[str]]:
     """
     Extract text lines from each page of a PDF in parallel.
@@ -90,17 +132,17 @@ def extract_lines_from_pdf_parallel(path: str, cfg: Config) -> List[List[str]]:
     Returns:
         List of lists, where each inner list contains lines from one page
     """
-    # Use pdfplumber to extract text
     with pdfplumber.open(path) as pdf:
-        pages = list(pdf.pages)
-        
-        # Process pages in parallel
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            results = list(executor.map(
-                lambda p: process_page(p, cfg),
-                [(i+1, page) for i, page in enumerate(pages)]
-            ))
-            
+        page_count = len(pdf.pages)
+    
+    if page_count == 0:
+        return []
+    
+    # Process page ranges in parallel
+    chunks = map_page_ranges(_process_page_range, path, page_count, cfg, cfg)
+    
+    results = [result for chunk in chunks for result in chunk]
+    
     # Sort results by page number
     results.sort(key=lambda x: x[0])
     
@@ -108,6 +150,23 @@ def extract_lines_from_pdf_parallel(path: str, cfg: Config) -> List[List[str]]:
     return [lines for _, lines in results]
 
 
+def _process_page_range(path: str, start: int, stop: int, cfg: Config) -> List[tuple]:
+    """
+    Process a contiguous range of pages in a worker process.
+    
+    Args:
+        path: Path to the PDF file
+        start: Index of the first page to process
+        stop: Index one past the last page to process
+        cfg: Application configuration
+        
+    Returns:
+        List of (page_num, lines) tuples
+    """
+    with pdfplumber.open(path) as pdf:
+        return [process_page((i + 1, pdf.pages[i]), cfg) for i in range(start, stop)]
+
+
 def process_page(page_info: tuple, cfg: Config) -> tuple:
     """
     Process a single page.
@@ -261,11 +320,7 @@ def apply_ocr_to_page(page, lang: str) -> str:
         images = convert_from_bytes(page.raw_page.data)
         
         # Apply OCR to each image
-        text = ""
-        for image in images:
-            text += pytesseract.image_to_string(image, lang=lang) + "\n"
-            
-        return text
+        return "".join(pytesseract.image_to_string(image, lang=lang) + "\n" for image in images)
     except ImportError:
         logger.error("OCR dependencies not installed. Install with: pip install pdf2image pytesseract")
         return ""
@@ -285,8 +340,8 @@ def preprocess_lines(lines_per_page: List[List[str]], cfg: Config) -> List[str]:
     Returns:
         Single list of processed lines
     """
-    # Compile header/footer patterns
-    header_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in cfg.parsing.header_patterns]
+    # Header/footer patterns fused into one compiled regex
+    header_regex = cfg.parsing.header_regex
     
     # Flatten and process lines
     processed_lines = []
@@ -302,7 +357,7 @@ def preprocess_lines(lines_per_page: List[List[str]], cfg: Config) -> List[str]:
                 
         for line in page_lines:
             # Skip headers and footers
-            if any(pattern.search(line) for pattern in header_patterns):
+            if header_regex.search(line):
                 logger.debug(f"Skipping header/footer: {line}")
                 continue
             
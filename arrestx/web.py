@@ -13,6 +13,12 @@ from typing import Dict, Optional, Union
 import requests
 from pdfplumber import PDF, open as pdf_open
 
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 from arrestx.config import Config
 from arrestx.log import get_logger
 from arrestx.model import ArrestXError, WebRetrievalError
@@ -26,6 +32,31 @@ class WebRetrievalError(ArrestXError):
     pass
 
 
+def _extract_first_page_text(pdf_path: str) -> Optional[str]:
+    """
+    Extract the plain text of the first page of a PDF file.
+    
+    Uses PyMuPDF when available, which is several times faster than
+    pdfplumber for plain text, and falls back to pdfplumber otherwise.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Text of the first page, or None if the PDF has no pages
+    """
+    if PYMUPDF_AVAILABLE:
+        with fitz.open(pdf_path) as doc:
+            if doc.page_count > 0:
+                return doc.load_page(0).get_text("text")
+        return None
+    
+    with pdf_open(pdf_path) as pdf:
+        if len(pdf.pages) > 0:
+            return pdf.pages[0].extract_text()
+    return None
+
+
 def extract_report_date(pdf_path: str) -> Optional[str]:
     """
     Extract the report date from a PDF file.
@@ -37,25 +68,22 @@ def extract_report_date(pdf_path: str) -> Optional[str]:
         Report date in YYYY-MM-DD format or None if not found
     """
     try:
-        with pdf_open(pdf_path) as pdf:
-            # Check first page for report date
-            if len(pdf.pages) > 0:
-                first_page = pdf.pages[0]
-                text = first_page.extract_text()
-                
-                # Look for "Report Date: MM/DD/YYYY" pattern
-                date_match = re.search(r"Report Date:\s+(\d{1,2})/(\d{1,2})/(\d{4})", text)
-                if date_match:
-                    month, day, year = date_match.groups()
-                    # Normalize to YYYY-MM-DD
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                
-                # Alternative pattern: "MM/DD/YYYY" standalone
-                alt_match = re.search(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b", text)
-                if alt_match:
-                    month, day, year = alt_match.groups()
-                    # Normalize to YYYY-MM-DD
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+        # Check first page for report date
+        text = _extract_first_page_text(pdf_path)
+        if text:
+            # Look for "Report Date: MM/DD/YYYY" pattern
+            date_match = re.search(r"Report Date:\s+(\d{1,2})/(\d{1,2})/(\d{4})", text)
+            if date_match:
+                month, day, year = date_match.groups()
+                # Normalize to YYYY-MM-DD
+                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+            
+            # Alternative pattern: "MM/DD/YYYY" standalone
+            alt_match = re.search(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b", text)
+            if alt_match:
+                month, day, year = alt_match.groups()
+                # Normalize to YYYY-MM-DD
+                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
     except Exception as e:
         logger.warning(f"Failed to extract report date: {e}")
     
@@ -2,12 +2,19 @@
 Output writers for Texas Extract.
 """
 
+import contextlib
 import csv
 import hashlib
 import json
 import os
 import re
-from typing import Dict, List, Optional
+from typing import IO, Any, BinaryIO, ClassVar, Dict, Iterable, List, Optional, TextIO, Tuple, Type
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from arrestx.config import Config
 from arrestx.log import get_logger
@@ -16,147 +23,338 @@ from arrestx.model import OutputError, Record
 logger = get_logger(__name__)
 
 
-def write_outputs(records: List[Record], cfg: Config) -> None:
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise.
+    
+    Args:
+        obj: Object to serialize
+        pretty: Whether to indent the output by two spaces
+        
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode("utf-8")
+
+
+class _RecordWriter:
+    """Base class for the incremental record writers."""
+
+    format: ClassVar[str]
+    binary: ClassVar[bool]
+
+    def __init__(self, f: Any, *args: Any):
+        self.count = 0
+
+    def write(self, record: Record) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def summary(self) -> str:
+        raise NotImplementedError
+
+
+# (writer class, path, extra writer arguments) for one output
+_Output = Tuple[Type[_RecordWriter], str, Tuple[Any, ...]]
+
+
+class _JsonWriter(_RecordWriter):
+    """Incrementally write records as a JSON array."""
+
+    format = "JSON"
+    binary = True
+
+    def __init__(self, f: BinaryIO, pretty: bool = True):
+        self._f = f
+        self._pretty = pretty
+        # Match the element separator of _dumps on a whole list
+        self._separator = b"," if ORJSON_AVAILABLE or pretty else b", "
+        self.count = 0
+        f.write(b"[")
+
+    def write(self, record: Record) -> None:
+        data = _dumps(record, self._pretty)
+        if self._pretty:
+            data = b"\n  " + data.replace(b"\n", b"\n  ")
+        if self.count:
+            data = self._separator + data
+        self._f.write(data)
+        self.count += 1
+
+    def close(self) -> None:
+        self._f.write(b"\n]" if self._pretty and self.count else b"]")
+
+    def summary(self) -> str:
+        return f"{self.count} records"
+
+
+class _CsvWriter(_RecordWriter):
+    """Incrementally write records as CSV rows, one row per charge."""
+
+    format = "CSV"
+    binary = False
+    fieldnames = ['name', 'identifier', 'book_in_date', 'booking_no',
+                  'description', 'address', 'source_file']
+
+    def __init__(self, f: TextIO):
+        self._writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+        self._writer.writeheader()
+        self.count = 0
+
+    def write(self, record: Record) -> None:
+        # Join address lines with pipe separator
+        address = " | ".join(record.get("address", []))
+
+        # Write one row per charge
+        for charge in record.get("charges", []):
+            self._writer.writerow({
+                'name': record.get("name", ""),
+                'identifier': record.get("identifier", ""),
+                'book_in_date': record.get("book_in_date", ""),
+                'booking_no': charge.get("booking_no", ""),
+                'description': charge.get("description", ""),
+                'address': address,
+                'source_file': record.get("source_file", "")
+            })
+            self.count += 1
+
+    def summary(self) -> str:
+        return f"{self.count} rows"
+
+
+class _NdjsonWriter(_RecordWriter):
+    """Incrementally write records as NDJSON lines."""
+
+    format = "NDJSON"
+    binary = True
+
+    def __init__(self, f: BinaryIO, denormalize: bool = False):
+        self._f = f
+        self._denormalize = denormalize
+        self.count = 0
+
+    def write(self, record: Record) -> None:
+        if self._denormalize:
+            # Denormalized format (one line per charge)
+            base_record = {k: v for k, v in record.items() if k != 'charges'}
+            for charge in record.get("charges", []):
+                line_record = base_record.copy()
+                line_record["charge"] = charge
+                self._f.write(_dumps(line_record) + b'\n')
+                self.count += 1
+        else:
+            # Normalized format (one line per record)
+            self._f.write(_dumps(record) + b'\n')
+            self.count += 1
+
+    def summary(self) -> str:
+        return f"{self.count} lines"
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _open_writer(stack: contextlib.ExitStack, writer_cls: Type[_RecordWriter], path: str,
+                 *args: Any) -> Tuple[str, _RecordWriter]:
+    """
+    Open a temporary file next to an output file and wrap it in a record writer.
+    
+    Args:
+        stack: Exit stack that owns the open file
+        writer_cls: Record writer class
+        path: Output file path
+        *args: Extra arguments for the writer
+        
+    Returns:
+        Tuple of (temporary file path, record writer)
+    """
+    logger.info(f"Writing {writer_cls.format} to {path}")
+    
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # Create output directory if it doesn't exist
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        f: IO[Any]
+        if writer_cls.binary:
+            f = stack.enter_context(open(temp_path, 'wb'))
+        else:
+            f = stack.enter_context(open(temp_path, 'w', encoding='utf-8', newline=''))
+        return temp_path, writer_cls(f, *args)
+    except Exception as e:
+        _remove_file(temp_path)
+        logger.error(f"Error writing {writer_cls.format} to {path}: {e}")
+        raise OutputError(f"Error writing {writer_cls.format} to {path}: {e}")
+
+
+def _write_records(records: Iterable[Record], outputs: List[_Output], validate: bool = False) -> int:
+    """
+    Write records to one or more outputs in a single pass.
+    
+    Each output is written to a temporary file in its directory and only
+    moved over the output file once every record has been written, so an
+    error while producing the records leaves existing outputs untouched.
+    
+    Args:
+        records: Records to write; consumed once, so any iterable works
+        outputs: (writer class, path, writer args) for each output
+        validate: Whether to log validation warnings for each record
+        
+    Returns:
+        Number of records consumed
+    """
+    count = 0
+    writers: List[Tuple[str, str, _RecordWriter]] = []
+    try:
+        with contextlib.ExitStack() as stack:
+            for writer_cls, path, args in outputs:
+                writers.append((path, *_open_writer(stack, writer_cls, path, *args)))
+            
+            for i, record in enumerate(records):
+                if validate:
+                    for error in _record_errors(i, record):
+                        logger.warning(f"Validation error: {error}")
+                
+                for path, _, writer in writers:
+                    try:
+                        writer.write(record)
+                    except Exception as e:
+                        logger.error(f"Error writing {writer.format} to {path}: {e}")
+                        raise OutputError(f"Error writing {writer.format} to {path}: {e}")
+                count += 1
+            
+            for _, _, writer in writers:
+                writer.close()
+        
+        # All files are complete and closed; move them into place
+        for path, temp_path, writer in writers:
+            try:
+                os.replace(temp_path, path)
+            except OSError as e:
+                logger.error(f"Error writing {writer.format} to {path}: {e}")
+                raise OutputError(f"Error writing {writer.format} to {path}: {e}")
+    finally:
+        for _, temp_path, _ in writers:
+            _remove_file(temp_path)
+    
+    for path, _, writer in writers:
+        logger.info(f"Wrote {writer.summary()} to {path}")
+    return count
+
+
+def write_outputs(records: Iterable[Record], cfg: Config) -> int:
     """
     Write records to all configured output formats.
     
+    Records are consumed in a single pass, so a generator can be written
+    without holding every record in memory.
+    
     Args:
-        records: List of records to write
+        records: Records to write
         cfg: Application configuration
+        
+    Returns:
+        Number of records written
     """
-    logger.info(f"Writing {len(records)} records to outputs")
+    logger.info("Writing records to outputs")
     
-    # Validate records
-    validation_errors = validate_records(records)
-    if validation_errors:
-        for error in validation_errors:
-            logger.warning(f"Validation error: {error}")
+    outputs: List[_Output] = []
     
     # Write JSON if configured
     if cfg.output.json_path:
-        write_json(records, cfg.output.json_path, cfg.output.pretty_json)
+        outputs.append((_JsonWriter, cfg.output.json_path, (cfg.output.pretty_json,)))
         
     # Write CSV if configured
     if cfg.output.csv_path:
-        write_csv(records, cfg.output.csv_path)
+        outputs.append((_CsvWriter, cfg.output.csv_path, ()))
         
     # Write NDJSON if configured
     if cfg.output.ndjson_path:
-        write_ndjson(records, cfg.output.ndjson_path)
+        outputs.append((_NdjsonWriter, cfg.output.ndjson_path, ()))
+    
+    return _write_records(records, outputs, validate=True)
 
 
-def write_json(records: List[Record], path: str, pretty: bool = True) -> None:
+def write_json(records: Iterable[Record], path: str, pretty: bool = True) -> None:
     """
     Write records to a JSON file.
     
     Args:
-        records: List of records to write
+        records: Records to write
         path: Output file path
         pretty: Whether to pretty-print the JSON
     """
-    logger.info(f"Writing JSON to {path}")
-    
-    try:
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-        
-        # Write JSON file
-        with open(path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(records, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(records, f, ensure_ascii=False)
-                
-        logger.info(f"Wrote {len(records)} records to {path}")
-    except Exception as e:
-        logger.error(f"Error writing JSON to {path}: {e}")
-        raise OutputError(f"Error writing JSON to {path}: {e}")
+    _write_records(records, [(_JsonWriter, path, (pretty,))])
 
 
-def write_csv(records: List[Record], path: str) -> None:
+def write_csv(records: Iterable[Record], path: str) -> None:
     """
     Write records to a CSV file.
     
     Args:
-        records: List of records to write
+        records: Records to write
         path: Output file path
     """
-    logger.info(f"Writing CSV to {path}")
-    
-    try:
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-        
-        # Define CSV columns
-        fieldnames = ['name', 'identifier', 'book_in_date', 'booking_no', 
-                     'description', 'address', 'source_file']
-        
-        # Write CSV file
-        with open(path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            row_count = 0
-            for record in records:
-                # Join address lines with pipe separator
-                address = " | ".join(record.get("address", []))
-                
-                # Write one row per charge
-                for charge in record.get("charges", []):
-                    writer.writerow({
-                        'name': record.get("name", ""),
-                        'identifier': record.get("identifier", ""),
-                        'book_in_date': record.get("book_in_date", ""),
-                        'booking_no': charge.get("booking_no", ""),
-                        'description': charge.get("description", ""),
-                        'address': address,
-                        'source_file': record.get("source_file", "")
-                    })
-                    row_count += 1
-                    
-        logger.info(f"Wrote {row_count} rows to {path}")
-    except Exception as e:
-        logger.error(f"Error writing CSV to {path}: {e}")
-        raise OutputError(f"Error writing CSV to {path}: {e}")
+    _write_records(records, [(_CsvWriter, path, ())])
 
 
-def write_ndjson(records: List[Record], path: str, denormalize: bool = False) -> None:
+def write_ndjson(records: Iterable[Record], path: str, denormalize: bool = False) -> None:
     """
     Write records to an NDJSON file.
     
     Args:
-        records: List of records to write
+        records: Records to write
         path: Output file path
         denormalize: Whether to denormalize records (one line per charge)
     """
-    logger.info(f"Writing NDJSON to {path}")
+    _write_records(records, [(_NdjsonWriter, path, (denormalize,))])
+
+
+def _record_errors(i: int, record: Record) -> List[str]:
+    """
+    Validate a single record.
     
-    try:
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    Args:
+        i: Index of the record
+        record: Record to validate
         
-        # Write NDJSON file
-        with open(path, 'w', encoding='utf-8') as f:
-            line_count = 0
-            if denormalize:
-                # Denormalized format (one line per charge)
-                for record in records:
-                    base_record = {k: v for k, v in record.items() if k != 'charges'}
-                    for charge in record.get("charges", []):
-                        line_record = base_record.copy()
-                        line_record["charge"] = charge
-                        f.write(json.dumps(line_record, ensure_ascii=False) + '\n')
-                        line_count += 1
-            else:
-                # Normalized format (one line per record)
-                for record in records:
-                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
-                    line_count += 1
-                    
-        logger.info(f"Wrote {line_count} lines to {path}")
-    except Exception as e:
-        logger.error(f"Error writing NDJSON to {path}: {e}")
-        raise OutputError(f"Error writing NDJSON to {path}: {e}")
+    Returns:
+        List of validation errors
+    """
+    errors = []
+    
+    # Validate required fields
+    if not record.get("name"):
+        errors.append(f"Record {i}: Missing name")
+        
+    # Validate booking numbers
+    for j, charge in enumerate(record.get("charges", [])):
+        booking_no = charge.get("booking_no", "")
+        if not re.match(r"^\d{2}-\d{6,7}$", booking_no):
+            errors.append(f"Record {i}, Charge {j}: Invalid booking number format: {booking_no}")
+            
+        if not charge.get("description"):
+            errors.append(f"Record {i}, Charge {j}: Missing charge description")
+            
+    # Validate date format
+    book_in_date = record.get("book_in_date")
+    if book_in_date and not re.match(r"^\d{4}-\d{2}-\d{2}$", book_in_date):
+        errors.append(f"Record {i}: Invalid book-in date format: {book_in_date}")
+        
+    return errors
 
 
 def validate_records(records: List[Record]) -> List[str]:
@@ -172,23 +370,7 @@ def validate_records(records: List[Record]) -> List[str]:
     errors = []
     
     for i, record in enumerate(records):
-        # Validate required fields
-        if not record.get("name"):
-            errors.append(f"Record {i}: Missing name")
-            
-        # Validate booking numbers
-        for j, charge in enumerate(record.get("charges", [])):
-            booking_no = charge.get("booking_no", "")
-            if not re.match(r"^\d{2}-\d{6,7}$", booking_no):
-                errors.append(f"Record {i}, Charge {j}: Invalid booking number format: {booking_no}")
-                
-            if not charge.get("description"):
-                errors.append(f"Record {i}, Charge {j}: Missing charge description")
-                
-        # Validate date format
-        book_in_date = record.get("book_in_date")
-        if book_in_date and not re.match(r"^\d{4}-\d{2}-\d{2}$", book_in_date):
-            errors.append(f"Record {i}: Invalid book-in date format: {book_in_date}")
+        errors.extend(_record_errors(i, record))
             
     return errors
 
@@ -0,0 +1,236 @@
+"""
+Tests for the API module.
+"""
+
+import datetime
+import os
+from unittest.mock import patch
+
+import pytest
+
+from arrestx import api
+from arrestx.api import (
+    Alert,
+    SearchResult,
+    name_matches,
+    name_matches_tokens,
+    normalize_name,
+    search_name,
+)
+from arrestx.config import Config
+
+
+@pytest.fixture(autouse=True)
+def clear_parsed_cache():
+    """Ensure each test starts with an empty parsed report cache."""
+    api._PARSED_CACHE.clear()
+    api._REPORT_DATE_CACHE.clear()
+    yield
+    api._PARSED_CACHE.clear()
+    api._REPORT_DATE_CACHE.clear()
+
+
+@pytest.fixture
+def report_dir(tmp_path, monkeypatch):
+    """Create a working directory containing a placeholder current report."""
+    os.makedirs(tmp_path / "reports")
+    (tmp_path / "reports" / "01.PDF").write_bytes(b"%PDF-1.5\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_normalize_name():
+    """Test normalizing names in both supported formats."""
+    assert normalize_name("SMITH, JOHN  MICHAEL") == "john michael smith"
+    assert normalize_name("  John   Smith ") == "john smith"
+
+
+def test_name_matches():
+    """Test matching record names against search names."""
+    assert name_matches("SMITH, JOHN", "John Smith")
+    assert name_matches("John Michael Smith", "John Smith")
+    assert name_matches("John Smith", "smith")
+    assert not name_matches("John Smith", "Jane Smith")
+    assert not name_matches("John Smith", "")
+
+
+def test_name_matches_tokens():
+    """Test matching pre-split name tokens."""
+    parts = frozenset(["john", "michael", "smith"])
+    assert name_matches_tokens(parts, "john", "smith")
+    assert name_matches_tokens(parts, "michael", "michael")
+    assert not name_matches_tokens(parts, "jane", "smith")
+    assert not name_matches_tokens(parts, "", "")
+    assert name_matches_tokens(frozenset(), "", "")
+
+
+@patch("arrestx.api.extract_report_date", return_value="2025-01-02")
+@patch("arrestx.api.is_report_current", return_value=True)
+@patch("arrestx.api.parse_pdf")
+def test_search_name(mock_parse_pdf, mock_current, mock_date, report_dir, sample_records):
+    """Test searching for a name in the current report."""
+    mock_parse_pdf.return_value = sample_records
+
+    result = search_name("John Smith", Config())
+
+    assert result.records_checked == len(sample_records)
+    assert len(result.alerts) == 1
+    assert result.alerts[0].name == "SMITH, JOHN"
+    assert result.alerts[0].booking_no == "25-0123456"
+    assert result.last_update == datetime.date(2025, 1, 2)
+
+
+@patch("arrestx.api.extract_report_date", return_value="2025-01-02")
+@patch("arrestx.api.is_report_current", return_value=True)
+@patch("arrestx.api.parse_pdf")
+def test_search_name_no_match(mock_parse_pdf, mock_current, mock_date, report_dir, sample_records):
+    """Test searching for a name that is not in the current report."""
+    mock_parse_pdf.return_value = sample_records
+
+    result = search_name("Nobody Here", Config())
+
+    assert result.alerts == []
+    assert "No matches found" in result.get_due_diligence_message()
+
+
+@patch("arrestx.api.extract_report_date", return_value="2025-01-02")
+@patch("arrestx.api.is_report_current", return_value=True)
+@patch("arrestx.api.parse_pdf")
+def test_search_name_reuses_parsed_report(mock_parse_pdf, mock_current, mock_date, report_dir, sample_records):
+    """Test that repeated searches only parse an unchanged report once."""
+    mock_parse_pdf.return_value = sample_records
+
+    search_name("John Smith", Config())
+    result = search_name("Mary Johnson", Config())
+
+    assert mock_parse_pdf.call_count == 1
+    assert mock_date.call_count == 1
+    assert {alert.name for alert in result.alerts} == {"JOHNSON, MARY"}
+
+    # Modifying the report invalidates the cache
+    (report_dir / "reports" / "01.PDF").write_bytes(b"%PDF-1.5\nupdated\n")
+    search_name("John Smith", Config())
+
+    assert mock_parse_pdf.call_count == 2
+    assert mock_date.call_count == 2
+
+    # Different parse settings invalidate the cache
+    cfg = Config()
+    cfg.parsing.name_regex_strict = False
+    search_name("John Smith", cfg)
+
+    assert mock_parse_pdf.call_count == 3
+    assert mock_parse_pdf.call_args.args[1] is cfg
+
+
+def test_build_token_index(sample_records):
+    """Test building the inverted name token index."""
+    index = api._build_token_index([api._SearchRecord(record) for record in sample_records])
+
+    assert index["smith"] == {0}
+    assert index["mary"] == {1}
+    assert index["john"] & index["smith"] == {0}
+
+
+def test_archive_file_date():
+    """Test extracting report dates from archived report filenames."""
+    assert api._archive_file_date("01_2025-10-15.PDF") == datetime.date(2025, 10, 15)
+    assert api._archive_file_date("01_2025-10-15.pdf") == datetime.date(2025, 10, 15)
+    assert api._archive_file_date("01.PDF") is None
+    assert api._archive_file_date("01_2025-13-45.PDF") is None
+    assert api._archive_file_date("01_2025-W42-3.PDF") is None
+    assert api._archive_file_date("01_2025-10-15.txt") is None
+
+
+def test_to_enterprise_format():
+    """Test converting a search result to enterprise events."""
+    alerts = [
+        Alert("SMITH, JOHN MICHAEL", "25-0123456", "NO VALID DL", "12345678", "2025-01-02", "01.PDF"),
+        Alert("John Smith", "25-0123457", "THEFT", "12345678", "", "01.PDF"),
+    ]
+    result = SearchResult("John Smith", alerts, 10, datetime.date(2025, 1, 2), person_bio="PB-1")
+
+    data = result.to_enterprise_format()
+
+    assert data["summary"]["personBio"] == "PB-1"
+    assert data["summary"]["totalMatches"] == 2
+    events = data["events"]
+    assert len(events) == 2
+
+    fields = {f["field"]: f for f in events[0]["aliasMatch"]["fields"]}
+    assert fields["firstName"]["fromIdentityValue"] == "JOHN"
+    assert fields["lastName"]["fromIdentityValue"] == "SMITH"
+    assert fields["middleName"]["fromEventValue"] == "MICHAEL"
+    assert events[0]["metadata"]["when"]["sortable"] == 20250102
+    assert events[0]["dto"]["personBio"] == {"$ref": "person_bio", "$id": "PB-1"}
+
+    fields = {f["field"]: f for f in events[1]["aliasMatch"]["fields"]}
+    assert fields["firstName"]["fromEventValue"] == "JOHN"
+    assert fields["lastName"]["fromEventValue"] == "SMITH"
+    assert "middleName" not in fields
+    assert events[1]["metadata"]["when"]["sortable"] is None
+
+    ids = [e["_id"] for e in events] + [e["dto"]["_id"] for e in events]
+    assert len(set(ids)) == len(ids)
+    assert all(len(i) == 19 for i in ids)
+
+
+@patch("arrestx.api.extract_report_date", return_value="2025-01-02")
+@patch("arrestx.api.is_report_current", return_value=True)
+@patch("arrestx.api.parse_pdf")
+def test_search_name_max_results(mock_parse_pdf, mock_current, mock_date, report_dir, sample_records):
+    """Test limiting the number of alerts collected by a search."""
+    mock_parse_pdf.return_value = sample_records
+
+    assert len(search_name("Mary Johnson", Config()).alerts) == 2
+
+    result = search_name("Mary Johnson", Config(), max_results=1)
+
+    assert len(result.alerts) == 1
+    assert result.alerts[0].name == "JOHNSON, MARY"
+    assert result.records_checked == len(sample_records)
+
+
+def test_to_enterprise_format_independent_events():
+    """Test that modifying a returned event does not affect other events."""
+    alerts = [Alert("SMITH, JOHN", f"25-012345{i}", "THEFT", "12345678", "2025-01-02", "01.PDF") for i in range(2)]
+    result = SearchResult("John Smith", alerts, 10, person_bio="PB-1")
+    
+    first, second = result.to_enterprise_format()["events"]
+    first["providerInfo"]["serviceName"] = "changed"
+    first["metadata"]["where"]["city"] = "changed"
+    first["aliasMatch"]["matchingMethods"]["firstName"] = "changed"
+    first["aliasMatch"]["fields"][0]["methods"].append("changed")
+    first["personBio"]["$id"] = "changed"
+    
+    assert second["providerInfo"]["serviceName"] == "arrestSearch"
+    assert second["metadata"]["where"]["city"] == "Fort Worth"
+    assert second["aliasMatch"]["matchingMethods"]["firstName"] == "stringExactMatch"
+    assert second["aliasMatch"]["fields"][0]["methods"] == ["stringExactMatch"]
+    assert first["dto"]["personBio"]["$id"] == "PB-1"
+    
+    event = result.to_enterprise_format()["events"][0]
+    assert event["providerInfo"]["serviceName"] == "arrestSearch"
+    assert event["metadata"]["stage"] == {"started": "Arrest/Booking"}
+
+
+def test_split_display_name():
+    """Test splitting display names into first, middle and last name."""
+    assert api._split_display_name("SMITH, JOHN MICHAEL") == ("JOHN", "MICHAEL", "SMITH")
+    assert api._split_display_name("SMITH, JOHN") == ("JOHN", "", "SMITH")
+    assert api._split_display_name("John Paul Jones Smith") == ("John", "Paul Jones", "Smith")
+    assert api._split_display_name("Cher") == ("Cher", "", "")
+    assert api._split_display_name("") == ("", "", "")
+
+
+@patch("arrestx.api.get_current_report_date", return_value=datetime.date(2025, 10, 1))
+def test_get_latest_report_date(mock_current, tmp_path, monkeypatch):
+    """Test finding the latest date among current and archived reports."""
+    archive_dir = tmp_path / "reports" / "archive"
+    os.makedirs(archive_dir)
+    for name in ["01_2025-09-30.PDF", "01_2025-10-15.PDF", "notes.txt"]:
+        (archive_dir / name).write_bytes(b"")
+    os.makedirs(archive_dir / "01_2025-12-31.PDF")  # Directories are ignored
+    monkeypatch.chdir(tmp_path)
+
+    assert api.get_latest_report_date() == datetime.date(2025, 10, 15)
@@ -2,17 +2,28 @@
 Tests for the CLI module.
 """
 
+import json
+import logging
 import os
 import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from arrestx.cli import main
+from arrestx.cli import (
+    build_parser,
+    find_input_files,
+    main,
+    parse_files,
+    parse_search_fast_path,
+    print_json,
+    setup_logging,
+)
+from arrestx.config import Config, PerformanceConfig
 
 
-@patch("arrestx.cli.parse_pdf")
-@patch("arrestx.cli.write_outputs")
+@patch("arrestx.parser.parse_pdf")
+@patch("arrestx.writers.write_outputs")
 @patch("sys.argv", ["arrestx", "--in", "test.pdf", "--json", "out.json"])
 def test_main_basic(mock_write_outputs, mock_parse_pdf):
     """Test basic CLI functionality."""
@@ -23,6 +34,8 @@ def test_main_basic(mock_write_outputs, mock_parse_pdf):
     try:
         # Mock parse_pdf to return a list of records
         mock_parse_pdf.return_value = [{"name": "Test"}]
+        written = []
+        mock_write_outputs.side_effect = lambda records, config: written.extend(records) or len(written)
         
         # Run the CLI
         result = main()
@@ -36,14 +49,14 @@ def test_main_basic(mock_write_outputs, mock_parse_pdf):
         
         # Verify write_outputs was called
         mock_write_outputs.assert_called_once()
-        assert mock_write_outputs.call_args[0][0] == [{"name": "Test"}]
+        assert written == [{"name": "Test"}]
     finally:
         # Clean up
         if os.path.exists("test.pdf"):
             os.unlink("test.pdf")
 
 
-@patch("arrestx.cli.parse_pdf", side_effect=Exception("Test error"))
+@patch("arrestx.parser.parse_pdf", side_effect=Exception("Test error"))
 @patch("sys.argv", ["arrestx", "--in", "test.pdf", "--json", "out.json"])
 def test_main_error(mock_parse_pdf):
     """Test CLI error handling."""
@@ -73,7 +86,7 @@ def test_main_no_input_files():
     assert result == 1
 
 
-@patch("arrestx.cli.process_daily_report")
+@patch("arrestx.web.process_daily_report")
 @patch("sys.argv", ["arrestx", "fetch", "--url", "https://example.com/test.pdf"])
 def test_fetch_command(mock_process_daily_report):
     """Test fetch command."""
@@ -94,7 +107,7 @@ def test_fetch_command(mock_process_daily_report):
     assert mock_process_daily_report.call_args[0][0] == "https://example.com/test.pdf"
 
 
-@patch("arrestx.cli.process_daily_report")
+@patch("arrestx.web.process_daily_report")
 @patch("sys.argv", ["arrestx", "fetch", "--url", "https://example.com/test.pdf"])
 def test_fetch_command_error(mock_process_daily_report):
     """Test fetch command error handling."""
@@ -108,4 +121,111 @@ def test_fetch_command_error(mock_process_daily_report):
     result = main()
     
     # Verify the result
-    assert result == 1
\ No newline at end of file
+    assert result == 1
+
+def test_find_input_files(tmp_path, monkeypatch):
+    """Test expanding input paths and globs into existing files."""
+    os.makedirs(tmp_path / "reports" / "archive")
+    for name in ["01.pdf", "02.pdf", "notes.txt", ".hidden.pdf", "archive/03.pdf"]:
+        (tmp_path / "reports" / name).write_text("test")
+    os.makedirs(tmp_path / "reports" / "dir.pdf")  # Directories are ignored
+    monkeypatch.chdir(tmp_path)
+
+    assert sorted(find_input_files(["reports/*.pdf"])) == [
+        os.path.join("reports", "01.pdf"),
+        os.path.join("reports", "02.pdf"),
+    ]
+    assert sorted(find_input_files(["reports/**/*.pdf"])) == [
+        os.path.join("reports", "01.pdf"),
+        os.path.join("reports", "02.pdf"),
+        os.path.join("reports", "archive", "03.pdf"),
+    ]
+    assert find_input_files(["reports/notes.txt", "missing/*.pdf"]) == ["reports/notes.txt"]
+
+
+@pytest.mark.parametrize("argv", [
+    ["search", "John Smith"],
+    ["search", "SMITH, JOHN", "--json"],
+])
+def test_parse_search_fast_path(argv):
+    """Test that the search fast path matches the full argument parser."""
+    assert parse_search_fast_path(argv) == build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["search"],
+    ["search", "--json", "John Smith"],
+    ["search", "John Smith", "--enterprise"],
+    ["--config", "other.yaml", "search", "John Smith"],
+    ["fetch", "--url", "https://example.com/test.pdf"],
+])
+def test_parse_search_fast_path_fallback(argv):
+    """Test that other invocations fall back to the full argument parser."""
+    assert parse_search_fast_path(argv) is None
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_print_json(orjson_available, capfd):
+    """Test writing indented JSON to stdout with and without orjson."""
+    data = {"name": "SMITH, JOHN", "alerts": [{"booking_no": "25-0123456"}]}
+
+    if orjson_available:
+        pytest.importorskip("orjson")
+        print_json(data)
+    else:
+        with patch.dict(sys.modules, {"orjson": None}):
+            print_json(data)
+
+    out = capfd.readouterr().out
+    assert json.loads(out) == data
+    assert out.endswith("}\n")
+    assert '\n  "alerts": [' in out
+
+
+@patch("arrestx.parser.parse_pdf")
+def test_parse_files_sequential(mock_parse_pdf):
+    """Test parsing files in order without worker processes."""
+    mock_parse_pdf.side_effect = lambda path, cfg: [{"name": path}]
+    config = Config(performance=PerformanceConfig(parallel_files=False))
+
+    with patch("concurrent.futures.ProcessPoolExecutor") as mock_executor:
+        records = list(parse_files(["a.pdf", "b.pdf"], config))
+
+    assert records == [{"name": "a.pdf"}, {"name": "b.pdf"}]
+    mock_executor.assert_not_called()
+    assert mock_parse_pdf.call_args[0][1] is config
+
+
+@patch("arrestx.cli.os.cpu_count", return_value=8)
+@patch("arrestx.parser.parse_pdf")
+def test_parse_files_parallel(mock_parse_pdf, mock_cpu_count):
+    """Test parsing multiple files with a process pool."""
+    mock_parse_pdf.side_effect = lambda path, cfg: [{"name": path, "pages": cfg.performance.parallel_pages}]
+    config = Config(performance=PerformanceConfig(max_workers=4))
+
+    with patch("concurrent.futures.ProcessPoolExecutor") as mock_executor:
+        mock_executor.return_value.__enter__.return_value.map.side_effect = map
+        records = list(parse_files(["a.pdf", "b.pdf", "c.pdf"], config))
+
+    mock_executor.assert_called_once_with(max_workers=3)
+    assert records == [
+        {"name": "a.pdf", "pages": False},
+        {"name": "b.pdf", "pages": False},
+        {"name": "c.pdf", "pages": False},
+    ]
+    assert config.performance.parallel_pages is True
+
+
+@patch("arrestx.cli._CONFIGURED", False)
+@patch("arrestx.cli.logging.basicConfig")
+def test_setup_logging(mock_basic_config):
+    """Test that logging is configured only once."""
+    setup_logging("debug")
+    setup_logging("INFO")
+
+    mock_basic_config.assert_called_once()
+    assert mock_basic_config.call_args[1]["level"] == logging.DEBUG
+
+    with pytest.raises(ValueError):
+        setup_logging("LOUD")
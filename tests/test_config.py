@@ -19,6 +19,7 @@ from arrestx.config import (
     PerformanceConfig,
     WebRetrievalConfig,
     load_config,
+    worker_config,
 )
 
 
@@ -248,4 +249,67 @@ def test_web_retrieval_config():
     assert cfg.web_retrieval.enabled is True
     assert cfg.web_retrieval.url == "https://example.com/test.pdf"
     assert cfg.web_retrieval.schedule == "0 12 * * *"
-    assert cfg.web_retrieval.skip_if_existing is False
\ No newline at end of file
+    assert cfg.web_retrieval.skip_if_existing is False
+
+def test_load_config_cached(tmp_path):
+    """Test that unchanged configuration files are only loaded once."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({"input": {"ocr_lang": "deu"}}))
+
+    cfg = load_config(str(config_path))
+    assert load_config(str(config_path)) is cfg
+
+    # Rewriting the file invalidates the cached configuration
+    config_path.write_text(yaml.dump({"input": {"ocr_lang": "fra"}}))
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = load_config(str(config_path))
+    assert reloaded is not cfg
+    assert reloaded.input.ocr_lang == "fra"
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_config_trusted(tmp_path, monkeypatch, trusted):
+    """Test that trusted configurations match validated ones."""
+    config_data = {
+        "input": {"paths": ["./custom/*.pdf"], "ocr_lang": "deu"},
+        "performance": {"max_workers": 2},
+        "mongodb": {"enabled": True, "tenant": "CUSTOM"},
+    }
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump(config_data))
+    if trusted:
+        monkeypatch.setenv("TRUSTED_CONFIG", "1")
+
+    cfg = load_config(str(config_path))
+
+    assert cfg == load_config(str(config_path), validate=True)
+    assert isinstance(cfg.input, InputConfig)
+    assert isinstance(cfg.mongodb, MongoDBConfig)
+    assert cfg.input.ocr_fallback is False
+    assert cfg.performance.max_workers == 2
+    assert cfg.mongodb.collection == "arrest_records"
+
+
+def test_parsing_config_header_regex():
+    """Test the fused header/footer regex."""
+    cfg = ParsingConfig()
+    
+    assert cfg.header_regex is ParsingConfig().header_regex
+    assert cfg.header_regex.search("Report Date: 01/02/2025")
+    assert cfg.header_regex.search("page 3 of 10")
+    assert not cfg.header_regex.search("SMITH, JOHN")
+    assert not ParsingConfig(header_patterns=[]).header_regex.search("Page 1")
+
+
+def test_worker_config():
+    """Test copying a configuration for file-level worker processes."""
+    cfg = Config(performance=PerformanceConfig(max_workers=3))
+    
+    worker_cfg = worker_config(cfg)
+    
+    assert worker_cfg.performance.parallel_pages is False
+    assert worker_cfg.performance.max_workers == 3
+    assert worker_cfg.input == cfg.input
+    assert cfg.performance.parallel_pages is True
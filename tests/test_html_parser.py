@@ -2,6 +2,8 @@
 Tests for HTML-based parser module.
 """
 
+import subprocess
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -13,6 +15,7 @@ from arrestx.html_parser import (
     _normalize_date,
     _text_to_html_table,
     _is_header_or_footer,
+    _extract_table_rows,
 )
 
 # Skip tests if BeautifulSoup is not available
@@ -106,6 +109,11 @@ class TestHTMLParser:
         assert _normalize_date("1/5/2025") == "2025-01-05"
         assert _normalize_date("invalid") == "invalid"
         assert _normalize_date(None) is None
+        assert _normalize_date("") is None
+        assert _normalize_date("13/20/2025") == "13/20/2025"
+        assert _normalize_date("10/32/2025") == "10/32/2025"
+        assert _normalize_date("1a/20/2025") == "1a/20/2025"
+        assert _normalize_date("1/2/3/2025") == "1/2/3/2025"
 
     def test_text_to_html_table(self):
         """Test converting text to HTML table."""
@@ -223,6 +231,154 @@ class TestHTMLParser:
         with pytest.raises(RuntimeError, match="Failed to convert PDF to HTML"):
             parse_pdf_via_html("test.pdf", cfg)
 
+    @patch('arrestx.html_parser.convert_pdf_to_html')
+    def test_parse_pdf_via_html_enhanced(self, mock_convert):
+        """Test the enhanced parser short-circuits the standard HTML parsing."""
+        from arrestx.html_parser import parse_pdf_via_html
+        from arrestx.config import ParsingConfig
+        
+        enhanced = Mock(return_value=[{"name": "SMITH, JOHN"}])
+        
+        with patch('arrestx.html_parser._ENHANCED_PARSER', enhanced):
+            cfg = Config()
+            assert parse_pdf_via_html("test.pdf", cfg) == [{"name": "SMITH, JOHN"}]
+            enhanced.assert_called_once_with("test.pdf", cfg)
+            mock_convert.assert_not_called()
+            
+            # Disabled in the configuration
+            mock_convert.return_value = None
+            cfg = Config(parsing=ParsingConfig(use_enhanced_html_parser=False))
+            with pytest.raises(RuntimeError):
+                parse_pdf_via_html("test.pdf", cfg)
+            assert enhanced.call_count == 1
+
+    @patch('pdfplumber.open')
+    def test_convert_with_pdfplumber(self, mock_open):
+        """Test converting extracted pdfplumber tables to HTML."""
+        from arrestx.html_parser import _convert_with_pdfplumber
+        
+        page = Mock()
+        page.extract_tables.return_value = [[
+            ["Inmate Name", "Identifier CID"],
+            [None, ""],
+            ["SMITH, JOHN ", None],
+        ]]
+        mock_open.return_value.__enter__.return_value.pages = [page]
+        
+        html = _convert_with_pdfplumber("test.pdf", Config())
+        
+        assert html == "\n".join([
+            "<html><body>",
+            '<table id="page_1_table_0">',
+            "<tr>", "<th>Inmate Name</th>", "<th>Identifier CID</th>", "</tr>",
+            "<tr>", "<td>SMITH, JOHN</td>", "<td></td>", "</tr>",
+            "</table>",
+            "</body></html>",
+        ])
+        page.flush_cache.assert_called_once_with()
+
+    def test_write_html_tables_escapes_cells(self):
+        """Test cell text is escaped so markup characters survive parsing."""
+        from io import StringIO
+        from arrestx.html_parser import _extract_table_rows, _write_html_tables
+        
+        buf = StringIO()
+        _write_html_tables(buf.write, [[["Description"], ["THEFT <$100 & >$50"]]], 1)
+        
+        assert "THEFT &lt;$100 &amp; &gt;$50" in buf.getvalue()
+        assert _extract_table_rows(buf.getvalue()) == [[["Description"], ["THEFT <$100 & >$50"]]]
+
+    @patch('pdfplumber.open')
+    def test_extract_tables_with_pdfplumber(self, mock_open):
+        """Test direct table extraction matches parsing the converted HTML."""
+        from arrestx.html_parser import _convert_with_pdfplumber, extract_tables_with_pdfplumber
+        
+        table_page = Mock()
+        table_page.extract_tables.return_value = [[
+            ["Inmate Name", "Description"],
+            [None, ""],
+            [" SMITH, JOHN ", "THEFT <$100 &"],
+        ]]
+        text_page = Mock()
+        text_page.extract_tables.return_value = []
+        text_page.extract_text.return_value = (
+            "Inmate Name Identifier CID Book In Date Booking No. Description\n"
+            "SMITH, JOHN DOE 1234567 10/20/2025 25-0241234 ASSAULT\n"
+        )
+        mock_open.return_value.__enter__.return_value.pages = [table_page, text_page]
+        cfg = Config()
+        
+        tables = extract_tables_with_pdfplumber("test.pdf", cfg)
+        
+        assert tables == _extract_table_rows(_convert_with_pdfplumber("test.pdf", cfg))
+        assert tables[0] == [["Inmate Name", "Description"], ["SMITH, JOHN", "THEFT <$100 &"]]
+        assert tables[1][1][0] == "SMITH, JOHN DOE"
+
+    @patch('arrestx.html_parser.convert_pdf_to_html')
+    @patch('arrestx.html_parser.extract_tables_with_pdfplumber')
+    def test_parse_pdf_via_html_direct_tables(self, mock_extract, mock_convert):
+        """Test pdfplumber tables are parsed without an HTML conversion."""
+        from arrestx.config import ParsingConfig
+        from arrestx.html_parser import parse_pdf_via_html
+        
+        mock_extract.return_value = [[
+            ["Inmate Name", "Booking No.", "Description"],
+            ["SMITH, JOHN", "25-0241234", "ASSAULT"],
+        ]]
+        cfg = Config(parsing=ParsingConfig(use_enhanced_html_parser=False))
+        
+        records = parse_pdf_via_html("test.pdf", cfg)
+        
+        assert [r["name"] for r in records] == ["SMITH, JOHN"]
+        assert records[0]["source_file"] == "test.pdf"
+        mock_convert.assert_not_called()
+
+    @patch('arrestx.html_parser.subprocess.run')
+    def test_convert_with_pdftohtml_failure(self, mock_run):
+        """Test pdftohtml stdout is discarded and stderr only decoded on failure."""
+        from arrestx.html_parser import _convert_with_pdftohtml
+        
+        mock_run.return_value = Mock(returncode=1, stderr=b"Syntax Error: \xff")
+        
+        assert _convert_with_pdftohtml("test.pdf", Config()) is None
+        
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.PIPE
+
+    @patch('fitz.open')
+    def test_pymupdf_pages_html_tables(self, mock_open):
+        """Test rendering PyMuPDF-detected tables and the HTML fallback."""
+        from arrestx.html_parser import _pymupdf_pages_html
+        
+        table_page = Mock()
+        table_page.find_tables.return_value = [Mock(extract=Mock(return_value=[
+            ["Inmate Name", "Booking No."],
+            ["SMITH, JOHN", "25-0241234"],
+        ]))]
+        text_page = Mock()
+        text_page.find_tables.return_value = []
+        text_page.get_text.return_value = "<p>text</p>"
+        doc = mock_open.return_value.__enter__.return_value
+        doc.__len__ = Mock(return_value=2)
+        doc.load_page.side_effect = [table_page, text_page]
+        
+        html = _pymupdf_pages_html("test.pdf", 0, None)
+        
+        assert html == "\n".join([
+            '<div id="page_1">',
+            '<table id="page_1_table_0">',
+            "<tr>", "<th>Inmate Name</th>", "<th>Booking No.</th>", "</tr>",
+            "<tr>", "<td>SMITH, JOHN</td>", "<td>25-0241234</td>", "</tr>",
+            "</table>",
+            "</div>",
+            '<div id="page_2">',
+            "<p>text</p>",
+            "</div>",
+            "",
+        ])
+        text_page.get_text.assert_called_once_with("html")
+
     def test_empty_html_table(self):
         """Test parsing empty HTML table."""
         html_content = """
@@ -246,6 +402,48 @@ class TestHTMLParser:
         
         assert len(records) == 0
 
+    @pytest.mark.parametrize("use_lxml", [False, True])
+    def test_parse_html_content_parser_backends(self, use_lxml):
+        """Test that the lxml and BeautifulSoup backends produce the same records."""
+        if use_lxml:
+            pytest.importorskip("lxml")
+        html_content = (
+            "<table>"
+            "<tr><th>Inmate Name</th><th>Identifier CID</th><th>Book In Date</th>"
+            "<th>Booking No.</th><th>Description</th></tr>"
+            "<tr><td>SMITH, JOHN DOE</td><td>1234567</td><td>10/20/2025</td>"
+            "<td>25-0241234</td><td>ASSAULT <!-- note --> &amp; <b>BATTERY</b></td></tr>"
+            "<tr><td>SMITH, JOHN DOE</td><td>1234567</td><td>10/20/2025</td>"
+            "<td>25-0241235</td><td>THEFT</td></tr>"
+            "</table>"
+        )
+        
+        with patch("arrestx.html_parser.LXML_AVAILABLE", use_lxml):
+            records = parse_html_content(html_content, "test.pdf", Config())
+        
+        assert [r["name"] for r in records] == ["SMITH, JOHN DOE", "SMITH, JOHN DOE"]
+        assert records[0]["charges"] == [{"booking_no": "25-0241234", "description": "ASSAULT&BATTERY"}]
+        assert records[1]["book_in_date"] == "2025-10-20"
+
+    def test_extract_table_rows_incremental(self):
+        """Test lxml table extraction across parser feed chunks and nested tables."""
+        pytest.importorskip("lxml")
+        html_content = (
+            "<p>Page 1</p>"
+            "<table><tr><td>a<table><tr><td>inner</td></tr></table></td></tr>"
+            "<tr><th>b</th></tr></table>"
+            "<div><p>Page 2</p><table><tr><td> c </td><td>d</td></tr></table></div>"
+        )
+        
+        with patch("arrestx.html_parser._HTML_FEED_CHUNK", 7):
+            tables = _extract_table_rows(html_content)
+        
+        assert tables == [
+            [["ainner"], ["inner"], ["b"]],
+            [["inner"]],
+            [["c", "d"]],
+        ]
+
     def test_malformed_html(self):
         """Test parsing malformed HTML."""
         html_content = """
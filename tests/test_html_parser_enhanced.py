@@ -0,0 +1,181 @@
+"""
+Tests for the enhanced HTML-based parser module.
+"""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from arrestx.config import Config, PerformanceConfig
+from arrestx.html_parser_enhanced import (
+    EnhancedHTMLParser,
+    parse_pdfs_via_enhanced_html,
+)
+
+
+@patch("arrestx.html_parser_enhanced.map_page_ranges")
+@patch("pdfplumber.open")
+def test_pdfplumber_enhanced_parallel(mock_open, mock_map):
+    """Test combining the page records extracted by workers."""
+    mock_open.return_value.__enter__.return_value.pages = [MagicMock()] * 3
+    mock_map.return_value = [[[{"name": "A"}], [{"name": "B"}]], [[]]]
+
+    records = EnhancedHTMLParser(Config())._extract_with_pdfplumber_enhanced("test.pdf")
+
+    assert [r["name"] for r in records] == ["A", "B"]
+
+
+@patch("pdfplumber.open")
+def test_pdfplumber_enhanced_sequential(mock_open):
+    """Test the table strategy is reused across pages and text is parsed per page."""
+    table = [["Inmate Name", "Identifier"], ["SMITH, JOHN", "1234567"]]
+    table_page = MagicMock()
+    table_page.extract_tables.side_effect = lambda table_settings: (
+        [table] if table_settings["vertical_strategy"] == "text" else []
+    )
+    text_page = MagicMock()
+    text_page.extract_tables.return_value = []
+    text_page.extract_text.return_value = "JONES, JANE\n7654321"
+    mock_open.return_value.__enter__.return_value.pages = [text_page, table_page, table_page, text_page]
+    cfg = Config(performance=PerformanceConfig(parallel_pages=False))
+
+    records = EnhancedHTMLParser(cfg)._extract_with_pdfplumber_enhanced("test.pdf")
+
+    assert [r["name"] for r in records] == ["JONES, JANE", "SMITH, JOHN", "SMITH, JOHN", "JONES, JANE"]
+    # The second table page only tries the strategy that worked on the first
+    assert table_page.extract_tables.call_count == 3
+    table_page.extract_text.assert_not_called()
+    assert text_page.extract_text.call_count == 2
+
+
+def test_convert_dataframes_to_records():
+    """Test converting table DataFrames to records column by column."""
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        [
+            ["SMITH, JOHN\n123 MAIN ST", "1234567", "10/20/2025", "25-0241234", " THEFT "],
+            ["JONES, JANE", None, float("nan"), "nan", None],
+            [None, None, "1/2/2025", "25-0241235", "DWI"],
+        ],
+        columns=["Inmate Name", "Identifier", "Book In Date", "Booking No", "Description"],
+    )
+
+    records = EnhancedHTMLParser(Config())._convert_dataframes_to_records([df], "test.pdf")
+
+    assert len(records) == 2
+    assert records[0]["name"] == "SMITH, JOHN"
+    assert records[0]["street"] == ["123 MAIN ST"]
+    assert records[0]["book_in_date"] == "2025-10-20"
+    assert records[0]["charges"] == [{"booking_no": "25-0241234", "description": "THEFT"}]
+    assert records[1]["identifier"] is None
+    assert records[1]["book_in_date"] is None
+    assert records[1]["charges"] == []
+
+
+@patch("arrestx.html_parser_enhanced.subprocess.run")
+def test_extract_with_pdftohtml_stdout(mock_run):
+    """Test pdftohtml output is read from stdout."""
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0,
+        stdout=b'<p style="top:10px;left:5px">SMITH, JOHN</p><p style="top:30px;left:5px">1234567</p>',
+    )
+
+    records = EnhancedHTMLParser(Config())._extract_with_pdftohtml("test.pdf")
+
+    assert [(r["name"], r["identifier"]) for r in records] == [("SMITH, JOHN", "1234567")]
+    cmd = mock_run.call_args.args[0]
+    assert "-stdout" in cmd and cmd[-1] == "test.pdf"
+    assert mock_run.call_args.kwargs["stdout"] == subprocess.PIPE
+
+
+@pytest.mark.parametrize("lxml_available", [True, False])
+def test_parse_pdftohtml_content(lxml_available):
+    """Test parsing pdftohtml XML with lxml and with BeautifulSoup."""
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<pdf2xml><page number="1"><fontspec id="0" size="8"/>\n'
+        '<text style="top:30px;left:5px">1234567</text>\n'
+        '<text style="top:10px;left:5px"><b>SMITH, </b>JOHN</text>\n'
+        '<text style="top:50px;left:5px">123 MAIN ST &amp; 2ND</text>\n'
+        '</page></pdf2xml>'
+    )
+
+    with patch("arrestx.html_parser_enhanced.LXML_AVAILABLE", lxml_available):
+        records = EnhancedHTMLParser(Config())._parse_pdftohtml_content(content, "test.pdf")
+
+    assert [(r["name"], r["identifier"], r["street"]) for r in records] == [
+        ("SMITH, JOHN", "1234567", ["123 MAIN ST & 2ND"])
+    ]
+
+
+def test_normalize_date():
+    """Test normalizing dates with and without zero padding."""
+    parser = EnhancedHTMLParser(Config())
+
+    assert parser._normalize_date("10/20/2025") == "2025-10-20"
+    assert parser._normalize_date("1/2/2025") == "2025-01-02"
+    assert parser._normalize_date("13/02/2025") == "13/02/2025"
+    assert parser._normalize_date("1/32/2025") == "1/32/2025"
+    assert parser._normalize_date("2025-01-02") == "2025-01-02"
+    assert parser._normalize_date("") is None
+
+
+@patch("arrestx.html_parser_enhanced.os.cpu_count", return_value=8)
+@patch("arrestx.html_parser_enhanced.concurrent.futures.ProcessPoolExecutor")
+@patch.object(EnhancedHTMLParser, "parse_pdf", side_effect=lambda path: [{"name": path}])
+def test_parse_pdfs_via_enhanced_html(mock_parse_pdf, mock_executor, mock_cpu_count):
+    """Test parsing several PDF files in worker processes."""
+    def executor(max_workers, initializer, initargs):
+        initializer(*initargs)
+        return mock_executor.return_value
+
+    mock_executor.side_effect = executor
+    mock_executor.return_value.__enter__.return_value.map.side_effect = map
+    paths = ["a.pdf", "b.pdf", "c.pdf"]
+
+    results = parse_pdfs_via_enhanced_html(paths, Config(), workers=2)
+
+    assert results == {path: [{"name": path}] for path in paths}
+    assert mock_executor.call_args.kwargs["max_workers"] == 2
+    worker_cfg = mock_executor.call_args.kwargs["initargs"][0]
+    assert worker_cfg.performance.parallel_pages is False
+
+    # Sequential when parallel files are disabled
+    mock_executor.reset_mock()
+    cfg = Config(performance=PerformanceConfig(parallel_files=False))
+    assert parse_pdfs_via_enhanced_html(paths, cfg) == results
+    mock_executor.assert_not_called()
+
+    # Duplicate paths are parsed once
+    mock_parse_pdf.reset_mock()
+    assert parse_pdfs_via_enhanced_html(paths + ["a.pdf"], cfg) == results
+    assert mock_parse_pdf.call_count == 3
+
+
+def test_convert_table_to_records_empty_cells():
+    """Test None and "nan" table cells are read as empty."""
+    table = [
+        ["Inmate Name", "Identifier", "Description"],
+        ["SMITH, JOHN", None, " THEFT "],
+        [None, "1234567", "nan"],
+    ]
+
+    records = EnhancedHTMLParser(Config())._convert_table_to_records(table, "test.pdf", 1)
+
+    assert [(r["name"], r["identifier"]) for r in records] == [("SMITH, JOHN", None), ("", "1234567")]
+    assert records[0]["charges"] == [{"booking_no": "", "description": "THEFT"}]
+    assert records[1]["charges"] == []
+
+
+def test_parse_text_to_records():
+    """Test parsing page text, including pages without any name line."""
+    parser = EnhancedHTMLParser(Config())
+    text = "Daily Booked In Report\nPage: 1 of 2\n1234567 before any name\n  SMITH, JOHN\n7654321\n123 MAIN ST"
+
+    records = parser._parse_text_to_records(text, "test.pdf", 1)
+
+    assert [(r["name"], r["identifier"], r["street"]) for r in records] == [
+        ("SMITH, JOHN", "7654321", ["123 MAIN ST"])
+    ]
+    assert parser._parse_text_to_records("Daily Booked In Report\nPage: 1 of 2\n", "test.pdf", 1) == []
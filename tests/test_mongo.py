@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from arrestx.config import MongoDBConfig
+from arrestx.db import mongo
 from arrestx.db.mongo import (
     keyify,
     setup_mongodb,
@@ -18,6 +19,14 @@ from arrestx.db.mongo import (
 from arrestx.model import MongoDBError
 
 
+@pytest.fixture(autouse=True)
+def clear_clients():
+    """Ensure each test starts without cached MongoDB clients."""
+    mongo._CLIENTS.clear()
+    yield
+    mongo._CLIENTS.clear()
+
+
 def create_test_record():
     """Create a test record for use in tests."""
     return {
@@ -55,6 +64,18 @@ def test_keyify_without_identifier():
     assert len(key.split("::")[3]) == 16  # SHA-256 hash truncated to 16 chars
 
 
+def test_keyify_blake2b():
+    """Test keyify with the blake2b name hash."""
+    record = create_test_record()
+    record["identifier"] = None
+    sha_key = keyify("TEST", "test.pdf", record)
+    key = keyify("TEST", "test.pdf", record, key_hash="blake2b")
+    assert key.startswith("TEST::2025-01-02::test.pdf::")
+    assert len(key.split("::")[3]) == 16
+    assert key != sha_key
+    assert keyify("TEST", "test.pdf", record, key_hash="blake2b") == key
+
+
 def test_to_mongodb_doc():
     """Test converting a record to a MongoDB document."""
     record = create_test_record()
@@ -77,6 +98,15 @@ def test_to_mongodb_doc():
     assert doc["quality"]["ocr_used"] is False
 
 
+def test_to_mongodb_doc_without_name_normalized():
+    """Test that the display name is used when name_normalized is missing."""
+    record = create_test_record()
+    del record["name_normalized"]
+    doc = to_mongodb_doc(record, "TEST")
+    
+    assert doc["name_normalized"] == "SMITH, JOHN"
+
+
 @patch("arrestx.db.mongo.MONGODB_AVAILABLE", False)
 def test_write_mongodb_not_available():
     """Test writing to MongoDB when pymongo is not available."""
@@ -175,7 +205,7 @@ def test_write_dead_letter(mock_mongo_client):
     ))
     
     # Verify MongoDB client was created with correct URI
-    mock_mongo_client.assert_called_once_with("mongodb://localhost:27017")
+    mock_mongo_client.assert_called_once_with("mongodb://localhost:27017", retryWrites=True)
     
     # Verify database and collection were accessed
     mock_client.__getitem__.assert_called_once_with("test_db")
@@ -200,4 +230,157 @@ def test_setup_mongodb_not_available():
 def test_setup_mongodb_disabled():
     """Test setting up MongoDB when it's disabled."""
     # Should not raise an exception, just log a warning
-    setup_mongodb(MongoDBConfig(enabled=False))
\ No newline at end of file
+    setup_mongodb(MongoDBConfig(enabled=False))
+
+@patch("arrestx.db.mongo.pymongo.MongoClient")
+def test_get_client_reuses_client(mock_mongo_client):
+    """Test that clients are shared per URI and closed at exit."""
+    client = mongo._get_client("mongodb://localhost:27017")
+
+    assert mongo._get_client("mongodb://localhost:27017") is client
+    mock_mongo_client.assert_called_once_with("mongodb://localhost:27017", retryWrites=True)
+
+    mongo._close_clients()
+
+    client.close.assert_called_once()
+    assert mongo._CLIENTS == {}
+
+
+@patch("arrestx.db.mongo.MONGODB_AVAILABLE", True)
+@patch("arrestx.db.mongo._BULK_BATCH_SIZE", 2)
+@patch("arrestx.db.mongo.pymongo.MongoClient")
+def test_write_mongodb_batches(mock_mongo_client):
+    """Test that upserts are sent to MongoDB in bounded batches."""
+    mock_collection = mock_mongo_client.return_value.__getitem__.return_value.__getitem__.return_value
+    mock_result = MagicMock()
+    mock_result.matched_count = 1
+    mock_result.modified_count = 0
+    mock_result.upserted_ids = {}
+    mock_collection.bulk_write.return_value = mock_result
+
+    records = []
+    for i in range(5):
+        record = create_test_record()
+        record["identifier"] = f"1234567{i}"
+        records.append(record)
+
+    result = write_mongodb(records, MongoDBConfig(enabled=True, tenant="TEST"))
+
+    batch_sizes = [len(c[0][0]) for c in mock_collection.bulk_write.call_args_list]
+    assert batch_sizes == [2, 2, 1]
+    assert result == {"matched": 3, "modified": 0, "upserted": 0}
+
+
+@patch("arrestx.db.mongo.MONGODB_AVAILABLE", True)
+@patch("arrestx.db.mongo._BULK_BATCH_SIZE", 2)
+@patch("arrestx.db.mongo.pymongo.MongoClient")
+def test_write_mongodb_batch_errors(mock_mongo_client):
+    """Test that a failed batch does not stop the later batches."""
+    from pymongo.errors import BulkWriteError
+    
+    mock_collection = mock_mongo_client.return_value.__getitem__.return_value.__getitem__.return_value
+    mock_result = MagicMock()
+    mock_result.matched_count = 1
+    mock_result.modified_count = 1
+    mock_result.upserted_ids = {0: "id"}
+    mock_collection.bulk_write.side_effect = [
+        BulkWriteError({
+            "nMatched": 1, "nModified": 0, "nUpserted": 0,
+            "writeErrors": [{"index": 1, "code": 121, "errmsg": "Document failed validation"}],
+        }),
+        mock_result,
+        mock_result,
+    ]
+    
+    records = []
+    for i in range(5):
+        record = create_test_record()
+        record["identifier"] = f"1234567{i}"
+        records.append(record)
+    
+    with pytest.raises(MongoDBError) as excinfo:
+        write_mongodb(records, MongoDBConfig(enabled=True, tenant="TEST"))
+    
+    assert mock_collection.bulk_write.call_count == 3
+    message = str(excinfo.value)
+    assert "1 upserts failed" in message
+    assert "Document failed validation" in message
+    assert "{'matched': 3, 'modified': 2, 'upserted': 2}" in message
+
+
+def test_ops():
+    """Test building upsert operations from records."""
+    ingested_at = datetime.datetime(2025, 1, 2, tzinfo=datetime.timezone.utc)
+    ops = list(mongo._ops([create_test_record(), create_test_record()], "TEST", ingested_at))
+    assert all(o._doc["$setOnInsert"]["source.ingested_at"] is ingested_at for o in ops)
+
+    op = next(mongo._ops([create_test_record()], "TEST"))
+
+    assert op._filter == {"_id": "TEST::2025-01-02::test.pdf::12345678"}
+    assert op._upsert is True
+    assert op._doc["$set"] == {
+        "_tenant": "TEST",
+        "name": "SMITH, JOHN",
+        "name_normalized": "John Smith",
+        "address": ["123 MAIN ST", "ANYTOWN, TX 12345"],
+        "identifier": "12345678",
+        "book_in_date": "2025-01-02",
+        "source.file": "test.pdf",
+        "source.page_span": [1, 1],
+        "source.parser_version": "1.0.0",
+        "quality": {"warnings": [], "ocr_used": False},
+    }
+    assert isinstance(op._doc["$setOnInsert"]["source.ingested_at"], datetime.datetime)
+    assert op._doc["$addToSet"] == {
+        "charges": {"$each": [{"booking_no": "25-0123456", "description": "NO VALID DL"}]}
+    }
+
+
+@patch("arrestx.db.mongo.MONGODB_AVAILABLE", True)
+@patch("arrestx.db.mongo.pymongo.MongoClient")
+def test_setup_mongodb(mock_mongo_client):
+    """Test setting up MongoDB collections and indexes."""
+    mock_db = mock_mongo_client.return_value.__getitem__.return_value
+    mock_db.list_collection_names.return_value = ["arrest_records", "arrest_sources"]
+
+    setup_mongodb(MongoDBConfig(enabled=True))
+
+    mock_db.list_collection_names.assert_called_once()
+    created = [c[0][0] for c in mock_db.create_collection.call_args_list]
+    assert created == ["arrest_reports", "arrest_ingest_errors"]
+
+    index_batches = [c[0][0] for c in mock_db.__getitem__.return_value.create_indexes.call_args_list]
+    assert [len(batch) for batch in index_batches] == [5, 3, 1, 1]
+    mock_db.command.assert_not_called()
+
+
+@patch("arrestx.db.mongo.MONGODB_AVAILABLE", True)
+@patch("arrestx.db.mongo.pymongo.MongoClient")
+def test_setup_mongodb_existing(mock_mongo_client):
+    """Test that existing indexes are skipped and the schema reconciled."""
+    mock_db = mock_mongo_client.return_value.__getitem__.return_value
+    mock_db.list_collection_names.return_value = [
+        "arrest_records", "arrest_reports", "arrest_sources", "arrest_ingest_errors"
+    ]
+    mock_collection = mock_db.__getitem__.return_value
+    mock_collection.list_indexes.return_value = [
+        {"name": "_id_"},
+        {"name": "book_in_date_1"},
+        {"name": "name_normalized_1"},
+        {"name": "url_1_report_date_1"},
+        {"name": "report_date_1"},
+        {"name": "pulled_at_1"},
+        {"name": "url_1"},
+        {"name": "timestamp_1"},
+    ]
+
+    setup_mongodb(MongoDBConfig(enabled=True), reconcile_schema=True)
+
+    mock_db.create_collection.assert_not_called()
+    assert mock_db.command.call_args[0] == ("collMod", "arrest_records")
+    index_batches = [c[0][0] for c in mock_collection.create_indexes.call_args_list]
+    assert [[index.document["name"] for index in batch] for batch in index_batches] == [[
+        "_tenant_1_source.file_1_identifier_1_book_in_date_1",
+        "_tenant_1_source.file_1_name_normalized_1_book_in_date_1",
+        "_tenant_1_charges.booking_no_1",
+    ]]
@@ -3,12 +3,13 @@ Tests for the OCR module.
 """
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
 from arrestx.ocr import (
     apply_ocr_to_image,
+    apply_ocr_to_images,
     check_ocr_dependencies,
     convert_pdf_to_images,
     ocr_pdf_file,
@@ -44,6 +45,21 @@ def test_apply_ocr_to_image(mock_pytesseract):
     mock_pytesseract.image_to_string.assert_called_once_with("dummy_image", lang="eng")
 
 
+@patch("arrestx.ocr.pytesseract")
+def test_apply_ocr_to_image_binarize(mock_pytesseract):
+    """Test binarizing an image before applying OCR."""
+    Image = pytest.importorskip("PIL.Image")
+    mock_pytesseract.image_to_string.return_value = "OCR text"
+    image = Image.new("RGB", (4, 1))
+    image.putdata([(0, 0, 0), (100, 100, 100), (200, 200, 200), (255, 255, 255)])
+    
+    assert apply_ocr_to_image(image, "eng", binarize=True) == "OCR text"
+    
+    binary = mock_pytesseract.image_to_string.call_args.args[0]
+    assert binary.mode == "1"
+    assert [255 if p else 0 for p in binary.getdata()] == [0, 0, 255, 255]
+
+
 @patch("arrestx.ocr.pytesseract")
 def test_apply_ocr_to_image_error(mock_pytesseract):
     """Test error handling when applying OCR to an image."""
@@ -70,7 +86,9 @@ def test_convert_pdf_to_images(mock_convert_from_path):
     
     # Verify images
     assert images == mock_images
-    mock_convert_from_path.assert_called_once_with("test.pdf", dpi=300)
+    mock_convert_from_path.assert_called_once_with(
+        "test.pdf", dpi=300, thread_count=ANY, grayscale=True, first_page=None, last_page=None
+    )
 
 
 @patch("arrestx.ocr.convert_from_path")
@@ -84,7 +102,24 @@ def test_convert_pdf_to_images_error(mock_convert_from_path):
     
     # Verify images is empty
     assert images == []
-    mock_convert_from_path.assert_called_once_with("test.pdf", dpi=300)
+    mock_convert_from_path.assert_called_once_with(
+        "test.pdf", dpi=300, thread_count=ANY, grayscale=True, first_page=None, last_page=None
+    )
+
+
+@patch("arrestx.ocr.os.cpu_count", return_value=4)
+@patch("arrestx.ocr.convert_from_path")
+def test_convert_pdf_to_images_output_folder(mock_convert_from_path, mock_cpu_count):
+    """Test converting a PDF to image files in parallel."""
+    mock_convert_from_path.return_value = ["page1.png", "page2.png"]
+    
+    paths = convert_pdf_to_images("test.pdf", 300, output_folder="out")
+    
+    assert paths == ["page1.png", "page2.png"]
+    mock_convert_from_path.assert_called_once_with(
+        "test.pdf", dpi=300, thread_count=3, grayscale=True, first_page=None, last_page=None,
+        output_folder="out", fmt="png", paths_only=True,
+    )
 
 
 @patch("arrestx.ocr.check_ocr_dependencies", return_value=False)
@@ -98,17 +133,22 @@ def test_ocr_pdf_file_dependencies_not_installed(mock_check_dependencies):
     mock_check_dependencies.assert_called_once()
 
 
+@patch("arrestx.ocr.os.cpu_count", return_value=1)
 @patch("arrestx.ocr.check_ocr_dependencies", return_value=True)
+@patch("arrestx.ocr.pdf2image")
 @patch("arrestx.ocr.convert_pdf_to_images")
-@patch("arrestx.ocr.apply_ocr_to_image")
-def test_ocr_pdf_file(mock_apply_ocr, mock_convert_to_images, mock_check_dependencies):
+@patch("arrestx.ocr.apply_ocr_to_images")
+def test_ocr_pdf_file(mock_apply_ocr, mock_convert_to_images, mock_pdf2image, mock_check_dependencies,
+                      mock_cpu_count):
     """Test OCR PDF file."""
+    mock_pdf2image.pdfinfo_from_path.return_value = {"Pages": 2}
+    
     # Mock convert_pdf_to_images
-    mock_images = [MagicMock(), MagicMock()]
+    mock_images = ["page-1.png", "page-2.png"]
     mock_convert_to_images.return_value = mock_images
     
-    # Mock apply_ocr_to_image
-    mock_apply_ocr.side_effect = ["Page 1 text", "Page 2 text"]
+    # Mock apply_ocr_to_images
+    mock_apply_ocr.return_value = ["Page 1 text", "Page 2 text"]
     
     # OCR PDF file
     text = ocr_pdf_file("test.pdf", "eng", 300)
@@ -116,23 +156,88 @@ def test_ocr_pdf_file(mock_apply_ocr, mock_convert_to_images, mock_check_depende
     # Verify text
     assert text == "Page 1 text\n\nPage 2 text\n\n"
     mock_check_dependencies.assert_called_once()
-    mock_convert_to_images.assert_called_once_with("test.pdf", 300)
-    assert mock_apply_ocr.call_count == 2
-    mock_apply_ocr.assert_any_call(mock_images[0], "eng")
-    mock_apply_ocr.assert_any_call(mock_images[1], "eng")
+    mock_convert_to_images.assert_called_once_with(
+        "test.pdf", 300, output_folder=ANY, grayscale=True, first_page=1, last_page=2, thread_count=None
+    )
+    mock_apply_ocr.assert_called_once_with(mock_images, "eng", False)
+
+
+@patch("arrestx.ocr.os.cpu_count", return_value=8)
+@patch("arrestx.ocr.concurrent.futures.ProcessPoolExecutor")
+@patch("arrestx.ocr.check_ocr_dependencies", return_value=True)
+@patch("arrestx.ocr.pdf2image")
+@patch("arrestx.ocr.convert_pdf_to_images")
+@patch("arrestx.ocr.apply_ocr_to_images")
+def test_ocr_pdf_file_parallel(mock_apply_ocr, mock_convert_to_images, mock_pdf2image,
+                               mock_check_dependencies, mock_executor, mock_cpu_count):
+    """Test OCR PDF file with page ranges rendered and recognized in worker processes."""
+    mock_pdf2image.pdfinfo_from_path.return_value = {"Pages": 3}
+    mock_convert_to_images.side_effect = [["page-1.png", "page-2.png"], ["page-3.png"]]
+    mock_apply_ocr.side_effect = [["Page 1 text", "Page 2 text"], ["Page 3 text"]]
+    mock_executor.return_value.__enter__.return_value.map.side_effect = map
+    
+    text = ocr_pdf_file("test.pdf", "eng", 300, max_workers=2)
+    
+    assert text == "Page 1 text\n\nPage 2 text\n\nPage 3 text\n\n"
+    assert mock_executor.call_args.kwargs["max_workers"] == 2
+    assert [
+        (c.kwargs["first_page"], c.kwargs["last_page"], c.kwargs["thread_count"])
+        for c in mock_convert_to_images.call_args_list
+    ] == [(1, 2, 1), (3, 3, 1)]
+    assert [c.args for c in mock_apply_ocr.call_args_list] == [
+        (["page-1.png", "page-2.png"], "eng", False),
+        (["page-3.png"], "eng", False),
+    ]
+
+
+@patch("arrestx.ocr.TESSEROCR_AVAILABLE", True)
+@patch("arrestx.ocr.PyTessBaseAPI", create=True)
+def test_apply_ocr_to_images_tesserocr(mock_api_class):
+    """Test recognizing images with one reused tesserocr engine per language."""
+    mock_api = mock_api_class.return_value
+    mock_api.GetUTF8Text.side_effect = ["Page 1", "Page 2", "Page 3"]
+    image = MagicMock()
+    
+    with patch.dict("arrestx.ocr._TESS_APIS", clear=True):
+        assert apply_ocr_to_images(["page-1.png", "page-2.png"], "eng") == ["Page 1", "Page 2"]
+        assert apply_ocr_to_image(image, "eng") == "Page 3"
+    
+    mock_api_class.assert_called_once_with(lang="eng")
+    assert [c.args for c in mock_api.SetImageFile.call_args_list] == [("page-1.png",), ("page-2.png",)]
+    mock_api.SetImage.assert_called_once_with(image)
+
+
+@patch("arrestx.ocr.pytesseract")
+def test_apply_ocr_to_images(mock_pytesseract, tmp_path):
+    """Test recognizing several page images in one Tesseract run."""
+    paths = [str(tmp_path / f"page-{i}.png") for i in range(3)]
+    mock_pytesseract.image_to_string.return_value = "Page 1\fPage 2\fPage 3\f"
+    
+    texts = apply_ocr_to_images(paths, "eng")
+    
+    assert texts == ["Page 1\f", "Page 2\f", "Page 3\f"]
+    list_path = mock_pytesseract.image_to_string.call_args.args[0]
+    assert os.path.dirname(list_path) == str(tmp_path)
+    assert not os.path.exists(list_path)
+    
+    # Falls back to one run per page when the output cannot be split
+    mock_pytesseract.image_to_string.side_effect = ["Page 1 Page 2 Page 3", "A", "B", "C"]
+    assert apply_ocr_to_images(paths, "eng") == ["A", "B", "C"]
 
 
 @patch("arrestx.ocr.check_ocr_dependencies", return_value=True)
-@patch("arrestx.ocr.convert_pdf_to_images", side_effect=Exception("Test error"))
-def test_ocr_pdf_file_error(mock_convert_to_images, mock_check_dependencies):
+@patch("arrestx.ocr.pdf2image")
+def test_ocr_pdf_file_error(mock_pdf2image, mock_check_dependencies):
     """Test error handling when OCR PDF file."""
+    mock_pdf2image.pdfinfo_from_path.side_effect = Exception("Test error")
+    
     # OCR PDF file
     text = ocr_pdf_file("test.pdf")
     
     # Verify text is empty
     assert text == ""
     mock_check_dependencies.assert_called_once()
-    mock_convert_to_images.assert_called_once_with("test.pdf", 300)
+    mock_pdf2image.pdfinfo_from_path.assert_called_once_with("test.pdf")
 
 
 @patch("arrestx.ocr.check_ocr_dependencies", return_value=False)
@@ -168,10 +273,11 @@ def test_ocr_pdf_page(mock_apply_ocr, mock_convert_from_bytes, mock_check_depend
     # Verify text
     assert text == "Page 1 text\nPage 2 text\n"
     mock_check_dependencies.assert_called_once()
-    mock_convert_from_bytes.assert_called_once_with(b"test data", dpi=300)
-    assert mock_apply_ocr.call_count == 2
-    mock_apply_ocr.assert_any_call(mock_images[0], "eng")
-    mock_apply_ocr.assert_any_call(mock_images[1], "eng")
+    mock_convert_from_bytes.assert_called_once_with(b"test data", dpi=300, grayscale=True)
+    assert [c.args for c in mock_apply_ocr.call_args_list] == [
+        (mock_images[0], "eng", False),
+        (mock_images[1], "eng", False),
+    ]
 
 
 @patch("arrestx.ocr.check_ocr_dependencies", return_value=True)
@@ -188,4 +294,4 @@ def test_ocr_pdf_page_error(mock_convert_from_bytes, mock_check_dependencies):
     # Verify text is empty
     assert text == ""
     mock_check_dependencies.assert_called_once()
-    mock_convert_from_bytes.assert_called_once_with(b"test data", dpi=300)
\ No newline at end of file
+    mock_convert_from_bytes.assert_called_once_with(b"test data", dpi=200, grayscale=True)
\ No newline at end of file
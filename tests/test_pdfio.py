@@ -7,15 +7,17 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from arrestx.config import Config
+from arrestx.config import Config, PerformanceConfig
 from arrestx.model import ParseError
 from arrestx.pdfio import (
     extract_lines_from_pdf,
     extract_lines_from_pdf_parallel,
     extract_lines_from_pdf_sequential,
     extract_text_from_page,
+    map_page_ranges,
     preprocess_lines,
     process_page,
+    _process_page_range,
 )
 
 
@@ -120,9 +122,10 @@ def test_extract_lines_from_pdf_sequential_with_ocr(mock_apply_ocr, mock_extract
     mock_apply_ocr.assert_called_once_with(mock_page1, "eng")
 
 
-@patch("arrestx.pdfio.concurrent.futures.ThreadPoolExecutor")
+@patch("arrestx.pdfio.os.cpu_count", return_value=8)
+@patch("arrestx.pdfio.concurrent.futures.ProcessPoolExecutor")
 @patch("arrestx.pdfio.pdfplumber")
-def test_extract_lines_from_pdf_parallel(mock_pdfplumber, mock_executor):
+def test_extract_lines_from_pdf_parallel(mock_pdfplumber, mock_executor, mock_cpu_count):
     """Test extracting lines from a PDF in parallel."""
     # Mock PDF
     mock_page1 = MagicMock()
@@ -131,12 +134,12 @@ def test_extract_lines_from_pdf_parallel(mock_pdfplumber, mock_executor):
     mock_pdf.pages = [mock_page1, mock_page2]
     mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
     
-    # Mock executor
+    # Mock executor (one chunk of results per page range, out of order)
     mock_executor_instance = MagicMock()
     mock_executor.return_value.__enter__.return_value = mock_executor_instance
     mock_executor_instance.map.return_value = [
-        (1, ["Page 1 text", "__META_OCR_USED:False"]),
-        (2, ["Page 2 text", "__META_OCR_USED:False"])
+        [(2, ["Page 2 text", "__META_OCR_USED:False"])],
+        [(1, ["Page 1 text", "__META_OCR_USED:False"])],
     ]
     
     # Extract lines
@@ -152,6 +155,62 @@ def test_extract_lines_from_pdf_parallel(mock_pdfplumber, mock_executor):
     mock_executor_instance.map.assert_called_once()
 
 
+@patch("arrestx.pdfio.os.cpu_count", return_value=8)
+@patch("arrestx.pdfio.concurrent.futures.ProcessPoolExecutor")
+def test_map_page_ranges(mock_executor, mock_cpu_count):
+    """Test splitting pages into contiguous ranges across worker processes."""
+    mock_executor.return_value.__enter__.return_value.map.side_effect = map
+    func = MagicMock(side_effect=lambda path, start, stop, *args: (start, stop) + args)
+    cfg = Config(performance=PerformanceConfig(max_workers=3))
+    
+    assert map_page_ranges(func, "test.pdf", 7, cfg, "x") == [(0, 3, "x"), (3, 6, "x"), (6, 7, "x")]
+    mock_executor.assert_called_once_with(max_workers=3)
+    
+    # A single page or worker is handled in-process
+    mock_executor.reset_mock()
+    assert map_page_ranges(func, "test.pdf", 1, cfg) == [(0, 1)]
+    assert map_page_ranges(func, "test.pdf", 7, Config(performance=PerformanceConfig(max_workers=1))) == [(0, 7)]
+    
+    # So is every page when page parallelism is disabled
+    cfg.performance.parallel_pages = False
+    assert map_page_ranges(func, "test.pdf", 7, cfg) == [(0, 7)]
+    mock_executor.assert_not_called()
+
+
+@patch("arrestx.pdfio.os.cpu_count", return_value=8)
+@patch("arrestx.pdfio.concurrent.futures.ProcessPoolExecutor")
+@patch("arrestx.pdfio.process_page")
+@patch("arrestx.pdfio.pdfplumber")
+def test_extract_lines_from_pdf_parallel_single_worker(mock_pdfplumber, mock_process_page,
+                                                       mock_executor, mock_cpu_count):
+    """Test that a single worker extracts the pages in-process."""
+    mock_pdf = MagicMock()
+    mock_pdf.pages = [MagicMock(), MagicMock()]
+    mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+    mock_process_page.side_effect = lambda page_info, cfg: (page_info[0], [f"Page {page_info[0]} text"])
+    
+    cfg = Config(performance=PerformanceConfig(max_workers=1))
+    lines = extract_lines_from_pdf_parallel("test.pdf", cfg)
+    
+    assert lines == [["Page 1 text"], ["Page 2 text"]]
+    mock_executor.assert_not_called()
+
+
+@patch("arrestx.pdfio.process_page")
+@patch("arrestx.pdfio.pdfplumber")
+def test_process_page_range(mock_pdfplumber, mock_process_page):
+    """Test processing a range of pages in a worker."""
+    mock_pdf = MagicMock()
+    mock_pdf.pages = [MagicMock(), MagicMock(), MagicMock()]
+    mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
+    mock_process_page.side_effect = lambda page_info, cfg: (page_info[0], ["text"])
+    
+    result = _process_page_range("test.pdf", 1, 3, Config())
+    
+    assert result == [(2, ["text"]), (3, ["text"])]
+    assert mock_process_page.call_count == 2
+
+
 @patch("arrestx.pdfio.extract_text_from_page")
 @patch("arrestx.pdfio.apply_ocr_to_page")
 def test_process_page(mock_apply_ocr, mock_extract_text):
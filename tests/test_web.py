@@ -108,6 +108,7 @@ def test_backup_file_existing_backup(temp_dir, sample_pdf):
         assert f.read() == b"Existing backup content"
 
 
+@mock.patch("arrestx.web.PYMUPDF_AVAILABLE", False)
 @mock.patch("arrestx.web.pdf_open")
 def test_extract_report_date(mock_pdf_open, temp_dir):
     """Test extracting report date from a PDF."""
@@ -125,6 +126,25 @@ def test_extract_report_date(mock_pdf_open, temp_dir):
     assert report_date == "2025-10-15"
 
 
+@mock.patch("arrestx.web.fitz", create=True)
+@mock.patch("arrestx.web.PYMUPDF_AVAILABLE", True)
+def test_extract_report_date_pymupdf(mock_fitz, temp_dir):
+    """Test extracting report date from a PDF with PyMuPDF."""
+    # Set up mock
+    mock_doc = mock.MagicMock()
+    mock_doc.page_count = 1
+    mock_doc.load_page.return_value.get_text.return_value = "Inmates Booked In\nReport Date: 10/15/2025\nPage 1"
+    mock_fitz.open.return_value.__enter__.return_value = mock_doc
+    
+    # Call function
+    report_date = extract_report_date("mock.pdf")
+    
+    # Verify results
+    assert report_date == "2025-10-15"
+    mock_doc.load_page.assert_called_once_with(0)
+
+
+@mock.patch("arrestx.web.PYMUPDF_AVAILABLE", False)
 @mock.patch("arrestx.web.pdf_open")
 def test_extract_report_date_alternative_format(mock_pdf_open, temp_dir):
     """Test extracting report date from a PDF with alternative format."""
@@ -142,6 +162,7 @@ def test_extract_report_date_alternative_format(mock_pdf_open, temp_dir):
     assert report_date == "2025-10-15"
 
 
+@mock.patch("arrestx.web.PYMUPDF_AVAILABLE", False)
 @mock.patch("arrestx.web.pdf_open")
 def test_extract_report_date_not_found(mock_pdf_open, temp_dir):
     """Test extracting report date when not found in PDF."""
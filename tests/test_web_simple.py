@@ -92,6 +92,7 @@ def test_backup_file_existing_backup(temp_dir, sample_pdf):
         assert f.read() == b"Existing backup content"
 
 
+@mock.patch("arrestx.web.PYMUPDF_AVAILABLE", False)
 @mock.patch("arrestx.web.pdf_open")
 def test_extract_report_date(mock_pdf_open, temp_dir):
     """Test extracting report date from a PDF."""
@@ -109,6 +110,7 @@ def test_extract_report_date(mock_pdf_open, temp_dir):
     assert report_date == "2025-10-15"
 
 
+@mock.patch("arrestx.web.PYMUPDF_AVAILABLE", False)
 @mock.patch("arrestx.web.pdf_open")
 def test_extract_report_date_alternative_format(mock_pdf_open, temp_dir):
     """Test extracting report date from a PDF with alternative format."""
@@ -126,6 +128,7 @@ def test_extract_report_date_alternative_format(mock_pdf_open, temp_dir):
     assert report_date == "2025-10-15"
 
 
+@mock.patch("arrestx.web.PYMUPDF_AVAILABLE", False)
 @mock.patch("arrestx.web.pdf_open")
 def test_extract_report_date_not_found(mock_pdf_open, temp_dir):
     """Test extracting report date when not found in PDF."""
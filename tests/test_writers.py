@@ -6,14 +6,18 @@ import json
 import os
 import tempfile
 from typing import Dict, List
+from unittest.mock import patch
 
 import pytest
 
+from arrestx.config import Config, OutputConfig
 from arrestx.model import Charge, Record
 from arrestx.writers import (
+    _dumps,
     write_json,
     write_csv,
     write_ndjson,
+    write_outputs,
     validate_records,
     redact_records,
 )
@@ -71,6 +75,23 @@ def test_write_json():
             os.unlink(tmp_path)
 
 
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_dumps(orjson_available):
+    """Test JSON serialization with and without orjson."""
+    record = create_test_record("MUÑOZ, JOSÉ")
+    
+    with patch("arrestx.writers.ORJSON_AVAILABLE", orjson_available):
+        compact = _dumps(record)
+        pretty = _dumps(record, pretty=True)
+    
+    assert isinstance(compact, bytes)
+    assert b"\n" not in compact
+    assert "MUÑOZ, JOSÉ".encode("utf-8") in compact
+    assert json.loads(compact) == record
+    assert pretty.startswith(b'{\n  "name"')
+    assert json.loads(pretty) == record
+
+
 def test_write_csv():
     """Test writing records to CSV."""
     records = [create_test_record()]
@@ -220,4 +241,53 @@ def test_redact_records():
     redacted = redact_records([record], redact_address=True, hash_id=True)
     assert redacted[0]["address"] == ["[REDACTED]"]
     assert redacted[0]["identifier"] != "12345678"
-    assert len(redacted[0]["identifier"]) == 64
\ No newline at end of file
+    assert len(redacted[0]["identifier"]) == 64
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+@pytest.mark.parametrize("pretty", [True, False])
+def test_write_json_matches_dumps(tmp_path, orjson_available, pretty):
+    """Test that streamed JSON output matches serializing the whole list."""
+    records = [create_test_record(), create_test_record("JOHNSON, MARY")]
+    
+    for data in (records, records[:1], []):
+        path = tmp_path / "out.json"
+        with patch("arrestx.writers.ORJSON_AVAILABLE", orjson_available):
+            write_json(iter(data), str(path), pretty=pretty)
+            expected = _dumps(data, pretty)
+        assert path.read_bytes() == expected
+
+
+def test_write_outputs_single_pass(tmp_path):
+    """Test writing a generator of records to every configured output."""
+    cfg = Config(output=OutputConfig(
+        json_path=str(tmp_path / "out.json"),
+        csv_path=str(tmp_path / "out.csv"),
+        ndjson_path=str(tmp_path / "out.ndjson"),
+    ))
+    records = [create_test_record(), create_test_record("JOHNSON, MARY")]
+    
+    count = write_outputs((record for record in records), cfg)
+    
+    assert count == 2
+    assert json.loads((tmp_path / "out.json").read_text()) == records
+    assert len((tmp_path / "out.csv").read_text().splitlines()) == 3
+    assert [json.loads(line) for line in (tmp_path / "out.ndjson").read_text().splitlines()] == records
+
+
+def test_write_outputs_error_keeps_existing_files(tmp_path):
+    """Test that an error while producing records leaves existing outputs untouched."""
+    cfg = Config(output=OutputConfig(
+        json_path=str(tmp_path / "out.json"),
+        csv_path=str(tmp_path / "out.csv"),
+    ))
+    (tmp_path / "out.json").write_text("previous")
+    
+    def records():
+        yield create_test_record()
+        raise RuntimeError("parse error")
+    
+    with pytest.raises(RuntimeError):
+        write_outputs(records(), cfg)
+    
+    assert (tmp_path / "out.json").read_text() == "previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.json"]